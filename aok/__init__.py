@@ -1,20 +1,29 @@
 """Complex dictionary comparisons to simplify testing."""
-import pathlib as _pathlib
-from importlib import metadata as _metadata
-
-import toml as _toml
+import typing as _typing
 
+from aok._codegen import codegen  # noqa: F401
+from aok._json import set_decoder as set_json_decoder  # noqa: F401
+from aok._loading import SafeLoader  # noqa: F401
+from aok._loading import load  # noqa: F401
+from aok._loading import load_cached  # noqa: F401
+from aok._operations import compile_comparator  # noqa: F401
 from aok._operations import to_comparator  # noqa
+from aok._profiling import ProfileStats  # noqa: F401
+from aok._profiling import profile  # noqa: F401
+from aok._records import RecordComparisons  # noqa: F401
 from aok._types import ArbitraryDict  # noqa: F401
 from aok._types import ArbitraryList  # noqa: F401
 from aok._types import OkayRoot  # noqa: F401
 from aok.comparisons import *  # noqa
+from aok.comparisons import Aligned  # noqa: F401
 from aok.comparisons import Anything  # noqa: F401
 from aok.comparisons import Between  # noqa: F401
 from aok.comparisons import Dict  # noqa: F401
+from aok.comparisons import Each  # noqa: F401
 from aok.comparisons import Equals  # noqa: F401
 from aok.comparisons import Greater  # noqa: F401
 from aok.comparisons import GreaterOrEqual  # noqa: F401
+from aok.comparisons import JsonDict  # noqa: F401
 from aok.comparisons import JsonList  # noqa: F401
 from aok.comparisons import Less  # noqa: F401
 from aok.comparisons import LessOrEqual  # noqa: F401
@@ -31,11 +40,15 @@ from aok.comparisons import Optional  # noqa: F401
 from aok.comparisons import StrictList  # noqa: F401
 from aok.comparisons import Tuple  # noqa: F401
 from aok.comparisons import Unequals  # noqa: F401
+from aok.comparisons import Unordered  # noqa: F401
+from aok.comparisons import aligned  # noqa: F401
 from aok.comparisons import anything  # noqa: F401
 from aok.comparisons import between  # noqa: F401
+from aok.comparisons import each  # noqa: F401
 from aok.comparisons import equals  # noqa: F401
 from aok.comparisons import greater  # noqa: F401
 from aok.comparisons import greater_or_equal  # noqa: F401
+from aok.comparisons import json_dict  # noqa: F401
 from aok.comparisons import json_list  # noqa: F401
 from aok.comparisons import less  # noqa: F401
 from aok.comparisons import less_or_equal  # noqa: F401
@@ -47,12 +60,26 @@ from aok.comparisons import not_null  # noqa: F401
 from aok.comparisons import one_of  # noqa: F401
 from aok.comparisons import optional  # noqa: F401
 from aok.comparisons import unequals  # noqa: F401
+from aok.comparisons import unordered  # noqa: F401
+
+
+def __getattr__(name: str) -> _typing.Any:
+    """
+    Resolve the version and the parallel module lazily on first access.
+
+    Neither is needed to compare values, and the distribution metadata lookup and
+    the multiprocessing machinery dominated the import time of the package.
+    """
+    if name == "__version__":
+        from aok import _version
+
+        value: _typing.Any = _version.get_version()
+    elif name == "parallel":
+        import importlib
+
+        value = importlib.import_module("aok.parallel")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-try:
-    __version__ = _metadata.version(__package__)
-except _metadata.PackageNotFoundError:  # pragma: no-cover
-    # If the package is not installed such that it has distribution metadata
-    # fallback to loading the version from the pyproject.toml file.
-    __version__ = _toml.loads(
-        _pathlib.Path(__file__).parent.parent.joinpath("pyproject.toml").read_text()
-    )["tool"]["poetry"]["version"]
+    globals()[name] = value
+    return value
@@ -0,0 +1,8 @@
+"""Command line interface entrypoint for the aok library."""
+
+import sys
+
+from aok import _cli
+
+if __name__ == "__main__":
+    sys.exit(_cli.main())
@@ -0,0 +1,125 @@
+import typing
+
+#: Operations of the edit script that aligns the expected and observed elements.
+EQUAL = "equal"
+DELETE = "delete"
+INSERT = "insert"
+
+Edit = typing.Tuple[str, int, int]
+
+
+def _trace(
+    expected: typing.Sequence[int],
+    observed: typing.Sequence[int],
+    equal: typing.Callable[[int, int], bool],
+    max_edits: int,
+) -> typing.Optional[typing.List[typing.Dict[int, int]]]:
+    """
+    Find the furthest reaching paths for each number of edits, Myers style.
+
+    :return:
+        The furthest point on each diagonal before each number of edits, where
+        the last entry reaches the end, or None when more edits are needed.
+    """
+    n = len(expected)
+    m = len(observed)
+    furthest = {1: 0}
+    trace = []
+    for d in range(min(max_edits, n + m) + 1):
+        trace.append(dict(furthest))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and furthest[k - 1] < furthest[k + 1]):
+                x = furthest[k + 1]
+            else:
+                x = furthest[k - 1] + 1
+
+            y = x - k
+            while x < n and y < m and equal(expected[x], observed[y]):
+                x += 1
+                y += 1
+
+            furthest[k] = x
+            if x >= n and y >= m:
+                return trace
+    return None
+
+
+def align(
+    expected_count: int,
+    observed_count: int,
+    equal: typing.Callable[[int, int], bool],
+    max_edits: int = 1000,
+) -> typing.Optional[typing.List[Edit]]:
+    """
+    Align the expected and observed elements with the fewest edits.
+
+    This is the O(ND) difference algorithm of Myers, where N is the total number
+    of elements and D the number of edits, so it is near-linear for long lists
+    that are mostly equal. The common leading and trailing elements are skipped
+    before the search.
+
+    :param expected_count:
+        Number of expected elements.
+    :param observed_count:
+        Number of observed elements.
+    :param equal:
+        Whether the expected element at the first index matches the observed
+        element at the second one.
+    :param max_edits:
+        Maximum number of edits to search for before giving up, which bounds the
+        time and memory spent on inputs that differ too much to align.
+    :return:
+        The edit script as (operation, expected index, observed index) tuples in
+        order, where deletions are expected elements that are missing and
+        insertions observed ones that are extra, or None when the elements could
+        not be aligned within the maximum number of edits.
+    """
+    start = 0
+    while start < expected_count and start < observed_count and equal(start, start):
+        start += 1
+
+    end = 0
+    while (
+        end < expected_count - start
+        and end < observed_count - start
+        and equal(expected_count - end - 1, observed_count - end - 1)
+    ):
+        end += 1
+
+    expected = range(start, expected_count - end)
+    observed = range(start, observed_count - end)
+    trace = _trace(expected, observed, equal, max_edits)
+    if trace is None:
+        return None
+
+    edits: typing.List[Edit] = []
+    x, y = len(expected), len(observed)
+    for d in range(len(trace) - 1, -1, -1):
+        furthest = trace[d]
+        k = x - y
+        if k == -d or (k != d and furthest[k - 1] < furthest[k + 1]):
+            previous_k = k + 1
+        else:
+            previous_k = k - 1
+        previous_x = furthest[previous_k]
+        previous_y = previous_x - previous_k
+
+        while x > previous_x and y > previous_y:
+            x -= 1
+            y -= 1
+            edits.append((EQUAL, expected[x], observed[y]))
+
+        if d > 0 and x == previous_x:
+            edits.append((INSERT, expected.start + x, observed[previous_y]))
+        elif d > 0:
+            edits.append((DELETE, expected[previous_x], observed.start + y))
+        x, y = previous_x, previous_y
+
+    return (
+        [(EQUAL, i, i) for i in range(start)]
+        + edits[::-1]
+        + [
+            (EQUAL, expected_count - end + i, observed_count - end + i)
+            for i in range(end)
+        ]
+    )
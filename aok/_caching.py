@@ -0,0 +1,115 @@
+import contextlib
+import hashlib
+import io
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+import time
+import typing
+
+import aok
+from aok import _definitions
+from aok import _loading
+
+
+def _cache_directory(
+    directory: typing.Optional["_loading.Source"] = None,
+) -> pathlib.Path:
+    """Determine the directory in which to store the cached expectation files."""
+    if directory is not None:
+        return pathlib.Path(typing.cast(str, directory))
+
+    if os.environ.get("AOK_CACHE_DIR"):
+        return pathlib.Path(os.environ["AOK_CACHE_DIR"])
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(cache_home).joinpath("aok")
+
+
+def _cache_key(contents: bytes, safe: bool) -> str:
+    """Create the cache key of the file contents for the current environment."""
+    digest = hashlib.sha256(contents)
+    environment = f"{aok.__version__}:{sys.version_info[:2]}:{safe}"
+    digest.update(environment.encode())
+    return digest.hexdigest()
+
+
+def _compile_roots(data: typing.Any) -> typing.Any:
+    """Compile the comparators at the root, or top-level values, of the data."""
+    if isinstance(data, _definitions.Comparator):
+        return data.compile()
+
+    if isinstance(data, dict):
+        return {
+            key: (
+                value.compile() if isinstance(value, _definitions.Comparator) else value
+            )
+            for key, value in data.items()
+        }
+
+    return data
+
+
+def _store(cache_path: pathlib.Path, data: typing.Any):
+    """Pickle the data into the cache path by replacing it atomically."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=cache_path.parent, suffix=".tmp", delete=False
+    ) as stream:
+        try:
+            pickle.dump(data, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            stream.close()
+            os.unlink(stream.name)
+            raise
+    os.replace(stream.name, cache_path)
+
+
+def _evict(directory: pathlib.Path, max_age: float, max_size: int):
+    """Remove cached entries that are too old or exceed the cache size."""
+    now = time.time()
+    entries = []
+    for path in directory.glob("*.pickle"):
+        with contextlib.suppress(OSError):
+            stat = path.stat()
+            if now - stat.st_mtime > max_age:
+                path.unlink()
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        with contextlib.suppress(OSError):
+            path.unlink()
+        total -= size
+
+
+def load_cached(
+    path: typing.Union[str, "os.PathLike[str]"],
+    safe: bool,
+    directory: typing.Optional["_loading.Source"],
+    max_age: float,
+    max_size: int,
+) -> typing.Any:
+    """Load the YAML file using the cache, as documented by `aok.load_cached`."""
+    contents = pathlib.Path(path).read_bytes()
+    cache_directory = _cache_directory(directory)
+    cache_path = cache_directory.joinpath(f"{_cache_key(contents, safe)}.pickle")
+
+    with contextlib.suppress(Exception):
+        with open(cache_path, "rb") as stream:
+            data = pickle.load(stream)
+        with contextlib.suppress(OSError):
+            os.utime(cache_path)
+        return data
+
+    data = _compile_roots(_loading.load(io.BytesIO(contents), safe=safe))
+    with contextlib.suppress(Exception):
+        _store(cache_path, data)
+        _evict(cache_directory, max_age, max_size)
+
+    return data
@@ -0,0 +1,260 @@
+import argparse
+import json
+import pathlib
+import re
+import sys
+import typing
+
+import yaml
+
+from aok import _definitions
+from aok import _json_stream
+from aok import _loading
+
+FORMATS = ("auto", "json", "json-array", "jsonl", "yaml")
+
+_EXTENSION_FORMATS = {
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+
+_CHUNK_SIZE = 1 << 16
+_WHITESPACE = re.compile(r"\s*")
+
+#: Length of the longest JSON token that is not a string, "-Infinity", which may
+#: have been cut short by the end of the data read so far.
+_LOOKAHEAD = 9
+
+
+class InputError(ValueError):
+    """Error raised when the observed input cannot be parsed."""
+
+
+def _iter_jsonl(stream: typing.TextIO) -> typing.Iterator[typing.Any]:
+    """Parse each non-empty line of the stream as a JSON record."""
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as error:
+            raise InputError(f"line {number}: {error}") from error
+
+
+def _decoding_error(error: json.JSONDecodeError, offset: int) -> InputError:
+    """Create the input error for the decoding error at the offset of its buffer."""
+    return InputError(f"{error.msg}: char {offset + error.pos}")
+
+
+def _truncated(error: json.JSONDecodeError, buffer: str) -> bool:
+    """Determine whether the decoding error may be due to the end of the buffer."""
+    return "Unterminated" in error.msg or error.pos >= len(buffer) - _LOOKAHEAD
+
+
+def _iter_json(stream: typing.TextIO) -> typing.Iterator[typing.Any]:
+    """Parse the stream as a sequence of whitespace-separated JSON records."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    offset = 0
+    exhausted = False
+    while True:
+        whitespace = _WHITESPACE.match(buffer, position)
+        position = typing.cast(typing.Match[str], whitespace).end()
+
+        if position == len(buffer):
+            if exhausted:
+                return
+            offset += len(buffer)
+            buffer = stream.read(_CHUNK_SIZE)
+            position = 0
+            exhausted = not buffer
+            continue
+
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as error:
+            if exhausted or not _truncated(error, buffer):
+                raise _decoding_error(error, offset) from error
+            end = None
+
+        if end is None or (end == len(buffer) and not exhausted):
+            # The record may continue beyond the data read so far, e.g. for a
+            # number split across reads, so more data is read before parsing.
+            # At least as much as is buffered is read, so that the data of a
+            # record spanning many reads is only parsed and copied a few times.
+            chunk = stream.read(max(_CHUNK_SIZE, len(buffer) - position))
+            offset += position
+            buffer = buffer[position:] + chunk
+            position = 0
+            exhausted = not chunk
+            continue
+
+        yield value
+        position = end
+
+
+def _iter_json_array(stream: typing.TextIO) -> typing.Iterator[typing.Any]:
+    """Parse each element of the JSON array within the stream as a record."""
+    try:
+        yield from _json_stream.iter_json_array(stream, _CHUNK_SIZE)
+    except ValueError as error:
+        raise InputError(str(error)) from error
+
+
+def _iter_yaml(stream: typing.TextIO) -> typing.Iterator[typing.Any]:
+    """Parse each document within the YAML stream as a record."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        yield from yaml.load_all(stream, Loader=loader)
+    except yaml.YAMLError as error:
+        raise InputError(str(error)) from error
+
+
+_READERS: typing.Dict[str, typing.Callable[[typing.TextIO], typing.Iterator]] = {
+    "json": _iter_json,
+    "json-array": _iter_json_array,
+    "jsonl": _iter_jsonl,
+    "yaml": _iter_yaml,
+}
+
+
+def _to_format(source: str, input_format: str) -> str:
+    """Determine the format of the source when it should be detected."""
+    if input_format != "auto":
+        return input_format
+    if source == "-":
+        return "jsonl"
+    return _EXTENSION_FORMATS.get(pathlib.Path(source).suffix.lower(), "jsonl")
+
+
+def _describe(comparison: "_definitions.Comparison") -> str:
+    """Summarize the failures of the comparison on a single line."""
+    keys = comparison.failed_keys()
+    if keys:
+        return ", ".join(sorted(keys))
+    return f"<root> {comparison.operation}"
+
+
+def load_expectation(path: str) -> "_definitions.Comparator":
+    """Load the root aok expectation object from the YAML file."""
+    expected = _loading.load(path)
+
+    if not hasattr(expected, "compare_many"):
+        raise InputError(
+            f'The expectation file "{path}" must have an !aok or !aok_list root.'
+        )
+    return typing.cast(_definitions.Comparator, expected).compile()
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    """Create the command line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="aok",
+        description="Complex dictionary comparisons to simplify testing.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser(
+        "validate",
+        help="Validate observed records against an expectation file.",
+        description=(
+            "Validate each observed record against the !aok or !aok_list root of"
+            " an expectation file, writing one line for each failing record and"
+            " a summary of the results."
+        ),
+    )
+    validate.add_argument("expectation", help="YAML file with the expectations.")
+    validate.add_argument(
+        "inputs",
+        nargs="*",
+        default=["-"],
+        help="Files containing the observed records, or - for stdin (default).",
+    )
+    validate.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="auto",
+        help=(
+            "Format of the inputs, which is detected from the file extensions by"
+            " default. The json format is a sequence of JSON documents,"
+            " json-array is a JSON array with each element as a document, jsonl"
+            " is one JSON document per line and yaml is a multi-document stream."
+        ),
+    )
+    validate.add_argument(
+        "--subset",
+        action="store_true",
+        help="Ignore extra keys/values found in the observed dictionaries.",
+    )
+    validate.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only write the summary and not the failing records.",
+    )
+    return parser
+
+
+def _validate(
+    expected: "_definitions.Comparator",
+    source: str,
+    input_format: str,
+    subset: bool,
+    quiet: bool,
+) -> typing.Tuple[int, int]:
+    """Validate the records of the source, returning the passed/failed counts."""
+    reader = _READERS[_to_format(source, input_format)]
+    if source == "-":
+        stream = sys.stdin
+    else:
+        stream = open(source, encoding="utf-8")
+
+    try:
+        results = getattr(expected, "compare_many")(reader(stream), subset=subset)
+        for index, comparison in results:
+            if not quiet:
+                print(f"{source}:{index}: {_describe(comparison)}")
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return results.passed, results.failed
+
+
+def main(arguments: typing.Optional[typing.List[str]] = None) -> int:
+    """
+    Run the aok command line interface.
+
+    :param arguments:
+        Command line arguments, which default to those of the process.
+    :return:
+        The exit code, which is 1 if any records failed validation and 2 if the
+        expectation file or inputs could not be read.
+    """
+    args = _create_parser().parse_args(arguments)
+
+    passed = 0
+    failed = 0
+    try:
+        expected = load_expectation(args.expectation)
+        for source in args.inputs:
+            source_passed, source_failed = _validate(
+                expected=expected,
+                source=source,
+                input_format=args.format,
+                subset=args.subset,
+                quiet=args.quiet,
+            )
+            passed += source_passed
+            failed += source_failed
+    except (InputError, OSError, yaml.YAMLError) as error:
+        print(f"aok: error: {error}", file=sys.stderr)
+        return 2
+
+    print(
+        f"{passed} passed, {failed} failed of {passed + failed} records",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
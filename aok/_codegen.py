@@ -0,0 +1,284 @@
+import itertools
+import linecache
+import os
+import typing
+
+import aok
+from aok import _definitions
+from aok import _json
+from aok import _operations
+from aok import comparisons
+
+Validator = typing.Callable[[typing.Any], bool]
+Emitter = typing.Callable[["_Writer", typing.Any, str], None]
+
+#: Types of the values whose repr is a Python literal evaluating to an equal value.
+_REPR_TYPES: typing.Tuple[type, ...] = (str, int, bool, type(None))
+
+_sources = itertools.count()
+
+
+class _Writer:
+    """Accumulates the source lines and namespace of a generated validator."""
+
+    def __init__(self, subset: bool):
+        """Create an empty validator for the subset mode."""
+        self.subset = subset
+        self.lines: typing.List[str] = []
+        self.namespace: typing.Dict[str, typing.Any] = {
+            "_cast": _operations.cast_compatible,
+            "_loads": _json.loads,
+            "_normcase": os.path.normcase,
+        }
+        self._names = itertools.count()
+
+    def variable(self) -> str:
+        """Create the name of a new local variable."""
+        return f"v{next(self._names)}"
+
+    def bind(self, value: typing.Any, prefix: str = "k") -> str:
+        """Bind the value to a new global name of the generated function."""
+        name = f"{prefix}{next(self._names)}"
+        self.namespace[name] = value
+        return name
+
+    def constant(self, value: typing.Any) -> str:
+        """Create an expression for the value, inlined as a literal if possible."""
+        if type(value) in _REPR_TYPES:
+            return repr(value)
+        return self.bind(value)
+
+    def casted(self, value: typing.Any, observed: str) -> str:
+        """
+        Create an expression for the expected value cast to the observed type.
+
+        Expected values are only ever cast when they are strings, which are left
+        unchanged for string observed values, so the cast is usually inlined away.
+        """
+        expected = self.constant(value)
+        if type(value) in _operations.LITERAL_TYPES and not isinstance(value, str):
+            return expected
+
+        cast = f"_cast({expected}, {observed})"
+        if isinstance(value, str):
+            return f"({expected} if type({observed}) is str else {cast})"
+        return cast
+
+    def emit(self, line: str):
+        """Add the line to the body of the generated function."""
+        self.lines.append(line)
+
+    def require(self, condition: str):
+        """Add a check of the condition that fails the validation if false."""
+        self.lines.append(f"if not ({condition}): return False")
+
+
+def _emit(writer: _Writer, comparator: "_definitions.Comparator", observed: str):
+    """Emit the check of the observed variable against the compiled comparator."""
+    emitter = _EMITTERS.get(type(comparator))
+    if emitter is None:
+        name = writer.bind(comparator, "c")
+        writer.require(f"{name}.check({observed}, {writer.subset!r})")
+    else:
+        emitter(writer, comparator, observed)
+
+
+def _operator(symbol: str) -> Emitter:
+    """Create an emitter comparing the cast expected value with the operator."""
+
+    def _emit_operator(writer: _Writer, comparator: typing.Any, observed: str):
+        expected = writer.casted(comparator.value, observed)
+        writer.require(f"{expected} {symbol} {observed}")
+
+    return _emit_operator
+
+
+def _emit_between(writer: _Writer, comparator: typing.Any, observed: str):
+    minimum = writer.casted(comparator.value["min"], observed)
+    maximum = writer.casted(comparator.value["max"], observed)
+    writer.require(f"{minimum} <= {observed} <= {maximum}")
+
+
+def _emit_anything(writer: _Writer, comparator: typing.Any, observed: str):
+    pass
+
+
+def _emit_not_null(writer: _Writer, comparator: typing.Any, observed: str):
+    writer.require(f"{observed} is not None")
+
+
+def _emit_optional(writer: _Writer, comparator: typing.Any, observed: str):
+    expected = writer.constant(comparator.value)
+    writer.require(f"{observed} is None or {observed} == {expected}")
+
+
+def _emit_like(writer: _Writer, comparator: typing.Any, observed: str):
+    pattern = writer.bind(comparator.pattern, "p")
+    writer.require(f"{pattern}.match(_normcase({observed})) is not None")
+
+
+def _emit_pattern(writer: _Writer, comparator: typing.Any, observed: str):
+    pattern = writer.bind(comparator.pattern, "p")
+    writer.require(f"{pattern}.match({observed}) is not None")
+
+
+def _emit_mapping(writer: _Writer, comparator: typing.Any, observed: str):
+    """Emit the checks of the dictionary variable against the dictionary plan."""
+    for key, child in comparator._plan:
+        value = writer.variable()
+        writer.emit(f"{value} = {observed}.get({writer.constant(key)})")
+        _emit(writer, child, value)
+
+    if writer.subset:
+        return
+
+    # Unexpected keys are compared against None like in the comparators, which
+    # is only needed when there are observed keys that aren't expected.
+    expected = writer.bind(comparator.value or {}, "e")
+    writer.emit(f"if not {observed}.keys() <= {expected}.keys():")
+    writer.emit(f"    for key, value in {observed}.items():")
+    writer.emit(f"        if key not in {expected} and not (None == value):")
+    writer.emit("            return False")
+
+
+def _emit_dict(writer: _Writer, comparator: typing.Any, observed: str):
+    value = writer.variable()
+    writer.emit(f"{value} = {observed} or {{}}")
+    writer.require(f"isinstance({value}, dict)")
+    _emit_mapping(writer, comparator, value)
+
+
+def _emit_json_dict(writer: _Writer, comparator: typing.Any, observed: str):
+    value = writer.variable()
+    writer.emit(f"{value} = _loads({observed} or '{{}}')")
+    writer.require(f"isinstance({value}, dict)")
+    _emit_mapping(writer, comparator, value)
+
+
+def _emit_items(writer: _Writer, comparator: typing.Any, observed: str):
+    """Emit the checks of the sequence variable against the list plan."""
+    writer.require(f"len({observed}) == {len(comparator._plan)}")
+    for index, child in enumerate(comparator._plan):
+        value = writer.variable()
+        writer.emit(f"{value} = {observed}[{index}]")
+        _emit(writer, child, value)
+
+
+def _sequence(allowed_types: str) -> Emitter:
+    """Create an emitter for lists that allow the specified observed types."""
+
+    def _emit_sequence(writer: _Writer, comparator: typing.Any, observed: str):
+        value = writer.variable()
+        writer.emit(f"{value} = {observed} or []")
+        writer.require(f"isinstance({value}, {allowed_types})")
+        _emit_items(writer, comparator, value)
+
+    return _emit_sequence
+
+
+def _emit_json_list(writer: _Writer, comparator: typing.Any, observed: str):
+    value = writer.variable()
+    writer.emit(f"{value} = _loads({observed} or '{{}}')")
+    writer.require(f"isinstance({value}, list)")
+    _emit_items(writer, comparator, value)
+
+
+def _emit_tuple(writer: _Writer, comparator: typing.Any, observed: str):
+    value = writer.variable()
+    writer.emit(f"{value} = {observed} or ()")
+    _emit_items(writer, comparator, value)
+
+
+#: Emitters of the comparators that are inlined into the generated validators by
+#: their exact type, since subclasses may override how they compare.
+_EMITTERS: typing.Dict[type, Emitter] = {
+    comparisons.Equals: _operator("=="),
+    comparisons.Unequals: _operator("!="),
+    comparisons.Less: _operator(">"),
+    comparisons.LessOrEqual: _operator(">="),
+    comparisons.Greater: _operator("<"),
+    comparisons.GreaterOrEqual: _operator("<="),
+    comparisons.Between: _emit_between,
+    comparisons.Anything: _emit_anything,
+    comparisons.NotNull: _emit_not_null,
+    comparisons.Optional: _emit_optional,
+    comparisons.Like: _emit_like,
+    comparisons.LikeCase: _emit_pattern,
+    comparisons.Match: _emit_pattern,
+    comparisons.Dict: _emit_dict,
+    comparisons.Okay: _emit_dict,
+    comparisons.JsonDict: _emit_json_dict,
+    comparisons.List: _sequence("(list, tuple)"),
+    comparisons.OkayList: _sequence("(list, tuple)"),
+    comparisons.StrictList: _sequence("list"),
+    comparisons.JsonList: _emit_json_list,
+    comparisons.Tuple: _emit_tuple,
+}
+
+
+def generate(
+    expected: typing.Any,
+    subset: bool = False,
+) -> typing.Tuple[str, typing.Dict[str, typing.Any]]:
+    """
+    Generate the source of a validator function for the expected values.
+
+    :return:
+        The source code defining the `validate` function and the namespace of
+        the values it refers to, in which the source must be executed.
+    """
+    writer = _Writer(subset)
+    _emit(writer, aok.compile_comparator(expected), "observed")
+    body = "\n".join(f"        {line}" for line in writer.lines)
+    source = (
+        "def validate(observed):\n"
+        "    try:\n"
+        f"{body or '        pass'}\n"
+        "    except Exception:\n"
+        "        return False\n"
+        "    return True\n"
+    )
+    return source, writer.namespace
+
+
+def codegen(expected: typing.Any, subset: bool = False) -> Validator:
+    """
+    Generate a specialized validator function for the expected values.
+
+    The expectation is turned into the Python source of a single function with
+    the dictionary lookups, type checks and built-in comparisons inlined, while
+    any other comparators are called through their `check` method. The function
+    returns the same result as `check` on the expectation, except that errors
+    raised by the observed values fail the validation instead of being raised,
+    and it is cached on the expectation for each subset mode. The generated
+    source can be displayed with `inspect.getsource`.
+
+    :param expected:
+        Okay, OkayList or other expectation to generate the validator for.
+    :param subset:
+        When true, any extra keys/values found in dictionaries will be ignored
+        and assumed to be insignificant. Set to false for exact matching.
+    :return:
+        Function that determines whether an observed value passes the expected
+        values, which should be compared afterwards to find the differences.
+    """
+    validators: typing.Optional[typing.Dict[bool, Validator]] = None
+    if isinstance(expected, _definitions.Comparator):
+        validators = expected.__dict__.setdefault("_validators", {})
+        if subset in validators:
+            return validators[subset]
+
+    source, namespace = generate(expected, subset)
+    filename = f"<aok.codegen-{next(_sources)}>"
+    exec(compile(source, filename, "exec"), namespace)
+    linecache.cache[filename] = (
+        len(source),
+        None,
+        source.splitlines(keepends=True),
+        filename,
+    )
+
+    validator: Validator = namespace["validate"]
+    if validators is not None:
+        validators[subset] = validator
+    return validator
@@ -0,0 +1,327 @@
+import array
+import typing
+
+import aok
+from aok import _definitions
+from aok import _traversal
+
+#: Names of the operations of the compact results indexed by their codes, which
+#: are shared by all of the results so that each node only stores the code.
+_operation_names: typing.List[str] = []
+_operation_codes: typing.Dict[str, int] = {}
+
+#: First child index of the leaf nodes, which have no children.
+_LEAF = array.array("q", [-1])
+
+Failure = typing.Union[
+    "_definitions.Comparison",
+    typing.Tuple["_definitions.Comparator", typing.Any],
+]
+_Kind = typing.Tuple[typing.Any, int, int]
+
+
+def _operation_code(name: str) -> int:
+    """Fetch the code of the operation name, assigning one if it is new."""
+    code = _operation_codes.get(name)
+    if code is None:
+        code = _operation_codes[name] = len(_operation_names)
+        _operation_names.append(name)
+    return code
+
+
+def _resolve(kinds: typing.Dict[type, _Kind], comparator: typing.Any) -> _Kind:
+    """
+    Resolve how the type of the comparator is compared into compact results.
+
+    This is the unbound method expanding the comparator into its children, or
+    None for comparators that are leaves, and the codes of the operations of
+    the comparator as a leaf and as a container. Like in the traversal, only
+    the containers with compare methods carried out by it are expanded, while
+    those overriding them are leaves compared by calling their methods.
+    """
+    name = comparator.operation_name()
+    container = getattr(comparator, "_container_operation", None) or name
+    traversable = _traversal.is_traversed(type(comparator), "compare")
+    kind = kinds[type(comparator)] = (
+        getattr(type(comparator), "_children", None) if traversable else None,
+        _operation_code(name),
+        _operation_code(container),
+    )
+    return kind
+
+
+class CompactResults:
+    """
+    Flat storage of the results of a comparison, indexed by the node number.
+
+    Nodes are numbered as they are found, with the children of each container
+    stored contiguously, so that a node is identified by its index and its path
+    by the keys of the nodes leading to it. Only the key, operation code and
+    success of each node is stored, along with what is needed to materialize the
+    comparisons of the failing leaves when they are accessed.
+    """
+
+    __slots__ = (
+        "subset",
+        "keys",
+        "operations",
+        "successes",
+        "first",
+        "counts",
+        "failures",
+    )
+
+    def __init__(self, subset: bool):
+        """Create empty results of a comparison in the subset mode."""
+        self.subset = subset
+        self.keys: typing.List[typing.Any] = []
+        self.operations = array.array("I")
+        self.successes = bytearray()
+        self.first = array.array("q")
+        self.counts = array.array("q")
+        self.failures: typing.Dict[int, Failure] = {}
+
+    def __len__(self) -> int:
+        """Count the nodes of the results."""
+        return len(self.keys)
+
+    @classmethod
+    def collect(
+        cls,
+        comparator: "_definitions.Comparator",
+        observed: typing.Any,
+        subset: bool = False,
+    ) -> "CompactResults":
+        """
+        Compare the observed value against the comparator into compact results.
+
+        Containers are expanded into their children with an explicit stack, and
+        all other comparators are checked without creating comparisons. Only the
+        comparators and observed values of the failing leaves are kept to
+        compare them again when their comparisons are materialized.
+        """
+        results = cls(subset)
+        keys = results.keys
+        operations = results.operations
+        successes = results.successes
+        failures = results.failures
+
+        # How each type of comparator is compared is resolved once, which is its
+        # method expanding it into children, if any, and its operation codes.
+        kinds: typing.Dict[type, _Kind] = {}
+
+        keys.append(None)
+        operations.append(0)
+        successes.append(1)
+        results.first.append(-1)
+        results.counts.append(0)
+
+        pending = [(0, comparator, observed)]
+        while pending:
+            index, comparator, observed = pending.pop()
+            expand, leaf_code, container_code = kinds.get(type(comparator)) or _resolve(
+                kinds, comparator
+            )
+            pairs = None if expand is None else expand(comparator, observed, subset)
+
+            if pairs is None:
+                operations[index] = leaf_code
+                if not comparator.check(observed, subset):
+                    successes[index] = 0
+                    failures[index] = (comparator, observed)
+                continue
+
+            if isinstance(pairs, _definitions.Comparison):
+                operations[index] = _operation_code(pairs.operation)
+                if not pairs.success:
+                    successes[index] = 0
+                    failures[index] = pairs
+                continue
+
+            # Children that are leaves are checked right away, while containers
+            # are left on the stack to be expanded themselves.
+            operations[index] = container_code
+            first = len(keys)
+            for key, child, child_observed in pairs[2]:
+                kind = kinds.get(type(child)) or _resolve(kinds, child)
+                if kind[0] is None:
+                    operations.append(kind[1])
+                    if child.check(child_observed, subset):
+                        successes.append(1)
+                    else:
+                        successes.append(0)
+                        failures[len(keys)] = (child, child_observed)
+                else:
+                    operations.append(0)
+                    successes.append(1)
+                    pending.append((len(keys), child, child_observed))
+                keys.append(key)
+
+            count = len(keys) - first
+            results.first.extend(_LEAF * count)
+            results.counts.frombytes(bytes(results.counts.itemsize * count))
+            results.first[index] = first
+            results.counts[index] = count
+
+        # Children are always numbered after their parents, so the success of
+        # each container can be resolved from those of its children in reverse.
+        for index in range(len(successes) - 1, -1, -1):
+            first = results.first[index]
+            if first >= 0:
+                stop = first + results.counts[index]
+                successes[index] = successes.find(0, first, stop) < 0
+
+        return results
+
+    def is_leaf(self, index: int) -> bool:
+        """Determine whether the node is a leaf, which has no children stored."""
+        return self.first[index] < 0
+
+    def iter_children(self, index: int) -> typing.Iterator[int]:
+        """Iterate over the indexes of the children of the node."""
+        first = self.first[index]
+        return iter(range(first, first + self.counts[index]) if first >= 0 else ())
+
+    def iter_failing_children(self, index: int) -> typing.Iterator[int]:
+        """Iterate over the indexes of the failing children of the node."""
+        first = self.first[index]
+        if first < 0:
+            return
+
+        stop = first + self.counts[index]
+        position = self.successes.find(0, first, stop)
+        while position >= 0:
+            yield position
+            position = self.successes.find(0, position + 1, stop)
+
+    def materialize(self, index: int) -> "_definitions.Comparison":
+        """Create the comparison of the failing leaf node, once."""
+        failure = self.failures[index]
+        if isinstance(failure, _definitions.Comparison):
+            return failure
+
+        comparator, observed = failure
+        comparison = comparator.compare(observed, self.subset)
+        self.failures[index] = comparison
+        return comparison
+
+    def view(self, index: int) -> "_definitions.Comparison":
+        """
+        Fetch the comparison of the node.
+
+        Failing leaves are materialized into their comparisons, while all other
+        nodes are viewed through a compact comparison.
+        """
+        if index in self.failures:
+            return self.materialize(index)
+        return CompactComparison(self, index)
+
+
+class CompactComparison(_definitions.Comparison):
+    """
+    Comparison facade over a node of compact comparison results.
+
+    Only the results and the index of the node are held, with the children
+    viewed when they are accessed. The expected and observed values of
+    containers and passing leaves are not stored and are None.
+    """
+
+    def __init__(self, results: CompactResults, index: int):
+        """Create the view of the node of the results."""
+        super(CompactComparison, self).__init__(
+            operation=_operation_names[results.operations[index]],
+            success=bool(results.successes[index]),
+            expected=None,
+            observed=None,
+        )
+        self.results = results
+        self.index = index
+
+    @property
+    def children(self) -> typing.Dict[typing.Any, "_definitions.Comparison"]:
+        """Fetch the comparisons of the children by their keys."""
+        results = self.results
+        return {
+            results.keys[index]: results.view(index)
+            for index in results.iter_children(self.index)
+        }
+
+    @children.setter
+    def children(self, value: typing.Dict[typing.Any, "_definitions.Comparison"]):
+        """Ignore the children set when created, which are viewed instead."""
+        pass
+
+    def prune(self, retain: str = "leaves") -> "_definitions.Comparison":
+        """Leave the compact results as is, which never retain container values."""
+        if retain not in _definitions.RETAIN_OPTIONS:
+            raise ValueError(
+                f'Unknown retain option "{retain}"'
+                f" not in {_definitions.RETAIN_OPTIONS}."
+            )
+        return self
+
+    def to_diff_data(self) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Create a data structure of differences for display."""
+        if self.success:
+            return None
+
+        results = self.results
+        data: typing.Dict[typing.Any, typing.Any] = {}
+        stack = [(self.index, data)]
+        while stack:
+            index, output = stack.pop()
+            for child in results.iter_failing_children(index):
+                if results.is_leaf(child):
+                    output[results.keys[child]] = results.materialize(
+                        child
+                    ).to_diff_data()
+                else:
+                    nested = output[results.keys[child]] = {}
+                    stack.append((child, nested))
+        return data
+
+    def iter_failures(
+        self,
+        max_depth: typing.Optional[int] = None,
+    ) -> typing.Iterator[
+        typing.Tuple[typing.Tuple[typing.Any, ...], "_definitions.Comparison"]
+    ]:
+        """Iterate lazily over the failing leaf comparisons with their paths."""
+        if self.success:
+            return
+
+        results = self.results
+        stack: typing.List[typing.Tuple[int, typing.Tuple[typing.Any, ...]]] = [
+            (self.index, ())
+        ]
+        while stack:
+            index, path = stack.pop()
+            if results.is_leaf(index):
+                depth = None if max_depth is None else max(0, max_depth - len(path))
+                comparison = results.materialize(index)
+                for keys, leaf in comparison.iter_failures(depth):
+                    yield path + keys, leaf
+                continue
+
+            failing = list(results.iter_failing_children(index))
+            if not failing or (max_depth is not None and len(path) >= max_depth):
+                yield path, results.view(index)
+                continue
+
+            stack.extend((i, path + (results.keys[i],)) for i in reversed(failing))
+
+
+def compare_compact(
+    expected: typing.Any,
+    observed: typing.Any,
+    subset: bool = False,
+) -> "_definitions.Comparison":
+    """
+    Compare the observed value against the expected one into compact results.
+
+    :return:
+        The comparison of the root, which is a compact comparison facade unless
+        the root itself is a failing leaf.
+    """
+    comparator = aok.to_comparator(expected)
+    return CompactResults.collect(comparator, observed, subset).view(0)
@@ -1,24 +1,68 @@
-import pprint
+import functools
+import itertools
 import typing
 
 import yaml
 import yaml.constructor
 
+from aok import _loading
+from aok import _rendering
 from aok import _utils
 
+#: Options of the values retained in comparison results by `Comparison.prune`.
+RETAIN_OPTIONS = ("all", "leaves", "none")
+
 
 class Comparator:
     """Okay style comparison class for comparing values."""
 
+    #: Names of the attributes derived from the value that are rebuilt with the
+    #: `_derive` method when unpickled instead of being pickled themselves.
+    _derived: typing.Tuple[str, ...] = ()
+
+    #: Names of the attributes caching values generated on demand, such as the
+    #: validators of `aok.codegen`, which are neither pickled nor copied.
+    _cached: typing.Tuple[str, ...] = ("_validators",)
+
     def __init__(self, value: typing.Any):
         """Create a generic Comparator object."""
         self.value = value
+        self._derive()
+
+    def _derive(self) -> None:
+        """Build the attributes that are derived from the value."""
+        pass
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        """Fetch the state to pickle without the attributes derived from the value."""
+        return {
+            k: v
+            for k, v in self.__dict__.items()
+            if k not in self._derived and k not in self._cached
+        }
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]):
+        """Restore the pickled state and rebuild the attributes derived from it."""
+        self.__dict__.update(state)
+        self._derive()
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def operation_name(cls) -> str:
         """Fetch the name of the operation defining the comparison operator."""
         return _utils.to_snake_case(cls.__name__)
 
+    def compile(self) -> "Comparator":
+        """
+        Resolve the comparator into a plan that can be reused for many comparisons.
+
+        Comparators without nested expectations are already resolved and are
+        returned unchanged. Container comparators return a compiled copy of
+        themselves in which all nested expectations have been converted into
+        compiled comparators once, instead of on every comparison.
+        """
+        return self
+
     def _compare(
         self,
         observed: typing.Any,
@@ -62,6 +106,38 @@ class Comparator:
             observed=observed,
         )
 
+    def check(self, observed: typing.Any, subset: bool = False) -> bool:
+        """
+        Determine whether the observed value passes the comparison.
+
+        Unlike `compare`, this stops at the first difference that is found and does
+        not create any comparison objects along the way. It is meant for the common
+        case where values are expected to pass, with `compare` used afterwards to
+        find the differences for the values that do not.
+
+        :param observed:
+            Value against which to make the comparison.
+        :param subset:
+            If this is a non-scalar value, e.g. dict, this will allow for dictionary
+            subsets to be compared against what is available while accepting other
+            values not specified here to be included in the observed value.
+        :return:
+            Whether or not the observed value passes the comparison.
+        """
+        if type(self).compare is not Comparator.compare:
+            # Comparators overriding compare instead of _compare are checked by it.
+            return self.compare(observed, subset).success
+
+        try:
+            result = self._compare(observed, subset)
+        except Exception:
+            return False
+
+        if isinstance(result, Comparison):
+            return result.success
+
+        return bool(result)
+
     @classmethod
     def _from_yaml(cls, loader: yaml.Loader, node: yaml.Node) -> "Comparator":
         """Parse yaml node into object. Defaults to a scalar value."""
@@ -75,8 +151,8 @@ class Comparator:
 
     @classmethod
     def register(cls):
-        """Register the comparator with the PyYaml loader."""
-        yaml.add_constructor(f"!aok.{cls.operation_name()}", cls.parse_yaml)
+        """Register the comparator with the PyYaml loaders."""
+        _loading.add_constructor(f"!aok.{cls.operation_name()}", cls.parse_yaml)
 
 
 class Comparison:
@@ -105,11 +181,22 @@ class Comparison:
             return None
 
         if self.children:
-            return {
-                key: comparison.to_diff_data()
-                for key, comparison in self.children.items()
-                if not comparison.success
-            }
+            # Nested comparisons are walked with an explicit stack so that the
+            # depth of the differences isn't limited by recursion, while those of
+            # other types are left to create their own data.
+            data: typing.Dict[typing.Any, typing.Any] = {}
+            stack = [(self, data)]
+            while stack:
+                node, output = stack.pop()
+                for key, comparison in node.children.items():
+                    if comparison.success:
+                        continue
+                    if type(comparison) is Comparison and comparison.children:
+                        nested = output[key] = {}
+                        stack.append((comparison, nested))
+                    else:
+                        output[key] = comparison.to_diff_data()
+            return data
 
         output = {
             "OPERATION": self.operation,
@@ -130,21 +217,148 @@ class Comparison:
         try:
             return yaml.dump(difference)
         except yaml.constructor.ConstructorError:
+            import pprint
+
             return pprint.pformat(difference, indent=2)
 
+    def iter_report(
+        self,
+        max_failures: int = _rendering.MAX_FAILURES,
+        max_value_chars: int = _rendering.MAX_VALUE_CHARS,
+        max_depth: int = _rendering.MAX_DEPTH,
+    ) -> typing.Iterator[str]:
+        """
+        Iterate over the lines of a bounded report of the failures, in path order.
+
+        Unlike `to_diff_info`, the report is written as the failures are found and
+        stops once the maximum number of failures has been reported. Values are
+        truncated to the maximum number of characters and failures nested deeper
+        than the maximum depth are reported at that depth.
+        """
+        return _rendering.iter_report(self, max_failures, max_value_chars, max_depth)
+
+    def to_report(
+        self,
+        max_failures: int = _rendering.MAX_FAILURES,
+        max_value_chars: int = _rendering.MAX_VALUE_CHARS,
+        max_depth: int = _rendering.MAX_DEPTH,
+    ) -> typing.Optional[str]:
+        """Create a bounded report of the failures for display in assertions."""
+        if self.success:
+            return None
+        return _rendering.render(self, max_failures, max_value_chars, max_depth)
+
+    def iter_failures(
+        self,
+        max_depth: typing.Optional[int] = None,
+    ) -> typing.Iterator[typing.Tuple[typing.Tuple[typing.Any, ...], "Comparison"]]:
+        """
+        Iterate lazily over the failing leaf comparisons with their paths.
+
+        The failing comparisons are found in path order with an explicit stack,
+        yielding each one as soon as it is found, so only as much of the tree as
+        is needed for the failures consumed is walked.
+
+        :param max_depth:
+            Maximum depth to descend to, where the comparisons at that depth with
+            failing children are yielded as leaves instead.
+        :return:
+            Tuples of the path of keys to each failing comparison that has no
+            failing children, and the comparison itself. A failing comparison
+            without children yields an empty path for itself.
+        """
+        if self.success:
+            return
+
+        stack: typing.List[typing.Iterator[typing.Tuple[typing.Any, Comparison]]] = []
+        path: typing.List[typing.Any] = []
+        node = self
+        while True:
+            failing = ((k, c) for k, c in node.children.items() if not c.success)
+            first = next(failing, None)
+            if first is None or (max_depth is not None and len(path) >= max_depth):
+                yield tuple(path), node
+            else:
+                stack.append(itertools.chain((first,), failing))
+                path.append(None)
+
+            while stack:
+                entry = next(stack[-1], None)
+                if entry is not None:
+                    path[-1], node = entry
+                    break
+                stack.pop()
+                path.pop()
+            else:
+                return
+
+    def get(self, path: typing.Union[str, typing.Sequence[typing.Any]]) -> "Comparison":
+        """
+        Fetch the nested comparison at the specified path.
+
+        :param path:
+            Sequence of keys to the nested comparison, like those yielded by
+            `iter_failures`, or a string of keys separated by dots like those
+            returned by `failed_keys`.
+        :return:
+            The comparison at the path, which is this one for an empty path.
+        """
+        keys = (path.split(".") if path else ()) if isinstance(path, str) else path
+        node = self
+        for key in keys:
+            child = node.children.get(key)
+            if child is None and isinstance(path, str):
+                child = next(
+                    (c for k, c in node.children.items() if str(k) == key), None
+                )
+            if child is None:
+                raise KeyError(path)
+            node = child
+        return node
+
     def failed_keys(self) -> typing.Set[str]:
         """List failed absolute keys."""
-        if self.success or not self.children:
-            return set()
+        return {
+            path[0] if len(path) == 1 else ".".join(str(key) for key in path)
+            for path, leaf in self.iter_failures()
+            if path and not leaf.children
+        }
 
-        outputs = []
-        for key, child in self.children.items():
-            if child.success:
-                continue
+    def prune(self, retain: str = "leaves") -> "Comparison":
+        """
+        Release the values of the comparison tree that aren't needed for display.
 
-            if not child.children:
-                outputs.append(key)
+        The expected and observed values of containers are whole subtrees of the
+        values compared, which are dropped, such that only those of the leaves
+        are retained. The values of containers without failing children are kept
+        when they failed, since they are displayed as leaves themselves.
 
-            outputs += [f"{key}.{child_key}" for child_key in child.failed_keys()]
+        :param retain:
+            Which values to retain. One of "all" to leave the comparison as is,
+            "leaves" to only retain the values of the leaf comparisons or "none"
+            to also drop the passing children of containers, such that only the
+            failures remain.
+        :return:
+            This comparison, pruned in place.
+        """
+        if retain not in RETAIN_OPTIONS:
+            raise ValueError(
+                f'Unknown retain option "{retain}" not in {RETAIN_OPTIONS}.'
+            )
+        if retain == "all":
+            return self
+
+        stack: typing.List[Comparison] = [self]
+        while stack:
+            node = stack.pop()
+            if not node.children:
+                continue
 
-        return set(outputs)
+            failing = {k: c for k, c in node.children.items() if not c.success}
+            if node.success or failing:
+                node.expected = None
+                node.observed = None
+                if retain == "none":
+                    node.children = failing
+            stack.extend(node.children.values())
+        return self
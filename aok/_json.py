@@ -0,0 +1,118 @@
+import json
+import threading
+import typing
+
+Serialized = typing.Union[str, bytes, bytearray, memoryview]
+Decoder = typing.Callable[[Serialized], typing.Any]
+
+_cache = threading.local()
+
+
+def _standard_loads(observed: Serialized) -> typing.Any:
+    """Decode with the standard library, which doesn't accept memoryviews."""
+    if isinstance(observed, memoryview):
+        observed = observed.tobytes()
+    return json.loads(observed)
+
+
+def _default_decoder() -> Decoder:
+    """
+    Find the fastest decoder available, which is orjson when it is installed.
+
+    Documents that orjson rejects but the standard library accepts, such as those
+    containing NaN values or integers larger than 64 bits, are decoded again
+    with the standard library so the results are the same either way.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return _standard_loads
+
+    def _fast_loads(observed: Serialized) -> typing.Any:
+        try:
+            return orjson.loads(observed)
+        except orjson.JSONDecodeError:
+            return _standard_loads(observed)
+
+    return _fast_loads
+
+
+#: Configured decoder, which is resolved on the first decode so that importing
+#: aok does not import orjson until JSON values are actually compared.
+_decoder: typing.Optional[Decoder] = None
+
+
+def set_decoder(decoder: typing.Optional[Decoder] = None):
+    """
+    Set the function used to decode the JSON-serialized observed values.
+
+    The decoder is called with the str, bytes, bytearray or memoryview value and
+    must return the decoded object. Specifying None restores the default
+    decoder, which uses orjson when it is installed and the standard library
+    otherwise.
+    """
+    global _decoder
+    _decoder = decoder
+
+
+class _Sharing:
+    """Context within which decoded values are shared, as created by `sharing`."""
+
+    def __enter__(self):
+        _cache.depth = getattr(_cache, "depth", 0) + 1
+
+    def __exit__(self, *args: typing.Any):
+        _cache.depth -= 1
+        if not _cache.depth:
+            _cache.entry = None
+
+
+class _Unshared:
+    """Context for values that are never shared, which does nothing."""
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *args: typing.Any):
+        pass
+
+
+_SHARING = _Sharing()
+_UNSHARED = _Unshared()
+
+
+def sharing(observed: typing.Any) -> typing.Union[_Sharing, _Unshared]:
+    """
+    Share the decoded observed value within the context for the current thread.
+
+    Comparators looking at the same observed value one after another, like the
+    options of a one_of, compare within this context so that they only decode
+    it once. The decoded value is forgotten once the outermost context exits,
+    so that it isn't kept alive beyond the comparison.
+    """
+    return _SHARING if type(observed) in (str, bytes) else _UNSHARED
+
+
+def loads(observed: Serialized) -> typing.Any:
+    """
+    Decode the JSON-serialized value with the configured decoder.
+
+    Within the `sharing` context, the most recently decoded str or bytes object
+    is remembered for each thread and only decoded once. Mutable values are
+    always decoded since their contents may have changed.
+    """
+    global _decoder
+    decoder = _decoder
+    if decoder is None:
+        decoder = _decoder = _default_decoder()
+
+    if type(observed) not in (str, bytes) or not getattr(_cache, "depth", 0):
+        return decoder(observed)
+
+    entry = getattr(_cache, "entry", None)
+    if entry is not None and entry[0] is observed and entry[1] is decoder:
+        return entry[2]
+
+    parsed = decoder(observed)
+    _cache.entry = (observed, decoder, parsed)
+    return parsed
@@ -0,0 +1,389 @@
+import codecs
+import json
+import json.decoder
+import json.scanner
+import os
+import re
+import typing
+
+import aok
+from aok import _definitions
+from aok import _types
+from aok import comparisons
+
+_scanstring = getattr(json.decoder, "scanstring")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = json.scanner.NUMBER_RE
+_LITERALS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+    "-Infinity": float("-inf"),
+}
+_LOOKAHEAD = max(len(literal) for literal in _LITERALS)
+_VALUES = ("string", "scalar")
+_END = object()
+
+Token = typing.Tuple[str, typing.Any]
+
+
+class _Tokens:
+    """
+    Incremental JSON tokenizer that reads the stream one chunk at a time.
+
+    Tokens are tuples of their kind and value. The kind is one of the structural
+    characters, "string" or "scalar" for values, or an empty string at the end of
+    the stream. Only the data of the token being read is kept in memory.
+    """
+
+    def __init__(self, stream: typing.IO, chunk_size: int):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+        self.offset = 0
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        """Create a decoding error at the current position."""
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+    def _read(self) -> bool:
+        """Read more of the stream into the buffer, unless it has been exhausted."""
+        if self._exhausted:
+            return False
+
+        self.offset += self._position
+        remaining = self._buffer[self._position :]
+        chunk = self._stream.read(max(self._chunk_size, len(remaining)))
+        self._buffer = remaining + chunk
+        self._position = 0
+        self._exhausted = not chunk
+        return not self._exhausted
+
+    def next(self) -> Token:
+        """Read the next token from the stream."""
+        while True:
+            whitespace = _WHITESPACE.match(self._buffer, self._position)
+            self._position = typing.cast(typing.Match[str], whitespace).end()
+            if self._position < len(self._buffer):
+                break
+            if not self._read():
+                return "", None
+
+        character = self._buffer[self._position]
+        if character in "{}[]:,":
+            self._position += 1
+            return character, None
+
+        if character == '"':
+            return "string", self._string()
+
+        return "scalar", self._scalar()
+
+    def _string(self) -> str:
+        """Read the string starting at the current position."""
+        while True:
+            try:
+                value, end = _scanstring(self._buffer, self._position + 1)
+            except json.JSONDecodeError as error:
+                truncated = "Unterminated" in error.msg or (
+                    error.pos >= len(self._buffer) - 6
+                )
+                if truncated and self._read():
+                    continue
+                raise
+
+            self._position = end
+            return value
+
+    def _scalar(self) -> typing.Any:
+        """Read the number or literal starting at the current position."""
+        while len(self._buffer) - self._position < _LOOKAHEAD and self._read():
+            pass
+
+        while True:
+            match = _NUMBER.match(self._buffer, self._position)
+            if match is None:
+                break
+            if match.end() == len(self._buffer) and self._read():
+                continue
+
+            integer, fraction, exponent = match.groups()
+            self._position = match.end()
+            if fraction or exponent:
+                return float(integer + (fraction or "") + (exponent or ""))
+            return int(integer)
+
+        for literal, value in _LITERALS.items():
+            if self._buffer.startswith(literal, self._position):
+                self._position += len(literal)
+                return value
+
+        raise self._error("Expecting value")
+
+    def members(self) -> typing.Iterator[str]:
+        """
+        Iterate over the keys of the object whose opening brace has been read.
+
+        The value of each key must be read by the caller before continuing.
+        """
+        kind, value = self.next()
+        if kind == "}":
+            return
+
+        while True:
+            if kind != "string":
+                raise self._error("Expecting property name enclosed in double quotes")
+            if self.next()[0] != ":":
+                raise self._error("Expecting ':' delimiter")
+
+            yield value
+
+            kind, _ = self.next()
+            if kind == "}":
+                return
+            if kind != ",":
+                raise self._error("Expecting ',' delimiter")
+            kind, value = self.next()
+
+    def elements(self) -> typing.Iterator[Token]:
+        """
+        Iterate over the first token of each element of the array being read.
+
+        Each of the elements must be read by the caller before continuing.
+        """
+        kind, value = self.next()
+        if kind == "]":
+            return
+
+        while True:
+            if kind not in _VALUES and kind not in ("{", "["):
+                raise self._error("Expecting value")
+
+            yield kind, value
+
+            kind, _ = self.next()
+            if kind == "]":
+                return
+            if kind != ",":
+                raise self._error("Expecting ',' delimiter")
+            kind, value = self.next()
+
+    def _walk(self, token: Token, build: bool) -> typing.Any:
+        """Read the value starting with the token, building it if specified."""
+        kind, value = token
+        if kind in _VALUES:
+            return value
+        if kind not in ("{", "["):
+            raise self._error("Expecting value")
+
+        root: typing.Any = ({} if kind == "{" else []) if build else None
+        stack: typing.List[typing.Tuple[typing.Any, bool, typing.Iterator]] = [
+            (root, kind == "{", self._items(kind))
+        ]
+        while stack:
+            container, is_object, items = stack[-1]
+            item: typing.Any = next(items, _END)
+            if item is _END:
+                stack.pop()
+                continue
+
+            key, (kind, value) = (item, self.next()) if is_object else (None, item)
+            if kind in _VALUES:
+                child: typing.Any = value
+            elif kind in ("{", "["):
+                child = ({} if kind == "{" else []) if build else None
+                stack.append((child, kind == "{", self._items(kind)))
+            else:
+                raise self._error("Expecting value")
+
+            if not build:
+                continue
+            if is_object:
+                container[key] = child
+            else:
+                container.append(child)
+        return root
+
+    def _items(self, opening: str) -> typing.Iterator:
+        """Iterate over the members or elements of the opened container."""
+        return self.members() if opening == "{" else self.elements()
+
+    def build(self, token: Token) -> typing.Any:
+        """Read and materialize the value starting with the token."""
+        return self._walk(token, build=True)
+
+    def skip(self, token: Token):
+        """Read past the value starting with the token without materializing it."""
+        self._walk(token, build=False)
+
+    def end(self):
+        """Ensure that nothing but whitespace remains within the stream."""
+        if self.next()[0] != "":
+            raise self._error("Extra data")
+
+
+def _compare(
+    comparator: _definitions.Comparator,
+    tokens: _Tokens,
+    token: Token,
+    subset: bool,
+) -> _definitions.Comparison:
+    """Compare the value starting with the token against the comparator."""
+    kind = token[0]
+    if kind == "{" and isinstance(comparator, comparisons.Dict):
+        return _compare_object(comparator, tokens, subset)
+    if kind == "[" and isinstance(
+        comparator, (comparisons.List, comparisons.StrictList)
+    ):
+        return _compare_array(comparator, tokens, subset)
+    return comparator.compare(tokens.build(token), subset=subset)
+
+
+def _compare_object(
+    comparator: _definitions.Comparator,
+    tokens: _Tokens,
+    subset: bool,
+) -> _definitions.Comparison:
+    """Compare the members of the object being read against a dictionary."""
+    expected = comparator.value or {}
+    plan = dict(
+        getattr(comparator, "_plan", None)
+        or ((key, aok.to_comparator(value)) for key, value in expected.items())
+    )
+    found: typing.Dict[typing.Any, _definitions.Comparison] = {}
+    unexpected: typing.Dict[typing.Any, _definitions.Comparison] = {}
+    for key in tokens.members():
+        token = tokens.next()
+        if key in plan:
+            found[key] = _compare(plan[key], tokens, token, subset)
+        elif subset:
+            tokens.skip(token)
+        else:
+            unexpected[key] = aok.to_comparator(None).compare(
+                tokens.build(token), subset=subset
+            )
+
+    children = {
+        key: found[key] if key in found else child.compare(None, subset=subset)
+        for key, child in plan.items()
+    }
+    children.update(unexpected)
+    return _definitions.Comparison(
+        operation="dict_comparison",
+        success=all(c.success for c in children.values()),
+        expected=expected,
+        observed=None,
+        children=children,
+    )
+
+
+def _compare_array(
+    comparator: _definitions.Comparator,
+    tokens: _Tokens,
+    subset: bool,
+) -> _definitions.Comparison:
+    """Compare the elements of the array being read against a list."""
+    expected = comparator.value or []
+    plan = getattr(comparator, "_plan", None) or tuple(
+        aok.to_comparator(value) for value in expected
+    )
+    children: typing.Dict[str, _definitions.Comparison] = {}
+    count = 0
+    for token in tokens.elements():
+        if count < len(plan):
+            children[f"index_{count}"] = _compare(plan[count], tokens, token, subset)
+        else:
+            tokens.skip(token)
+        count += 1
+
+    if count != len(plan):
+        return _definitions.Comparison(
+            operation="list_length",
+            success=False,
+            expected=len(expected),
+            observed=count,
+        )
+
+    return _definitions.Comparison(
+        operation="list_comparison",
+        success=all(c.success for c in children.values()),
+        expected=expected,
+        observed=None,
+        children=children,
+    )
+
+
+def iter_json_array(
+    stream: typing.IO,
+    chunk_size: int = 1 << 16,
+) -> typing.Iterator[typing.Any]:
+    """
+    Iterate over the elements of the JSON array within the text stream.
+
+    The elements are read and built one at a time, so that the array itself is
+    never loaded as a whole. Malformed JSON, including a document that isn't an
+    array, raises a ValueError at the position of the error within the stream.
+    """
+    tokens = _Tokens(stream, chunk_size)
+    try:
+        if tokens.next()[0] != "[":
+            raise tokens._error("Expecting '['")
+        for token in tokens.elements():
+            yield tokens.build(token)
+        tokens.end()
+    except json.JSONDecodeError as error:
+        raise ValueError(f"{error.msg}: char {tokens.offset + error.pos}") from error
+
+
+def compare_json_stream(
+    expected: typing.Any,
+    source: "_types.Source",
+    subset: bool = False,
+    chunk_size: int = 1 << 16,
+) -> _definitions.Comparison:
+    """
+    Compare a JSON document against the expectation without loading all of it.
+
+    The source is a path to a JSON file or a text or binary stream. The
+    document is read incrementally alongside the expectation tree: values are
+    only built where the expectation needs them and, in subset mode, keys that
+    the expectation doesn't mention are skipped without being built at all.
+
+    Because the containers are never built, the comparisons for dictionaries and
+    lists that were streamed have an observed value of None. Malformed JSON
+    results in a failed "json_stream" comparison holding the decoding error.
+    """
+    comparator = aok.to_comparator(expected)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as stream:
+            return compare_json_stream(comparator, stream, subset, chunk_size)
+
+    text: typing.IO = source
+    if isinstance(source.read(0), bytes):
+        text = typing.cast(typing.IO, codecs.getreader("utf-8")(source))
+
+    tokens = _Tokens(text, chunk_size)
+    try:
+        result = _compare(comparator, tokens, tokens.next(), subset)
+        tokens.end()
+    except json.JSONDecodeError as error:
+        return _definitions.Comparison(
+            operation="json_stream",
+            success=False,
+            expected=comparator.value,
+            observed=None,
+            error=ValueError(f"{error.msg}: char {tokens.offset + error.pos}"),
+        )
+    except ValueError as error:
+        return _definitions.Comparison(
+            operation="json_stream",
+            success=False,
+            expected=comparator.value,
+            observed=None,
+            error=error,
+        )
+    return result
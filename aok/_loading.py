@@ -0,0 +1,142 @@
+import os
+import typing
+
+import yaml
+import yaml.constructor
+
+
+class SafeLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):  # type: ignore
+    """
+    Safe YAML loader that also constructs the aok comparators.
+
+    This uses the libyaml C parser when it is available, and otherwise the pure
+    Python one. Unlike the full loaders, it does not construct arbitrary Python
+    objects such as tuples.
+    """
+
+
+#: Loaders that the aok YAML tags are registered with, which includes the
+#: libyaml C loaders when they are available.
+LOADERS: typing.Tuple[typing.Any, ...] = tuple(
+    getattr(yaml, name)
+    for name in (
+        "Loader",
+        "FullLoader",
+        "UnsafeLoader",
+        "CLoader",
+        "CFullLoader",
+        "CUnsafeLoader",
+    )
+    if hasattr(yaml, name)
+) + (SafeLoader,)
+
+Source = typing.Union[str, "os.PathLike[str]", typing.IO]
+
+
+Constructor = typing.Callable[[typing.Any, yaml.Node], typing.Any]
+
+#: Prefix shared by all of the aok YAML tags.
+TAG_PREFIX = "!aok"
+
+#: Constructors of the aok YAML tags, which are looked up by the single
+#: multi-constructor registered with each of the loaders.
+_constructors: typing.Dict[str, Constructor] = {}
+
+
+def _construct(loader: typing.Any, suffix: str, node: yaml.Node) -> typing.Any:
+    """Construct the YAML node with the constructor registered for its tag."""
+    tag = f"{TAG_PREFIX}{suffix}"
+    try:
+        constructor = _constructors[tag]
+    except KeyError:
+        raise yaml.constructor.ConstructorError(
+            None,
+            None,
+            f"could not determine a constructor for the tag {tag!r}",
+            node.start_mark,
+        ) from None
+    return constructor(loader, node)
+
+
+def add_constructor(tag: str, constructor: Constructor):
+    """
+    Register the YAML tag constructor with each of the loaders.
+
+    The aok tags are only stored here and dispatched by one multi-constructor per
+    loader, which avoids copying the constructor tables of every loader class
+    for each of the comparators while aok is being imported.
+    """
+    if not tag.startswith(TAG_PREFIX):
+        for loader in LOADERS:
+            yaml.add_constructor(tag, constructor, Loader=loader)
+        return
+
+    if not _constructors:
+        for loader in LOADERS:
+            yaml.add_multi_constructor(TAG_PREFIX, _construct, Loader=loader)
+    _constructors[tag] = constructor
+
+
+def load(source: Source, safe: bool = False) -> typing.Any:
+    """
+    Load the YAML file or stream using the fastest loader available.
+
+    The libyaml C loaders are used when they are available, which are many times
+    faster than the pure Python ones for large expectation files.
+
+    :param source:
+        Path of the YAML file to load or an open stream to load from.
+    :param safe:
+        When true, the aok safe loader is used, which does not construct any
+        Python objects other than the aok comparators and standard YAML types.
+        Otherwise the full loader is used, which is equivalent to
+        `yaml.full_load`.
+    :return:
+        The loaded YAML data.
+    """
+    if safe:
+        loader = SafeLoader
+    else:
+        loader = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as stream:
+            return yaml.load(stream, Loader=loader)
+
+    return yaml.load(source, Loader=loader)
+
+
+def load_cached(
+    path: typing.Union[str, "os.PathLike[str]"],
+    safe: bool = False,
+    directory: typing.Optional[Source] = None,
+    max_age: float = 30 * 24 * 60 * 60,
+    max_size: int = 256 * 1024 * 1024,
+) -> typing.Any:
+    """
+    Load the YAML file using a cache of its previously loaded contents.
+
+    The loaded data is pickled into a cache directory keyed by the hash of the
+    file contents and the aok and Python versions, such that later loads of the
+    same file, including those from other processes, unpickle the data instead
+    of parsing the YAML again. Root comparators, either at the root of the file
+    or as the values of a root mapping, are compiled before they are cached.
+
+    :param path:
+        Path of the YAML file to load.
+    :param safe:
+        Whether or not to use the aok safe loader on a cache miss.
+    :param directory:
+        Directory in which to cache the loaded data. Defaults to the AOK_CACHE_DIR
+        environment variable if set, or the aok directory of the user cache.
+    :param max_age:
+        Number of seconds after which unused cache entries are removed.
+    :param max_size:
+        Maximum total size of the cache entries in bytes, beyond which the least
+        recently used entries are removed.
+    :return:
+        The loaded YAML data.
+    """
+    from aok import _caching
+
+    return _caching.load_cached(path, safe, directory, max_age, max_size)
@@ -22,6 +22,16 @@ def to_comparator(value: typing.Any) -> "_definitions.Comparator":
     return comparisons.Equals(value)
 
 
+def compile_comparator(value: typing.Any) -> "_definitions.Comparator":
+    """
+    Convert the value to a comparator and resolve it into a reusable plan.
+
+    The returned comparator will not need to convert any of its nested expectations
+    into comparators again when comparisons are made with it.
+    """
+    return to_comparator(value).compile()
+
+
 def cast_compatible(
     expectation_value: typing.Any,
     observed_value: typing.Any,
@@ -38,3 +48,112 @@ def cast_compatible(
         return ex == "true"
 
     return ex
+
+
+_CAST_SAMPLES: typing.Tuple[typing.Any, ...] = ("", 0, False, 0.0, None)
+
+#: Types of the plain scalar values that casts are pre-computed for, which are
+#: the values that can be matched by hashing their casts instead of comparing.
+LITERAL_TYPES: typing.Tuple[type, ...] = tuple(type(s) for s in _CAST_SAMPLES)
+
+#: Deepest nesting of the literal containers that are compared natively, which
+#: stays well within the recursion limit of the native equality checks.
+MAX_LITERAL_DEPTH = 100
+
+
+def precast(expectation_value: typing.Any) -> typing.Dict[type, typing.Any]:
+    """
+    Pre-compute the compatible casts of an expectation value by observed type.
+
+    The cast made by `cast_compatible` depends only on the type of the observed
+    value, so it can be resolved once for the common observed types. Casts that
+    fail are left out of the returned lookup so that they are retried, and raise,
+    when the comparison is made.
+    """
+    casts: typing.Dict[type, typing.Any] = {}
+    for sample in _CAST_SAMPLES:
+        try:
+            casts[type(sample)] = cast_compatible(expectation_value, sample)
+        except (TypeError, ValueError):
+            pass
+    return casts
+
+
+def cast_precast(
+    expectation_value: typing.Any,
+    observed_value: typing.Any,
+    casts: typing.Optional[typing.Dict[type, typing.Any]],
+) -> typing.Any:
+    """
+    Casts by compatible type using the pre-computed casts where available.
+
+    Falls back to `cast_compatible` when no casts have been computed or when the
+    observed value is not of one of the pre-computed types.
+    """
+    if casts is None:
+        return cast_compatible(expectation_value, observed_value)
+
+    try:
+        return casts[type(observed_value)]
+    except KeyError:
+        return cast_compatible(expectation_value, observed_value)
+
+
+def literal_depth(comparator: "_definitions.Comparator") -> int:
+    """
+    Determine the nesting depth of the compiled comparator if it is literal.
+
+    These are equalities of plain scalar values and the containers whose nested
+    comparators are all literal, as determined when the containers are compiled.
+    Their expected values can be compared with a single native equality check.
+
+    :return:
+        1 for the equalities of plain scalar values, the depth of the nested
+        values for literal containers and 0 for comparators that aren't literal.
+    """
+    if type(comparator) is comparisons.Equals:
+        return int(type(comparator.value) in LITERAL_TYPES)
+    return int(getattr(comparator, "_literal", 0))
+
+
+def container_literal_depth(
+    comparators: typing.Iterable["_definitions.Comparator"],
+) -> int:
+    """
+    Determine the literal depth of a container of the compiled comparators.
+
+    Native equality checks recurse through the nested values, so containers
+    nested deeper than `MAX_LITERAL_DEPTH` aren't literal and are compared
+    element-wise instead, down to their literal nested containers.
+
+    :return:
+        The depth of the container when all of the comparators are literal and
+        it isn't nested too deeply, or 0 otherwise.
+    """
+    depth = 1
+    for comparator in comparators:
+        nested = literal_depth(comparator)
+        if not nested:
+            return 0
+        depth = max(depth, nested + 1)
+    return depth if depth <= MAX_LITERAL_DEPTH else 0
+
+
+def matches_literal(expected: typing.Any, observed: typing.Any, subset: bool) -> bool:
+    """
+    Determine whether the observed value natively equals the literal expected value.
+
+    The whole value is compared with one C-level equality check, or the items of
+    the expected dictionary are checked to be within the observed one in subset
+    mode. A match means the element-wise comparison passes as well, while values
+    that don't match, including those only equal after casting them with
+    `cast_compatible`, must be compared element-wise to find the differences.
+    """
+    try:
+        if subset and type(expected) is dict:
+            return bool(observed.items() >= expected.items())
+        return bool(expected == observed)
+    except Exception:
+        # Errors from comparing the values, including those of data nested too
+        # deeply to compare recursively, are left to the element-wise comparison.
+        return False
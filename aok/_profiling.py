@@ -0,0 +1,245 @@
+import contextlib
+import functools
+import time
+import typing
+
+from aok import _definitions
+
+SORT_OPTIONS = ("cumulative", "self", "calls", "failures")
+
+
+class Timing:
+    """Accumulated calls, times and failures of comparisons."""
+
+    def __init__(self):
+        """Create the timing without any calls."""
+        self.calls = 0
+        self.failures = 0
+        self.cumulative = 0.0
+        self.self = 0.0
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """Convert the timing into a JSON-serializable dictionary."""
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "cumulative": self.cumulative,
+            "self": self.self,
+        }
+
+
+class ProfileStats:
+    """
+    Statistics of the comparisons made while profiling.
+
+    The calls, cumulative and self times in seconds and the failures of the
+    comparisons are accumulated by the operation name of the comparators, and by
+    the path of the comparisons within the expectations. Comparisons made by a
+    comparator on behalf of its own comparison, like the options of a one_of,
+    are accumulated at the same path. Checks are accumulated like comparisons,
+    failing when they return false, but as they have no results to find the
+    keys of their nested checks in, those are accumulated at the same path.
+    """
+
+    def __init__(self):
+        """Create the statistics without any comparisons."""
+        self.operations: typing.Dict[str, Timing] = {}
+        self.paths: typing.Dict[str, Timing] = {}
+
+    def _add(self, frame: "_Frame", path: str, elapsed: float, own: float):
+        """Add the timing of a completed comparison."""
+        result = frame.result
+        if isinstance(result, bool):
+            failed = not result
+        else:
+            failed = not getattr(result, "success", True)
+        for timings, key in ((self.operations, frame.operation), (self.paths, path)):
+            timing = timings.get(key)
+            if timing is None:
+                timing = timings[key] = Timing()
+            timing.calls += 1
+            timing.failures += failed
+            timing.cumulative += elapsed
+            timing.self += own
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """Convert the statistics into a JSON-serializable dictionary."""
+        return {
+            "operations": {k: t.to_dict() for k, t in self.operations.items()},
+            "paths": {k: t.to_dict() for k, t in self.paths.items()},
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """Serialize the statistics as JSON, passing arguments to json.dumps."""
+        import json
+
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def table(
+        self,
+        by: str = "operation",
+        sort: str = "cumulative",
+        limit: typing.Optional[int] = None,
+    ) -> str:
+        """
+        Create a table of the statistics for display.
+
+        :param by:
+            Either "operation" or "path" for the statistics to list.
+        :param sort:
+            Statistic to sort the rows by in descending order, which is one of
+            "cumulative", "self", "calls" or "failures".
+        :param limit:
+            Maximum number of rows to list.
+        """
+        if by not in ("operation", "path"):
+            raise ValueError(f'Invalid by "{by}", must be "operation" or "path".')
+        if sort not in SORT_OPTIONS:
+            raise ValueError(f'Invalid sort "{sort}", must be one of {SORT_OPTIONS}.')
+
+        timings = self.operations if by == "operation" else self.paths
+        rows = sorted(timings.items(), key=lambda i: getattr(i[1], sort), reverse=True)
+        width = max([len(by)] + [len(key) for key, _ in rows[:limit]])
+        lines = [
+            f"{by:<{width}} {'calls':>10} {'failures':>10}"
+            f" {'cumulative (ms)':>16} {'self (ms)':>12}"
+        ]
+        for key, timing in rows[:limit]:
+            lines.append(
+                f"{key:<{width}} {timing.calls:>10} {timing.failures:>10}"
+                f" {timing.cumulative * 1000:>16.3f} {timing.self * 1000:>12.3f}"
+            )
+        return "\n".join(lines)
+
+
+class _Frame:
+    """A comparison in progress, or completed within a comparison in progress."""
+
+    __slots__ = ("operation", "elapsed", "children", "result")
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.elapsed = 0.0
+        self.children: typing.List[_Frame] = []
+        self.result: typing.Any = None
+
+
+class _Profiler:
+    """Times the comparisons of the patched comparators."""
+
+    def __init__(self, stats: ProfileStats):
+        self.stats = stats
+        self.stack: typing.List[_Frame] = []
+
+    def call(
+        self,
+        method: typing.Callable,
+        comparator: "_definitions.Comparator",
+        observed: typing.Any,
+        subset: bool,
+        options: typing.Dict[str, typing.Any],
+    ) -> typing.Any:
+        """Call the compare or check method and time it within the comparisons."""
+        frame = _Frame(comparator.operation_name())
+        if self.stack:
+            self.stack[-1].children.append(frame)
+        self.stack.append(frame)
+
+        start = time.perf_counter()
+        try:
+            frame.result = method(comparator, observed, subset, **options)
+        finally:
+            frame.elapsed = time.perf_counter() - start
+            self.stack.pop()
+            if not self.stack:
+                self._record(frame)
+        return frame.result
+
+    def _record(self, root: _Frame):
+        """Add the timings of the completed comparisons, resolving their paths."""
+        pending = [(root, "")]
+        while pending:
+            frame, path = pending.pop()
+            keys = {
+                id(child): key
+                for key, child in getattr(frame.result, "children", {}).items()
+            }
+            for child in frame.children:
+                key = keys.get(id(child.result))
+                if key is None:
+                    pending.append((child, path))
+                else:
+                    pending.append((child, f"{path}.{key}" if path else str(key)))
+
+            own = frame.elapsed - sum(child.elapsed for child in frame.children)
+            self.stats._add(frame, path or "(root)", frame.elapsed, own)
+
+
+def _comparator_classes() -> typing.List[type]:
+    """List the comparator class and all of its subclasses."""
+    classes: typing.List[type] = [_definitions.Comparator]
+    pending = [_definitions.Comparator]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            if subclass not in classes:
+                classes.append(subclass)
+                pending.append(subclass)
+    return classes
+
+
+_active: typing.List[_Profiler] = []
+
+
+@contextlib.contextmanager
+def profile() -> typing.Iterator[ProfileStats]:
+    """
+    Profile the comparisons made within the context.
+
+    While the context is active, the compare and check methods of all comparator
+    classes are replaced with timed ones, and the original methods are restored
+    on exit, so comparisons made outside of the context have no profiling
+    overhead at all. The methods are replaced for the whole process, so that
+    comparisons made by other threads while the context is active are profiled
+    as well, and can be mixed up with those of the thread profiling them.
+
+    .. code-block:: python
+
+        with aok.profile() as stats:
+            ok.compare(observed)
+        print(stats.table(by="path", sort="self"))
+
+    :return:
+        Statistics that are accumulated as the comparisons are made.
+    """
+    if _active:
+        raise RuntimeError("Profiling is already active.")
+
+    profiler = _Profiler(ProfileStats())
+    originals = [
+        (cls, name, cls.__dict__[name])
+        for cls in _comparator_classes()
+        for name in ("compare", "check")
+        if name in cls.__dict__
+    ]
+
+    def _wrap(method: typing.Callable) -> typing.Callable:
+        @functools.wraps(method)
+        def _profiled(
+            self,
+            observed: typing.Any,
+            subset: bool = False,
+            **options: typing.Any,
+        ) -> typing.Any:
+            return profiler.call(method, self, observed, subset, options)
+
+        return _profiled
+
+    _active.append(profiler)
+    try:
+        for cls, name, method in originals:
+            setattr(cls, name, _wrap(method))
+        yield profiler.stats
+    finally:
+        for cls, name, method in originals:
+            setattr(cls, name, method)
+        _active.clear()
@@ -0,0 +1,114 @@
+import typing
+
+from aok import _definitions
+
+KEEP_OPTIONS = ("failures", "all", "none")
+
+
+class RecordComparisons:
+    """
+    Lazily compares each record of an iterable against the same expected values.
+
+    Iterating over this object consumes the records one at a time and yields a
+    tuple of the record index and its comparison for the results being kept. A
+    running count of the records that passed and failed is kept as they are
+    consumed, such that memory use does not grow with the number of records.
+    """
+
+    def __init__(
+        self,
+        comparator: "_definitions.Comparator",
+        records: typing.Iterable[typing.Any],
+        subset: bool = False,
+        keep: str = "failures",
+        retain: str = "all",
+    ):
+        """
+        Create a lazy comparison of the records against the comparator.
+
+        :param comparator:
+            Comparator containing the expected values for every record.
+        :param records:
+            Iterable of records to compare, which is consumed lazily.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :param keep:
+            Which comparison results to yield while iterating. One of "failures"
+            for only the records that failed, "all" for every record or "none" to
+            only count the records that passed and failed.
+        :param retain:
+            Which expected and observed values to retain in the results kept. One
+            of "all" for every value, "leaves" for only the values of the leaf
+            comparisons or "none" for only the failures and their values.
+        """
+        if keep not in KEEP_OPTIONS:
+            raise ValueError(f'Unknown keep option "{keep}" not in {KEEP_OPTIONS}.')
+        if retain not in _definitions.RETAIN_OPTIONS:
+            raise ValueError(
+                f'Unknown retain option "{retain}"'
+                f" not in {_definitions.RETAIN_OPTIONS}."
+            )
+
+        self.comparator = comparator
+        self.subset = subset
+        self.keep = keep
+        self.retain = retain
+        self.passed = 0
+        self.failed = 0
+        self._iterator = self._compare_records(records)
+
+    @property
+    def total(self) -> int:
+        """Number of records that have been compared so far."""
+        return self.passed + self.failed
+
+    @property
+    def success(self) -> bool:
+        """Whether or not all of the records compared so far have passed."""
+        return self.failed == 0
+
+    def __iter__(self) -> "RecordComparisons":
+        """Iterate over the kept results while comparing the records."""
+        return self
+
+    def __next__(self) -> typing.Tuple[int, "_definitions.Comparison"]:
+        """Compare records until the next kept result is found."""
+        return next(self._iterator)
+
+    def consume(self) -> "RecordComparisons":
+        """Compare all of the remaining records, discarding their results."""
+        for _ in self._iterator:
+            pass
+        return self
+
+    def _compare_records(
+        self,
+        records: typing.Iterable[typing.Any],
+    ) -> typing.Iterator[typing.Tuple[int, "_definitions.Comparison"]]:
+        """Compare the records in order, yielding the results that are kept."""
+        for index, record in enumerate(records):
+            if self.keep == "all":
+                result = self.comparator.compare(record, subset=self.subset)
+                result.prune(self.retain)
+                success = result.success
+            else:
+                success = self.comparator.check(record, subset=self.subset)
+
+            if success:
+                self.passed += 1
+            else:
+                self.failed += 1
+
+            if self.keep == "all":
+                yield index, result
+            elif self.keep == "failures" and not success:
+                result = self.comparator.compare(record, subset=self.subset)
+                yield index, result.prune(self.retain)
+
+    def __repr__(self) -> str:
+        """Display the running counts of the comparisons."""
+        return (
+            f"<RecordComparisons passed={self.passed} failed={self.failed}"
+            f" total={self.total}>"
+        )
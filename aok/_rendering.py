@@ -0,0 +1,98 @@
+import reprlib
+import typing
+
+from aok import _definitions
+
+#: Default limits of the rendered failure reports.
+MAX_FAILURES = 50
+MAX_VALUE_CHARS = 200
+MAX_DEPTH = 32
+
+_TRUNCATED = "...[truncated]"
+
+
+class _ValueFormatter(reprlib.Repr):
+    """Formats values with a bounded size without building their full repr."""
+
+    def __init__(self, max_value_chars: int):
+        """Create the formatter with the maximum characters for each value."""
+        super(_ValueFormatter, self).__init__()
+        self.max_value_chars = max_value_chars
+        self.maxlevel = 4
+        self.maxstring = max_value_chars
+        self.maxother = max_value_chars
+        self.maxlong = max_value_chars
+        self.maxdict = self.maxlist = self.maxtuple = 20
+        self.maxset = self.maxfrozenset = self.maxdeque = self.maxarray = 20
+
+    def format(self, value: typing.Any) -> str:
+        """Format the value, truncating it to the maximum number of characters."""
+        return self.truncate(self.repr(value))
+
+    def truncate(self, text: str) -> str:
+        """Truncate the text to the maximum number of characters with a marker."""
+        if len(text) > self.max_value_chars:
+            return text[: self.max_value_chars] + _TRUNCATED
+        return text
+
+
+def iter_report(
+    comparison: "_definitions.Comparison",
+    max_failures: int = MAX_FAILURES,
+    max_value_chars: int = MAX_VALUE_CHARS,
+    max_depth: int = MAX_DEPTH,
+    indent: str = "",
+) -> typing.Iterator[str]:
+    """
+    Iterate over the lines of a report of the failures within the comparison.
+
+    The failures are written in path order as they are found by
+    `Comparison.iter_failures`, instead of building an intermediate structure of
+    all differences, so rendering stops as soon as the limits are reached.
+
+    :param comparison:
+        Comparison to report the failures of.
+    :param max_failures:
+        Maximum number of failures to report, after which a line notes that the
+        remaining failures were not shown.
+    :param max_value_chars:
+        Maximum number of characters of each expected and observed value, after
+        which the value is truncated.
+    :param max_depth:
+        Maximum depth of nested comparisons to descend into, where failures
+        nested further are reported as a failure of the comparison at that depth.
+    :param indent:
+        Prefix added to each of the lines.
+    """
+    if comparison.success:
+        return
+
+    formatter = _ValueFormatter(max_value_chars)
+    for reported, (path, node) in enumerate(comparison.iter_failures(max_depth)):
+        if reported == max_failures:
+            yield f"{indent}... further failures not shown after the first {reported}"
+            return
+
+        yield "{}{}:".format(indent, ".".join(str(key) for key in path) or "(root)")
+        yield f"{indent}  OPERATION: {node.operation}"
+        if any(not child.success for child in node.children.values()):
+            yield f"{indent}  NESTED: failures below a depth of {max_depth} not shown"
+            continue
+
+        yield f"{indent}  EXPECTED: {formatter.format(node.expected)}"
+        yield f"{indent}  OBSERVED: {formatter.format(node.observed)}"
+        if node.error:
+            yield f"{indent}  ERROR: {formatter.truncate(str(node.error))}"
+
+
+def render(
+    comparison: "_definitions.Comparison",
+    max_failures: int = MAX_FAILURES,
+    max_value_chars: int = MAX_VALUE_CHARS,
+    max_depth: int = MAX_DEPTH,
+    indent: str = "",
+) -> str:
+    """Render the report of the failures within the comparison as a string."""
+    return "\n".join(
+        iter_report(comparison, max_failures, max_value_chars, max_depth, indent)
+    )
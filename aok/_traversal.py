@@ -0,0 +1,186 @@
+import typing
+
+import aok
+from aok import _definitions
+from aok import _types
+
+Method = typing.TypeVar("Method", bound=typing.Callable[..., typing.Any])
+Expander = typing.Callable[..., "_types.Children"]
+
+#: Methods of the container comparators that are carried out by the traversal,
+#: such that nested containers with these methods are expanded in place instead
+#: of calling them, while methods overriding or replacing them are called.
+_traversed: typing.Set[typing.Callable[..., typing.Any]] = set()
+
+
+def traversed(method: Method) -> Method:
+    """Mark the compare, check or compile method as carried out by the traversal."""
+    _traversed.add(method)
+    return method
+
+
+def is_traversed(cls: type, method: str) -> bool:
+    """Determine whether the method of the comparator type is carried out here."""
+    return getattr(cls, method, None) in _traversed
+
+
+def _resolve(
+    expanders: typing.Dict[type, typing.Any],
+    cls: type,
+    method: str,
+) -> typing.Optional[Expander]:
+    """
+    Resolve how the comparators of the type are traversed for the method.
+
+    This is the unbound `_children` method expanding the comparator into its
+    children when its method is carried out by the traversal, or None for the
+    comparators whose method must be called.
+    """
+    traversable = is_traversed(cls, method)
+    expander = expanders[cls] = getattr(cls, "_children") if traversable else None
+    return expander
+
+
+def compare_children(
+    operation: str,
+    children: "_types.Children",
+    subset: bool = False,
+) -> "_definitions.Comparison":
+    """
+    Compare the expanded children of a container with an explicit stack.
+
+    Nested containers are expanded into their own children in place instead of
+    calling their compare methods, descending into each one as it is found, so
+    that the nesting depth of the values compared isn't limited by recursion
+    and no frames are added per level. The comparisons are the same as those of
+    the recursive compare methods.
+
+    :param operation:
+        Name of the operation of the container comparison.
+    :param children:
+        Expanded children of the container, as returned by its `_children`.
+    :param subset:
+        When true, any extra keys/values found in dictionaries will be ignored
+        and assumed to be insignificant. Set to false for exact matching.
+    :return:
+        Comparison of the container with the comparisons of its children.
+    """
+    if isinstance(children, _definitions.Comparison):
+        return children
+
+    expected, observed, pairs = children
+    root = _definitions.Comparison(operation, True, expected, observed)
+    expanders: typing.Dict[type, typing.Any] = {}
+    operations: typing.Dict[type, str] = {}
+
+    stack = [(root, iter(pairs))]
+    while stack:
+        node, remaining = stack[-1]
+        results = node.children
+        for key, comparator, value in remaining:
+            try:
+                expand = expanders[type(comparator)]
+            except KeyError:
+                expand = _resolve(expanders, type(comparator), "compare")
+            if expand is None:
+                results[key] = comparator.compare(value, subset)
+                continue
+
+            expanded = expand(comparator, value, subset)
+            if isinstance(expanded, _definitions.Comparison):
+                results[key] = expanded
+                continue
+
+            cls = type(comparator)
+            name = operations.get(cls)
+            if name is None:
+                name = operations[cls] = (
+                    getattr(cls, "_container_operation", None) or cls.operation_name()
+                )
+            child = results[key] = _definitions.Comparison(
+                name, True, expanded[0], expanded[1]
+            )
+            stack.append((child, iter(expanded[2])))
+            break
+        else:
+            # The children of the node, including nested ones, are all compared.
+            stack.pop()
+            node.success = all([r.success for r in results.values()])
+
+    return root
+
+
+def check_children(children: "_types.Children", subset: bool = False) -> bool:
+    """
+    Check the expanded children of a container with an explicit stack.
+
+    Nested containers are expanded in place like in `compare_children`, stopping
+    at the first difference found.
+
+    :param children:
+        Expanded children of the container, as returned by its `_children`.
+    :param subset:
+        When true, any extra keys/values found in dictionaries will be ignored
+        and assumed to be insignificant. Set to false for exact matching.
+    :return:
+        Whether or not all of the children pass.
+    """
+    if isinstance(children, _definitions.Comparison):
+        return children.success
+
+    expanders: typing.Dict[type, typing.Any] = {}
+    stack = [iter(children[2])]
+    while stack:
+        for _, comparator, value in stack[-1]:
+            try:
+                expand = expanders[type(comparator)]
+            except KeyError:
+                expand = _resolve(expanders, type(comparator), "check")
+            if expand is None:
+                if not comparator.check(value, subset):
+                    return False
+                continue
+
+            expanded = expand(comparator, value, subset)
+            if isinstance(expanded, _definitions.Comparison):
+                if not expanded.success:
+                    return False
+                continue
+
+            stack.append(iter(expanded[2]))
+            break
+        else:
+            stack.pop()
+
+    return True
+
+
+def compile_comparator(comparator: typing.Any) -> typing.Any:
+    """
+    Compile the container comparator and all of its nested ones with a stack.
+
+    Nested containers with compile methods carried out by the traversal are
+    compiled in place, each with the comparators compiled from its expected
+    values once they are all compiled, while other comparators are compiled by
+    calling their compile methods.
+
+    :return:
+        The compiled copy of the container comparator.
+    """
+    stack: typing.List[typing.Tuple[typing.Any, typing.Iterator, typing.List]] = [
+        (comparator, iter(comparator._expectations()), [])
+    ]
+    while True:
+        container, remaining, compiled = stack[-1]
+        for value in remaining:
+            child: typing.Any = aok.to_comparator(value)
+            if type(child).compile in _traversed:
+                stack.append((child, iter(child._expectations()), []))
+                break
+            compiled.append(child.compile())
+        else:
+            stack.pop()
+            result = container._compiled(compiled)
+            if not stack:
+                return result
+            stack[-1][2].append(result)
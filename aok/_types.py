@@ -1,9 +1,27 @@
+import os
 import typing
 
 from aok import _definitions
+from aok import _records
 
 ArbitraryDict = typing.Dict[typing.Any, typing.Any]
 ArbitraryList = typing.Union[typing.List[typing.Any], typing.Tuple[typing.Any, ...]]
+Source = typing.Union[str, "os.PathLike[str]", typing.IO]
+
+#: Expected and observed values of a container with its expected comparators
+#: paired with the nested observed values to compare them with as (key,
+#: comparator, observed) tuples, or the failed result of the container itself
+#: when its nested values cannot be compared.
+Children = typing.Union[
+    "_definitions.Comparison",
+    typing.Tuple[
+        typing.Any,
+        typing.Any,
+        typing.Iterable[
+            typing.Tuple[typing.Any, "_definitions.Comparator", typing.Any]
+        ],
+    ],
+]
 
 
 class OkayRoot(typing.Protocol):  # pragma: no cover
@@ -52,10 +70,44 @@ class OkayRoot(typing.Protocol):  # pragma: no cover
         """
         pass
 
+    def compile(self) -> "OkayRoot":
+        """
+        Resolve the expected values into a plan that can be reused for comparisons.
+
+        All nested expectations are converted into compiled comparators once, so
+        that repeated comparisons with the returned object only walk the plan.
+
+        :return:
+            A compiled copy of this root object.
+        """
+        pass
+
+    def check(
+        self,
+        observed: typing.Any,
+        subset: bool = False,
+    ) -> bool:
+        """
+        Determine whether the observed object passes the expected values.
+
+        This stops at the first difference that is found and does not create any
+        comparison objects. Use `compare` to find the differences when this fails.
+
+        :param observed:
+            Data structure to compare against the expected one.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :return:
+            Whether or not the observed object passes the expected values.
+        """
+        pass
+
     def compare(
         self,
         observed: typing.Any,
         subset: bool = False,
+        retain: str = "all",
     ) -> "_definitions.Comparison":
         """
         Compare the observed object against the expected values.
@@ -68,8 +120,44 @@ class OkayRoot(typing.Protocol):  # pragma: no cover
         :param subset:
             When true, any extra keys/values found in dictionaries will be ignored
             and assumed to be insignificant. Set to false for exact matching.
+        :param retain:
+            Which expected and observed values to retain in the results. One of
+            "all" for every value, "leaves" for only the values of the leaf
+            comparisons or "none" for only the failures and their values, which
+            all produce the same `to_diff_info` for the failures.
         :return:
             A comparison object that describes the element-wise differences between
             the observed data structure and its expectations.
         """
         pass
+
+    def compare_many(
+        self,
+        observed: typing.Iterable[typing.Union[ArbitraryDict, ArbitraryList]],
+        subset: bool = False,
+        keep: str = "failures",
+        retain: str = "all",
+    ) -> "_records.RecordComparisons":
+        """
+        Compare each of the observed objects against the expected values.
+
+        The observed iterable is consumed lazily while iterating over the returned
+        object, which yields the record index and comparison of each result kept.
+        The number of records that passed and failed is counted as they go.
+
+        :param observed:
+            Iterable of data structures to compare against the expected one.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :param keep:
+            Which comparison results to yield while iterating. One of "failures"
+            for only the records that failed, "all" for every record or "none" to
+            only count the records that passed and failed.
+        :param retain:
+            Which expected and observed values to retain in the results kept. One
+            of "all", "leaves" or "none", as in `compare`.
+        :return:
+            A lazy iterator of record comparisons with running counts of results.
+        """
+        pass
@@ -0,0 +1,25 @@
+import pathlib
+import re
+
+#: Version line of the poetry section of the pyproject.toml file.
+_VERSION_PATTERN = re.compile(r'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+
+
+def get_version() -> str:
+    """
+    Determine the version of the installed aok package.
+
+    The importlib.metadata lookup reads the distribution metadata from disk and
+    is comparatively expensive to import, which is why this is resolved lazily on
+    the first access of `aok.__version__` instead of on import.
+    """
+    from importlib import metadata
+
+    try:
+        return metadata.version("aok")
+    except metadata.PackageNotFoundError:  # pragma: no-cover
+        # If the package is not installed such that it has distribution metadata
+        # fallback to reading the version from the pyproject.toml file.
+        path = pathlib.Path(__file__).parent.parent.joinpath("pyproject.toml")
+        match = _VERSION_PATTERN.search(path.read_text())
+        return match.group(1) if match else "0.0.0"
@@ -0,0 +1,232 @@
+"""
+Columnar comparisons of record batches using vectorized NumPy operations.
+
+This module requires NumPy, which is an optional dependency that can be installed
+with the `aok[numpy]` extra.
+"""
+
+import copy
+import typing
+
+try:
+    import numpy
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "The aok.columnar module requires NumPy, which can be installed with"
+        " the aok[numpy] extra."
+    ) from error
+
+from aok import _definitions
+from aok import comparisons
+
+#: Placeholder for values within records that do not have the dictionary
+#: structure leading up to them, which already fail the structural comparison.
+_INVALID = object()
+
+_NUMERIC_TYPES = (int, float, bool)
+_MAX_EXACT_INTEGER = 2**53
+
+Vectorized = typing.Callable[[typing.Any, typing.Any], typing.Any]
+
+_VECTORIZED: typing.Dict[type, Vectorized] = {
+    comparisons.Equals: lambda column, value: column == value,
+    comparisons.Greater: lambda column, value: column > value,
+    comparisons.GreaterOrEqual: lambda column, value: column >= value,
+    comparisons.Less: lambda column, value: column < value,
+    comparisons.LessOrEqual: lambda column, value: column <= value,
+    comparisons.Between: lambda column, value: (
+        (column >= value["min"]) & (column <= value["max"])
+    ),
+}
+
+
+class BatchComparison:
+    """Results of comparing a batch of records against the same expected values."""
+
+    def __init__(
+        self,
+        mask: typing.Any,
+        failures: typing.Dict[int, "_definitions.Comparison"],
+    ):
+        """
+        Create the results of a batch comparison.
+
+        :param mask:
+            Boolean NumPy array with the pass/fail result of each record.
+        :param failures:
+            Comparison results of the failing records keyed by their index.
+        """
+        self.mask = mask
+        self.failures = failures
+
+    @property
+    def passed(self) -> int:
+        """Number of records that passed the comparison."""
+        return int(self.mask.sum())
+
+    @property
+    def failed(self) -> int:
+        """Number of records that failed the comparison."""
+        return len(self.mask) - self.passed
+
+    @property
+    def success(self) -> bool:
+        """Whether or not all of the records passed the comparison."""
+        return bool(self.mask.all())
+
+
+def _is_exact_number(value: typing.Any) -> bool:
+    """Determine if the value is a number that a float can represent exactly."""
+    if type(value) is float:
+        return True
+    return type(value) is int and abs(value) <= _MAX_EXACT_INTEGER
+
+
+def _is_vectorized(comparator: "_definitions.Comparator") -> bool:
+    """Determine if the comparator can be evaluated as a vectorized operation."""
+    if isinstance(comparator, comparisons.NotNull):
+        return True
+
+    if type(comparator) not in _VECTORIZED:
+        return False
+
+    if isinstance(comparator, comparisons.Between):
+        return _is_exact_number(comparator.value["min"]) and _is_exact_number(
+            comparator.value["max"]
+        )
+    return _is_exact_number(comparator.value)
+
+
+def _child_values(
+    values: typing.List[typing.Any],
+    key: typing.Any,
+) -> typing.List[typing.Any]:
+    """Fetch the values of the key within each of the dictionary values."""
+    children = []
+    for value in values:
+        value = value or {}
+        children.append(value.get(key) if isinstance(value, dict) else _INVALID)
+    return children
+
+
+def _to_array(values: typing.List[typing.Any]) -> typing.Optional[typing.Any]:
+    """Convert the values to a numeric array if that can be done exactly."""
+    types = set(map(type, values))
+    if not types or not types.issubset(_NUMERIC_TYPES):
+        return None
+
+    try:
+        array = numpy.array(values)
+    except OverflowError:
+        return None
+
+    if array.dtype.kind in "iu":
+        exact = numpy.abs(array).max() <= _MAX_EXACT_INTEGER
+    elif int in types:
+        exact = all(_is_exact_number(v) for v in values if type(v) is int)
+    else:
+        exact = True
+    return array if exact else None
+
+
+def _evaluate(
+    comparator: "_definitions.Comparator",
+    values: typing.List[typing.Any],
+) -> typing.Any:
+    """Evaluate the comparator against a column of values as a boolean mask."""
+    if isinstance(comparator, comparisons.NotNull):
+        return numpy.fromiter(
+            (value is not None for value in values), dtype=bool, count=len(values)
+        )
+
+    vectorized = _VECTORIZED[type(comparator)]
+    array = _to_array(values)
+    if array is not None:
+        return vectorized(array, comparator.value)
+
+    mask = numpy.ones(len(values), dtype=bool)
+    numeric = [i for i, v in enumerate(values) if type(v) in _NUMERIC_TYPES]
+    array = _to_array([values[i] for i in numeric])
+    if array is not None:
+        mask[numeric] = vectorized(array, comparator.value)
+        remaining = set(range(len(values))).difference(numeric)
+    else:
+        remaining = set(range(len(values)))
+
+    for index in remaining:
+        value = values[index]
+        mask[index] = value is _INVALID or comparator.check(value)
+    return mask
+
+
+def _split(
+    comparator: "_definitions.Comparator",
+    values: typing.List[typing.Any],
+    columns: typing.List[typing.Tuple["_definitions.Comparator", typing.List]],
+) -> "_definitions.Comparator":
+    """
+    Pivot the values into columns for each of the vectorized comparators.
+
+    The vectorized comparators are replaced by `Anything` comparators within the
+    returned copy of the expected values, which is used to compare each of the
+    records for everything that was not vectorized, e.g. the dictionary structure.
+    """
+    if isinstance(comparator, comparisons.Dict):
+        residual = copy.copy(comparator)
+        residual._plan = tuple(
+            (key, _split(child, _child_values(values, key), columns))
+            for key, child in (comparator._plan or ())
+        )
+        residual._literal = False
+        return residual
+
+    if _is_vectorized(comparator):
+        columns.append((comparator, values))
+        return comparisons.Anything()
+
+    return comparator
+
+
+def compare_batch(
+    expected: "_definitions.Comparator",
+    records: typing.Iterable[typing.Any],
+    subset: bool = False,
+) -> BatchComparison:
+    """
+    Compare a batch of records against the expected values column by column.
+
+    The records are pivoted into columns for each of the numeric and null
+    comparators within the nested dictionaries of the expected values, e.g.
+    `greater`, `between` or `not_null`, which are evaluated as vectorized NumPy
+    operations. Everything else is compared record by record, as are values of
+    columns that are not numeric. Only the records that fail have their detailed
+    comparison results created.
+
+    :param expected:
+        Root object, e.g. `aok.Okay`, containing the expected values.
+    :param records:
+        Records to compare against the expected values.
+    :param subset:
+        When true, any extra keys/values found in dictionaries will be ignored
+        and assumed to be insignificant. Set to false for exact matching.
+    :return:
+        The per-record pass mask and the comparisons of the failing records.
+    """
+    batch = list(records)
+    compiled = expected.compile()
+
+    columns: typing.List[typing.Tuple["_definitions.Comparator", typing.List]] = []
+    residual = _split(compiled, batch, columns)
+
+    mask = numpy.ones(len(batch), dtype=bool)
+    for comparator, values in columns:
+        mask &= _evaluate(comparator, values)
+
+    for index in numpy.flatnonzero(mask):
+        mask[index] = residual.check(batch[index], subset)
+
+    failures = {
+        int(index): compiled.compare(batch[index], subset)
+        for index in numpy.flatnonzero(~mask)
+    }
+    return BatchComparison(mask, failures)
@@ -20,13 +20,21 @@ from aok.comparisons._basics import none_of  # noqa: F401
 from aok.comparisons._basics import one_of  # noqa: F401
 from aok.comparisons._basics import unequals  # noqa: F401
 from aok.comparisons._dicts import Dict  # noqa: F401
+from aok.comparisons._dicts import JsonDict  # noqa: F401
 from aok.comparisons._dicts import Okay  # noqa: F401
+from aok.comparisons._dicts import json_dict  # noqa: F401
+from aok.comparisons._lists import Aligned  # noqa: F401
+from aok.comparisons._lists import Each  # noqa: F401
 from aok.comparisons._lists import JsonList  # noqa: F401
 from aok.comparisons._lists import List  # noqa: F401
 from aok.comparisons._lists import OkayList  # noqa: F401
 from aok.comparisons._lists import StrictList  # noqa: F401
 from aok.comparisons._lists import Tuple  # noqa: F401
+from aok.comparisons._lists import Unordered  # noqa: F401
+from aok.comparisons._lists import aligned  # noqa: F401
+from aok.comparisons._lists import each  # noqa: F401
 from aok.comparisons._lists import json_list  # noqa: F401
+from aok.comparisons._lists import unordered  # noqa: F401
 from aok.comparisons._nullish import NotNull  # noqa: F401
 from aok.comparisons._nullish import Optional  # noqa: F401
 from aok.comparisons._nullish import not_null  # noqa: F401
@@ -1,12 +1,30 @@
+import copy
 import typing
 
 import yaml
 
 from aok import _definitions
+from aok import _json
 from aok import _operations
 
 
-class Equals(_definitions.Comparator):
+class _Casting(_definitions.Comparator):
+    """Base comparator for values cast to be compatible with the observed value."""
+
+    _casts: typing.Optional[typing.Dict[type, typing.Any]] = None
+
+    def compile(self) -> "_Casting":
+        """Resolve the compatible casts of the expected value ahead of time."""
+        compiled = copy.copy(self)
+        compiled._casts = _operations.precast(self.value)
+        return compiled
+
+    def _cast(self, observed: typing.Any) -> typing.Any:
+        """Cast the expected value to be compatible with the observed value."""
+        return _operations.cast_precast(self.value, observed, self._casts)
+
+
+class Equals(_Casting):
     """Compares two values as an equality."""
 
     def _compare(
@@ -15,10 +33,10 @@ class Equals(_definitions.Comparator):
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
         """Make an equals comparison."""
-        return _operations.cast_compatible(self.value, observed) == observed
+        return self._cast(observed) == observed
 
 
-class Unequals(_definitions.Comparator):
+class Unequals(_Casting):
     """Compares two values as an inequality."""
 
     def _compare(
@@ -27,7 +45,7 @@ class Unequals(_definitions.Comparator):
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
         """Make an inequality comparison."""
-        return _operations.cast_compatible(self.value, observed) != observed
+        return self._cast(observed) != observed
 
 
 class Anything(_definitions.Comparator):
@@ -50,7 +68,7 @@ class Anything(_definitions.Comparator):
         return cls()
 
 
-class Less(_definitions.Comparator):
+class Less(_Casting):
     """Allows anything less than the given value."""
 
     def _compare(
@@ -59,10 +77,10 @@ class Less(_definitions.Comparator):
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
         """Less than will be true."""
-        return _operations.cast_compatible(self.value, observed) > observed
+        return self._cast(observed) > observed
 
 
-class LessOrEqual(_definitions.Comparator):
+class LessOrEqual(_Casting):
     """Allows anything less than or equal the given value."""
 
     def _compare(
@@ -71,10 +89,10 @@ class LessOrEqual(_definitions.Comparator):
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
         """Less than or equal will be true."""
-        return _operations.cast_compatible(self.value, observed) >= observed
+        return self._cast(observed) >= observed
 
 
-class Greater(_definitions.Comparator):
+class Greater(_Casting):
     """Allows anything greater than the given value."""
 
     def _compare(
@@ -83,10 +101,10 @@ class Greater(_definitions.Comparator):
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
         """Greater than will be true."""
-        return _operations.cast_compatible(self.value, observed) < observed
+        return self._cast(observed) < observed
 
 
-class GreaterOrEqual(_definitions.Comparator):
+class GreaterOrEqual(_Casting):
     """Allows anything greater than or equal to the given value."""
 
     def _compare(
@@ -95,22 +113,36 @@ class GreaterOrEqual(_definitions.Comparator):
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
         """Greater than or equal will be true."""
-        return _operations.cast_compatible(self.value, observed) <= observed
+        return self._cast(observed) <= observed
 
 
 class Between(_definitions.Comparator):
     """Allows between the given values."""
 
+    _min_casts: typing.Optional[typing.Dict[type, typing.Any]] = None
+    _max_casts: typing.Optional[typing.Dict[type, typing.Any]] = None
+
     def _compare(
         self,
         observed: typing.Any,
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
         """Greater than or equal will be true."""
-        casted_min = _operations.cast_compatible(self.value["min"], observed)
-        casted_max = _operations.cast_compatible(self.value["max"], observed)
+        casted_min = _operations.cast_precast(
+            self.value["min"], observed, self._min_casts
+        )
+        casted_max = _operations.cast_precast(
+            self.value["max"], observed, self._max_casts
+        )
         return casted_min <= observed <= casted_max
 
+    def compile(self) -> "Between":
+        """Resolve the compatible casts of the minimum and maximum ahead of time."""
+        compiled = copy.copy(self)
+        compiled._min_casts = _operations.precast(self.value["min"])
+        compiled._max_casts = _operations.precast(self.value["max"])
+        return compiled
+
     @classmethod
     def construct(cls, minimum: typing.Any, maximum: typing.Any) -> "Between":
         """Create a Between comparison operator with the specified options."""
@@ -126,7 +158,87 @@ class Between(_definitions.Comparator):
         return cls(value)
 
 
-class OneOf(_definitions.Comparator):
+def _to_option_comparator(option: typing.Any) -> _definitions.Comparator:
+    """Convert the option to a comparator, with plain values as equalities."""
+    if isinstance(option, _definitions.Comparator):
+        return option
+    return Equals(option)
+
+
+class _Options(_definitions.Comparator):
+    """
+    Base comparator for matching observed values against a list of options.
+
+    Plain scalar options are indexed by their compatible casts for each observed
+    type, such that finding a matching option is a hashed lookup instead of an
+    equality comparison against each of them. Only the remaining options, which
+    are comparators or non-scalar values, are compared one at a time.
+    """
+
+    _derived = ("_literals", "_literal_options")
+
+    def __init__(self, value: typing.Dict[str, typing.Any]):
+        """Create the comparison object with its plain scalar options indexed."""
+        super(_Options, self).__init__(value)
+        self._comparators: typing.Dict[int, _definitions.Comparator] = {
+            index: _to_option_comparator(option)
+            for index, option in enumerate(value["options"])
+            if type(option) not in _operations.LITERAL_TYPES
+        }
+
+    def _derive(self) -> None:
+        """Index the plain scalar options by their casts for each observed type."""
+        self._literals: typing.Dict[type, typing.Dict[typing.Any, int]] = {
+            observed_type: {} for observed_type in _operations.LITERAL_TYPES
+        }
+        self._literal_options: typing.List[typing.Tuple[int, typing.Any]] = []
+        for index, option in enumerate(self.value["options"]):
+            if type(option) not in _operations.LITERAL_TYPES:
+                continue
+
+            self._literal_options.append((index, option))
+            for observed_type, casted in _operations.precast(option).items():
+                self._literals[observed_type].setdefault(casted, index)
+
+    def compile(self) -> "_Options":
+        """Resolve each of the non-scalar options into a compiled comparator."""
+        compiled = copy.copy(self)
+        compiled._comparators = {
+            index: comparator.compile()
+            for index, comparator in self._comparators.items()
+        }
+        return compiled
+
+    def _find(self, observed: typing.Any, subset: bool) -> typing.Optional[int]:
+        """Find the index of an option that matches the observed value if any."""
+        lookup = self._literals.get(type(observed))
+        if lookup is not None:
+            index = lookup.get(observed)
+        else:
+            index = next(
+                (
+                    i
+                    for i, option in self._literal_options
+                    if Equals(option).check(observed, subset)
+                ),
+                None,
+            )
+
+        if index is not None:
+            return index
+
+        return next(
+            (i for i, c in self._comparators.items() if c.check(observed, subset)),
+            None,
+        )
+
+    def _iter_comparators(self) -> typing.Iterator[_definitions.Comparator]:
+        """Iterate over all of the options as comparators in their listed order."""
+        for index, option in enumerate(self.value["options"]):
+            yield self._comparators.get(index) or Equals(option)
+
+
+class OneOf(_Options):
     """Allows a matching comparison between any of the listed values."""
 
     def _compare(
@@ -135,13 +247,34 @@ class OneOf(_definitions.Comparator):
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
         """Succeeds if at least one of the options are equal."""
-        failures: typing.Dict[str, _definitions.Comparison] = {}
-        for index, option in enumerate(self.value["options"]):
-            if isinstance(option, _definitions.Comparator):
-                comparator = option
-            else:
-                comparator = Equals(option)
+        with _json.sharing(observed):
+            return self._compare_options(observed, subset)
+
+    def _compare_options(
+        self,
+        observed: typing.Any,
+        subset: bool = False,
+    ) -> typing.Union[_definitions.Comparison, bool]:
+        """Compare the observed value against the options until one matches."""
+        index = self._find(observed, subset)
+        if index is not None:
+            # The matching option found may be a plain scalar listed after
+            # comparators that match as well, of which the first is the result.
+            first = next(
+                (
+                    c
+                    for i, c in self._comparators.items()
+                    if i < index and c.check(observed, subset)
+                ),
+                None,
+            )
+            comparator = first or self._comparators.get(index)
+            if comparator is None:
+                comparator = Equals(self.value["options"][index])
+            return comparator.compare(observed, subset=subset)
 
+        failures: typing.Dict[str, _definitions.Comparison] = {}
+        for index, comparator in enumerate(self._iter_comparators()):
             result = comparator.compare(observed, subset=subset)
             if getattr(result, "success", result):
                 return result
@@ -163,6 +296,11 @@ class OneOf(_definitions.Comparator):
             observed=observed,
         )
 
+    def check(self, observed: typing.Any, subset: bool = False) -> bool:
+        """Determine if at least one of the options are equal."""
+        with _json.sharing(observed):
+            return self._find(observed, subset) is not None
+
     @classmethod
     def construct(cls, options: typing.List[typing.Any]) -> "OneOf":
         """Create a OneOf comparison operator with the specified options."""
@@ -174,7 +312,7 @@ class OneOf(_definitions.Comparator):
         return cls({"options": options})
 
 
-class NoneOf(_definitions.Comparator):
+class NoneOf(_Options):
     """Allows a mismatching comparison between none of the listed values."""
 
     def _compare(
@@ -183,12 +321,24 @@ class NoneOf(_definitions.Comparator):
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
         """Succeeds if none of the options are equal."""
-        for index, option in enumerate(self.value["options"]):
-            if isinstance(option, _definitions.Comparator):
-                comparator = option
-            else:
-                comparator = Equals(option)
+        with _json.sharing(observed):
+            return self._compare_options(observed, subset)
 
+    def _compare_options(
+        self,
+        observed: typing.Any,
+        subset: bool = False,
+    ) -> typing.Union[_definitions.Comparison, bool]:
+        """Compare the observed value against the options to find any matching."""
+        if self._find(observed, subset) is None:
+            return _definitions.Comparison(
+                operation="none_of",
+                success=True,
+                expected=self.value,
+                observed=observed,
+            )
+
+        for comparator in self._iter_comparators():
             result = comparator.compare(observed, subset=subset)
             if getattr(result, "success", False):
                 return _definitions.Comparison(
@@ -206,6 +356,11 @@ class NoneOf(_definitions.Comparator):
             observed=observed,
         )
 
+    def check(self, observed: typing.Any, subset: bool = False) -> bool:
+        """Determine if none of the options are equal."""
+        with _json.sharing(observed):
+            return self._find(observed, subset) is None
+
     @classmethod
     def construct(cls, options: typing.List[typing.Any]) -> "NoneOf":
         """Create a NoneOf comparison operator with the specified options."""
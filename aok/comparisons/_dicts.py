@@ -1,5 +1,5 @@
-import json
-import textwrap
+import copy
+import itertools
 import typing
 
 import yaml
@@ -7,15 +7,50 @@ import yaml.constructor
 
 import aok
 from aok import _definitions
+from aok import _json
+from aok import _loading
+from aok import _operations
+from aok import _records
+from aok import _rendering
+from aok import _traversal
 from aok import _types
 
+DictPlan = typing.Tuple[typing.Tuple[typing.Any, "_definitions.Comparator"], ...]
 
-def _compare_dicts(
+
+def _plan_dict(
+    expected: typing.Optional["_types.ArbitraryDict"],
+    comparators: typing.Iterable["_definitions.Comparator"],
+) -> DictPlan:
+    """Pair the expected dictionary keys with their compiled comparators."""
+    return tuple(zip((expected or {}).keys(), comparators))
+
+
+def _literal_dict(plan: DictPlan) -> int:
+    """Determine the literal depth of the dictionary from the compiled plan."""
+    return _operations.container_literal_depth(comparator for _, comparator in plan)
+
+
+def _pair_dicts(
     expected: "_types.ArbitraryDict",
     observed: typing.Any,
     subset: bool,
-) -> "_definitions.Comparison":
-    """Compare dictionaries recursively and returns the results as a Comparison."""
+    plan: typing.Optional[DictPlan] = None,
+    literal: int = 0,
+) -> "_types.Children":
+    """
+    Pair the expected comparators with the observed values of the dictionary.
+
+    When a compiled plan for the expected dictionary is specified, its comparators
+    are used directly instead of converting the expected values into comparators.
+    When the expected dictionary is literal, it is first compared natively and
+    no pairs are left to compare when that succeeds. Observed values of keys that
+    aren't expected are paired with None unless in subset mode.
+
+    :return:
+        The expected and observed dictionaries with the pairs to compare, or the
+        failed comparison when the observed value isn't a dictionary.
+    """
     expected_value = expected or {}
     observed_value = observed or {}
 
@@ -27,57 +62,174 @@ def _compare_dicts(
             observed=str(type(observed_value)),
         )
 
-    keys = set(list(expected_value.keys()))
-    if not subset:
-        keys.update(set(list(observed_value.keys())))
+    if literal and _operations.matches_literal(expected_value, observed_value, subset):
+        return expected_value, observed, ()
 
-    results: typing.Dict[typing.Any, _definitions.Comparison] = {
-        key: (
-            aok.to_comparator(expected_value.get(key)).compare(
-                observed_value.get(key), subset
-            )
+    if plan is None:
+        plan = tuple(
+            (key, aok.to_comparator(value)) for key, value in expected_value.items()
         )
-        for key in keys
-    }
-
-    return _definitions.Comparison(
-        operation="dict_comparison",
-        success=all([r.success for r in results.values()]),
-        expected=expected_value,
-        observed=observed,
-        children=results,
+
+    pairs = ((key, c, observed_value.get(key)) for key, c in plan)
+    if subset or observed_value.keys() <= expected_value.keys():
+        return expected_value, observed, pairs
+
+    unexpected = aok.to_comparator(None)
+    return (
+        expected_value,
+        observed,
+        itertools.chain(
+            pairs,
+            (
+                (key, unexpected, value)
+                for key, value in observed_value.items()
+                if key not in expected_value
+            ),
+        ),
+    )
+
+
+def _compare_dicts(
+    expected: "_types.ArbitraryDict",
+    observed: typing.Any,
+    subset: bool,
+    plan: typing.Optional[DictPlan] = None,
+    literal: int = 0,
+) -> "_definitions.Comparison":
+    """Compare dictionaries and their nested values into a Comparison."""
+    return _traversal.compare_children(
+        "dict_comparison",
+        _pair_dicts(expected, observed, subset, plan, literal),
+        subset,
+    )
+
+
+def _check_dicts(
+    expected: "_types.ArbitraryDict",
+    observed: typing.Any,
+    subset: bool,
+    plan: typing.Optional[DictPlan] = None,
+    literal: int = 0,
+) -> bool:
+    """Check dictionaries and their nested values, stopping at the first difference."""
+    return _traversal.check_children(
+        _pair_dicts(expected, observed, subset, plan, literal),
+        subset,
     )
 
 
 class Dict(_definitions.Comparator):
     """Main class in which aok assertions are made."""
 
+    _plan: typing.Optional[DictPlan] = None
+    _literal: int = 0
+    _container_operation = "dict_comparison"
+
+    @_traversal.traversed
+    def compile(self) -> "Dict":
+        """Resolve the expected values into compiled comparators ahead of time."""
+        return _traversal.compile_comparator(self)
+
+    def _expectations(self) -> typing.Iterable[typing.Any]:
+        """List the expected values to compile into the comparators of the plan."""
+        return (self.value or {}).values()
+
+    def _compiled(self, comparators: typing.List["_definitions.Comparator"]) -> "Dict":
+        """Create a compiled copy with the plan of the compiled comparators."""
+        compiled = copy.copy(self)
+        compiled._plan = _plan_dict(self.value, comparators)
+        compiled._literal = _literal_dict(compiled._plan)
+        return compiled
+
+    @_traversal.traversed
     def compare(
         self,
         observed: "_types.ArbitraryDict",
         subset: bool = False,
+        retain: str = "all",
     ) -> _definitions.Comparison:
-        """Compare the observed dictionary in a recursive fashion."""
+        """
+        Compare the observed dictionary in a recursive fashion.
+
+        :param observed:
+            Dictionary to compare against the expected one.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :param retain:
+            Which expected and observed values to retain in the results. One of
+            "all" for every value, "leaves" for only the values of the leaf
+            comparisons or "none" for only the failures and their values, which
+            all display the same differences.
+        """
         return _compare_dicts(
             expected=typing.cast(_types.ArbitraryDict, self.value or {}),
             observed=observed,
             subset=subset,
+            plan=self._plan,
+            literal=self._literal,
+        ).prune(retain)
+
+    @_traversal.traversed
+    def check(self, observed: "_types.ArbitraryDict", subset: bool = False) -> bool:
+        """Check the observed dictionary in a recursive, fail-fast fashion."""
+        return _check_dicts(
+            expected=typing.cast(_types.ArbitraryDict, self.value or {}),
+            observed=observed,
+            subset=subset,
+            plan=self._plan,
+            literal=self._literal,
+        )
+
+    def _children(
+        self, observed: typing.Any, subset: bool = False
+    ) -> "_types.Children":
+        """Pair the expected comparators with the observed values to compare."""
+        return _pair_dicts(
+            expected=typing.cast(_types.ArbitraryDict, self.value or {}),
+            observed=observed,
+            subset=subset,
+            plan=self._plan,
+            literal=self._literal,
         )
 
 
 class JsonDict(_definitions.Comparator):
     """Dictionary comparator for data stored as a JSON string."""
 
+    _plan: typing.Optional[DictPlan] = None
+    #: Whether the parsed dictionary can be compared natively, which isn't named
+    #: _literal since the serialized value is never equal to the expected one.
+    _parsed_literal: int = 0
+    _container_operation = "dict_comparison"
+
+    @_traversal.traversed
+    def compile(self) -> "JsonDict":
+        """Resolve the expected values into compiled comparators ahead of time."""
+        return _traversal.compile_comparator(self)
+
+    def _expectations(self) -> typing.Iterable[typing.Any]:
+        """List the expected values to compile into the comparators of the plan."""
+        return (self.value or {}).values()
+
+    def _compiled(
+        self, comparators: typing.List["_definitions.Comparator"]
+    ) -> "JsonDict":
+        """Create a compiled copy with the plan of the compiled comparators."""
+        compiled = copy.copy(self)
+        compiled._plan = _plan_dict(self.value, comparators)
+        compiled._parsed_literal = _literal_dict(compiled._plan)
+        return compiled
+
+    @_traversal.traversed
     def compare(
         self,
-        observed: str,
+        observed: "_json.Serialized",
         subset: bool = False,
     ) -> _definitions.Comparison:
         """Parse and compare the observed value."""
         try:
-            observed_parsed = json.loads(observed or "{}")
-            if not isinstance(observed_parsed, dict):
-                raise ValueError("Not a JSON-serialized dictionary.")
+            observed_parsed = self._parse(observed)
         except Exception as error:
             return _definitions.Comparison(
                 operation="json_dict",
@@ -91,8 +243,57 @@ class JsonDict(_definitions.Comparator):
             expected=typing.cast(_types.ArbitraryDict, self.value or {}),
             observed=observed_parsed,
             subset=subset,
+            plan=self._plan,
+            literal=self._parsed_literal,
+        )
+
+    @_traversal.traversed
+    def check(self, observed: "_json.Serialized", subset: bool = False) -> bool:
+        """Parse and check the observed value in a fail-fast fashion."""
+        try:
+            observed_parsed = self._parse(observed)
+        except Exception:
+            return False
+
+        return _check_dicts(
+            expected=typing.cast(_types.ArbitraryDict, self.value or {}),
+            observed=observed_parsed,
+            subset=subset,
+            plan=self._plan,
+            literal=self._parsed_literal,
         )
 
+    def _children(
+        self, observed: typing.Any, subset: bool = False
+    ) -> "_types.Children":
+        """Parse the observed value and pair it with the expected comparators."""
+        try:
+            observed_parsed = self._parse(observed)
+        except Exception as error:
+            return _definitions.Comparison(
+                operation="json_dict",
+                success=False,
+                expected=self.value,
+                observed=observed,
+                error=error,
+            )
+
+        return _pair_dicts(
+            expected=typing.cast(_types.ArbitraryDict, self.value or {}),
+            observed=observed_parsed,
+            subset=subset,
+            plan=self._plan,
+            literal=self._parsed_literal,
+        )
+
+    @staticmethod
+    def _parse(observed: "_json.Serialized") -> "_types.ArbitraryDict":
+        """Parse the JSON-serialized observed value into a dictionary."""
+        observed_parsed = _json.loads(observed or "{}")
+        if not isinstance(observed_parsed, dict):
+            raise ValueError("Not a JSON-serialized dictionary.")
+        return observed_parsed
+
     @classmethod
     def _from_yaml(cls, loader: yaml.Loader, node: yaml.Node) -> "JsonDict":
         """Load the dict from a yaml parser."""
@@ -128,11 +329,14 @@ class Okay(Dict):
             Optional assertion message to include when differences are found between
             the observed and expected data structures.
         """
+        if self.check(observed, subset=True):
+            return
+
         result = self.compare(observed, subset=True)
         heading = message or "One or more subset differences were found"
         assert result.success, "{}\n{}".format(
             heading,
-            textwrap.indent(result.to_diff_info() or "", "  "),
+            _rendering.render(result, indent="  "),
         )
 
     def assert_all(
@@ -153,13 +357,101 @@ class Okay(Dict):
             Optional assertion message to include when differences are found between
             the observed and expected data structures.
         """
+        if self.check(observed, subset=False):
+            return
+
         result = self.compare(observed, subset=False)
         heading = message or "One or more exact differences were found"
         assert result.success, "{}\n{}".format(
             heading,
-            textwrap.indent(result.to_diff_info() or "", "  "),
+            _rendering.render(result, indent="  "),
+        )
+
+    def compare_many(
+        self,
+        observed: typing.Iterable["_types.ArbitraryDict"],
+        subset: bool = False,
+        keep: str = "failures",
+        retain: str = "all",
+    ) -> "_records.RecordComparisons":
+        """
+        Compare each of the observed objects against the expected values.
+
+        The observed iterable is consumed lazily while iterating over the returned
+        object, which yields the record index and comparison of each result kept.
+        The number of records that passed and failed is counted as they go.
+
+        :param observed:
+            Iterable of data structures to compare against the expected one.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :param keep:
+            Which comparison results to yield while iterating. One of "failures"
+            for only the records that failed, "all" for every record or "none" to
+            only count the records that passed and failed.
+        :param retain:
+            Which expected and observed values to retain in the results kept. One
+            of "all", "leaves" or "none", as in `compare`.
+        :return:
+            A lazy iterator of record comparisons with running counts of results.
+        """
+        return _records.RecordComparisons(
+            self, observed, subset=subset, keep=keep, retain=retain
         )
 
+    def compare_compact(
+        self,
+        observed: "_types.ArbitraryDict",
+        subset: bool = False,
+    ) -> "_definitions.Comparison":
+        """
+        Compare the observed object against the expected values into compact results.
+
+        Instead of creating a comparison for every nested value, the results are
+        stored as flat arrays of the keys, operation codes and successes of the
+        nested values, and comparisons of the failing values are only created
+        when they are accessed. The returned comparison supports the same methods,
+        like `to_diff_data`, `failed_keys` and `iter_failures`, except that
+        passing values and containers have no expected or observed values.
+
+        :param observed:
+            Data structure to compare against the expected one.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :return:
+            A comparison viewing the compact results of the comparison.
+        """
+        from aok import _compact
+
+        return _compact.compare_compact(self, observed, subset=subset)
+
+    def compare_json_stream(
+        self,
+        source: "_types.Source",
+        subset: bool = False,
+    ) -> "_definitions.Comparison":
+        """
+        Compare a JSON document against the expected values while streaming it.
+
+        The document is read incrementally instead of being loaded into memory,
+        which makes it possible to validate documents larger than memory. In
+        subset mode, the values of keys that aren't expected are never built.
+
+        :param source:
+            Path to the JSON file, or a text or binary stream to read it from.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :return:
+            The comparison of the document, where streamed dictionaries and lists
+            have an observed value of None since they were never built.
+        """
+        from aok import _json_stream
+
+        return _json_stream.compare_json_stream(self, source, subset=subset)
+
     @classmethod
     def _from_yaml(cls, loader: yaml.Loader, node: yaml.Node) -> "Okay":
         """Load the dict from a yaml parser."""
@@ -173,9 +465,10 @@ class Okay(Dict):
     @classmethod
     def register(cls):
         """Override the registration in this case for base registration."""
-        yaml.add_constructor("!aok", Okay.parse_yaml)
+        _loading.add_constructor("!aok", Okay.parse_yaml)
 
 
 Okay.register()
 
 JsonDict.register()
+json_dict = getattr(JsonDict, "constructor", JsonDict)
@@ -1,22 +1,73 @@
-import json
-import textwrap
+import copy
+import itertools
 import typing
 
 import yaml
 import yaml.constructor
 
 import aok
+from aok import _align
 from aok import _definitions
+from aok import _json
+from aok import _loading
+from aok import _operations
+from aok import _records
+from aok import _rendering
+from aok import _traversal
 from aok import _types
 
+ListPlan = typing.Tuple["_definitions.Comparator", ...]
 
-def _compare_list(
+#: Number of the keys of list indexes that are created once and shared between
+#: the comparisons of all lists, instead of being created for each comparison.
+_SHARED_INDEX_KEYS = 1 << 16
+
+_index_keys: typing.List[str] = []
+
+
+def _compile_list(expected: typing.Optional["_types.ArbitraryList"]) -> ListPlan:
+    """Resolve the expected list values into compiled comparators."""
+    return tuple(aok.compile_comparator(value) for value in (expected or []))
+
+
+def _literal_list(plan: ListPlan) -> int:
+    """Determine the literal depth of the list from the compiled plan."""
+    return _operations.container_literal_depth(plan)
+
+
+def _iter_index_keys(count: int) -> typing.Iterator[str]:
+    """Iterate over the keys of the list indexes up to the count."""
+    shared = min(count, _SHARED_INDEX_KEYS)
+    if len(_index_keys) < shared:
+        _index_keys.extend(f"index_{i}" for i in range(len(_index_keys), shared))
+    if count == shared:
+        return itertools.islice(_index_keys, count)
+    return itertools.chain(
+        itertools.islice(_index_keys, shared),
+        (f"index_{i}" for i in range(shared, count)),
+    )
+
+
+def _pair_list(
     expected: "_types.ArbitraryList",
     observed: typing.Any,
     subset: bool,
     allowed_types: typing.Tuple[typing.Any, ...] = (list, tuple),
-) -> "_definitions.Comparison":
-    """Compare lists recursively and returns the results as a Comparison."""
+    plan: typing.Optional[ListPlan] = None,
+    literal: int = 0,
+) -> "_types.Children":
+    """
+    Pair the expected comparators with the observed values of the list.
+
+    When a compiled plan for the expected list is specified, its comparators are
+    used directly instead of converting the expected values into comparators.
+    When the expected list is literal, it is first compared natively and no pairs
+    are left to compare when that succeeds.
+
+    :return:
+        The expected and observed lists with the pairs to compare, or the failed
+        comparison when the observed value isn't a list of the expected length.
+    """
     expected_value = expected or []
     observed_value = observed or []
 
@@ -36,33 +87,122 @@ def _compare_list(
             observed=len(observed_value),
         )
 
-    results: typing.List[_definitions.Comparison] = [
-        aok.to_comparator(exp).compare(obs, subset)
-        for exp, obs in zip(expected_value, observed_value)
-    ]
+    if literal and _operations.matches_literal(expected_value, observed_value, subset):
+        return expected_value, observed, ()
+
+    comparators = plan or map(aok.to_comparator, expected_value)
+    pairs = zip(_iter_index_keys(len(observed_value)), comparators, observed_value)
+    return expected_value, observed, pairs
+
+
+def _compare_list(
+    expected: "_types.ArbitraryList",
+    observed: typing.Any,
+    subset: bool,
+    allowed_types: typing.Tuple[typing.Any, ...] = (list, tuple),
+    plan: typing.Optional[ListPlan] = None,
+    literal: int = 0,
+) -> "_definitions.Comparison":
+    """Compare lists and their nested values into a Comparison."""
+    return _traversal.compare_children(
+        "list_comparison",
+        _pair_list(expected, observed, subset, allowed_types, plan, literal),
+        subset,
+    )
+
 
-    return _definitions.Comparison(
-        operation="list_comparison",
-        success=all([r.success for r in results]),
-        expected=expected_value,
-        observed=observed,
-        children={f"index_{i}": r for i, r in enumerate(results)},
+def _check_list(
+    expected: "_types.ArbitraryList",
+    observed: typing.Any,
+    subset: bool,
+    allowed_types: typing.Tuple[typing.Any, ...] = (list, tuple),
+    plan: typing.Optional[ListPlan] = None,
+    literal: int = 0,
+) -> bool:
+    """Check lists and their nested values, stopping at the first difference found."""
+    return _traversal.check_children(
+        _pair_list(expected, observed, subset, allowed_types, plan, literal),
+        subset,
     )
 
 
 class List(_definitions.Comparator):
     """Container class for list comparisons, which compare the lists element-wise."""
 
+    _plan: typing.Optional[ListPlan] = None
+    _literal: int = 0
+    _container_operation = "list_comparison"
+
+    @_traversal.traversed
+    def compile(self) -> "List":
+        """Resolve the expected values into compiled comparators ahead of time."""
+        return _traversal.compile_comparator(self)
+
+    def _expectations(self) -> typing.Iterable[typing.Any]:
+        """List the expected values to compile into the comparators of the plan."""
+        return self.value or []
+
+    def _compiled(self, comparators: typing.List["_definitions.Comparator"]) -> "List":
+        """Create a compiled copy with the plan of the compiled comparators."""
+        compiled = copy.copy(self)
+        compiled._plan = tuple(comparators)
+        compiled._literal = _literal_list(compiled._plan)
+        return compiled
+
+    @_traversal.traversed
     def compare(
         self,
         observed: typing.Union[typing.List[typing.Any], typing.Tuple[typing.Any, ...]],
         subset: bool = False,
+        retain: str = "all",
     ) -> _definitions.Comparison:
-        """Compare the observed list in a recursive, element-wise fashion."""
+        """
+        Compare the observed list in a recursive, element-wise fashion.
+
+        :param observed:
+            List to compare against the expected one.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :param retain:
+            Which expected and observed values to retain in the results. One of
+            "all" for every value, "leaves" for only the values of the leaf
+            comparisons or "none" for only the failures and their values, which
+            all display the same differences.
+        """
         return _compare_list(
             expected=typing.cast(_types.ArbitraryList, self.value),
             observed=observed,
             subset=subset,
+            plan=self._plan,
+            literal=self._literal,
+        ).prune(retain)
+
+    @_traversal.traversed
+    def check(
+        self,
+        observed: typing.Union[typing.List[typing.Any], typing.Tuple[typing.Any, ...]],
+        subset: bool = False,
+    ) -> bool:
+        """Check the observed list in a recursive, fail-fast fashion."""
+        return _check_list(
+            expected=typing.cast(_types.ArbitraryList, self.value),
+            observed=observed,
+            subset=subset,
+            plan=self._plan,
+            literal=self._literal,
+        )
+
+    def _children(
+        self, observed: typing.Any, subset: bool = False
+    ) -> "_types.Children":
+        """Pair the expected comparators with the observed values to compare."""
+        return _pair_list(
+            expected=typing.cast(_types.ArbitraryList, self.value),
+            observed=observed,
+            subset=subset,
+            plan=self._plan,
+            literal=self._literal,
         )
 
 
@@ -74,6 +214,29 @@ class StrictList(_definitions.Comparator):
     tuple.
     """
 
+    _plan: typing.Optional[ListPlan] = None
+    _literal: int = 0
+    _container_operation = "list_comparison"
+
+    @_traversal.traversed
+    def compile(self) -> "StrictList":
+        """Resolve the expected values into compiled comparators ahead of time."""
+        return _traversal.compile_comparator(self)
+
+    def _expectations(self) -> typing.Iterable[typing.Any]:
+        """List the expected values to compile into the comparators of the plan."""
+        return self.value or []
+
+    def _compiled(
+        self, comparators: typing.List["_definitions.Comparator"]
+    ) -> "StrictList":
+        """Create a compiled copy with the plan of the compiled comparators."""
+        compiled = copy.copy(self)
+        compiled._plan = tuple(comparators)
+        compiled._literal = _literal_list(compiled._plan)
+        return compiled
+
+    @_traversal.traversed
     def compare(
         self,
         observed: typing.Union[typing.List[typing.Any], typing.Tuple[typing.Any, ...]],
@@ -85,22 +248,76 @@ class StrictList(_definitions.Comparator):
             observed=observed,
             subset=subset,
             allowed_types=(list,),
+            plan=self._plan,
+            literal=self._literal,
+        )
+
+    @_traversal.traversed
+    def check(
+        self,
+        observed: typing.Union[typing.List[typing.Any], typing.Tuple[typing.Any, ...]],
+        subset: bool = False,
+    ) -> bool:
+        """Check the observed list in a recursive, fail-fast fashion."""
+        return _check_list(
+            expected=typing.cast(_types.ArbitraryList, self.value),
+            observed=observed,
+            subset=subset,
+            allowed_types=(list,),
+            plan=self._plan,
+            literal=self._literal,
+        )
+
+    def _children(
+        self, observed: typing.Any, subset: bool = False
+    ) -> "_types.Children":
+        """Pair the expected comparators with the observed values to compare."""
+        return _pair_list(
+            expected=typing.cast(_types.ArbitraryList, self.value),
+            observed=observed,
+            subset=subset,
+            allowed_types=(list,),
+            plan=self._plan,
+            literal=self._literal,
         )
 
 
 class JsonList(_definitions.Comparator):
     """List comparator for data stored as a JSON string."""
 
+    _plan: typing.Optional[ListPlan] = None
+    #: Whether the parsed list can be compared natively, which isn't named
+    #: _literal since the serialized value is never equal to the expected one.
+    _parsed_literal: int = 0
+    _container_operation = "list_comparison"
+
+    @_traversal.traversed
+    def compile(self) -> "JsonList":
+        """Resolve the expected values into compiled comparators ahead of time."""
+        return _traversal.compile_comparator(self)
+
+    def _expectations(self) -> typing.Iterable[typing.Any]:
+        """List the expected values to compile into the comparators of the plan."""
+        return self.value or []
+
+    def _compiled(
+        self, comparators: typing.List["_definitions.Comparator"]
+    ) -> "JsonList":
+        """Create a compiled copy with the plan of the compiled comparators."""
+        compiled = copy.copy(self)
+        compiled._plan = tuple(comparators)
+        compiled._parsed_literal = _literal_list(compiled._plan)
+        return compiled
+
+    @_traversal.traversed
     def compare(
         self,
-        observed: str,
+        observed: "_json.Serialized",
         subset: bool = False,
     ) -> _definitions.Comparison:
         """Parse and compare the observed value."""
         try:
-            observed_parsed = json.loads(observed or "{}")
-            if not isinstance(observed_parsed, list):
-                raise ValueError("Not a JSON-serialized list.")
+            observed_parsed = self._parse(observed)
         except Exception as error:
             return _definitions.Comparison(
                 operation="json_dict",
@@ -114,8 +331,57 @@ class JsonList(_definitions.Comparator):
             expected=typing.cast(_types.ArbitraryList, self.value),
             observed=observed_parsed,
             subset=subset,
+            plan=self._plan,
+            literal=self._parsed_literal,
         )
 
+    @_traversal.traversed
+    def check(self, observed: "_json.Serialized", subset: bool = False) -> bool:
+        """Parse and check the observed value in a fail-fast fashion."""
+        try:
+            observed_parsed = self._parse(observed)
+        except Exception:
+            return False
+
+        return _check_list(
+            expected=typing.cast(_types.ArbitraryList, self.value),
+            observed=observed_parsed,
+            subset=subset,
+            plan=self._plan,
+            literal=self._parsed_literal,
+        )
+
+    def _children(
+        self, observed: typing.Any, subset: bool = False
+    ) -> "_types.Children":
+        """Parse the observed value and pair it with the expected comparators."""
+        try:
+            observed_parsed = self._parse(observed)
+        except Exception as error:
+            return _definitions.Comparison(
+                operation="json_dict",
+                success=False,
+                expected=self.value,
+                observed=observed,
+                error=error,
+            )
+
+        return _pair_list(
+            expected=typing.cast(_types.ArbitraryList, self.value),
+            observed=observed_parsed,
+            subset=subset,
+            plan=self._plan,
+            literal=self._parsed_literal,
+        )
+
+    @staticmethod
+    def _parse(observed: "_json.Serialized") -> typing.List[typing.Any]:
+        """Parse the JSON-serialized observed value into a list."""
+        observed_parsed = _json.loads(observed or "{}")
+        if not isinstance(observed_parsed, list):
+            raise ValueError("Not a JSON-serialized list.")
+        return observed_parsed
+
     @classmethod
     def _from_yaml(cls, loader: yaml.Loader, node: yaml.Node) -> "JsonList":
         """Load the list from a yaml parser."""
@@ -130,6 +396,26 @@ class JsonList(_definitions.Comparator):
 class Tuple(_definitions.Comparator):
     """Container class for tuple comparisons, which compare the tuples element-wise."""
 
+    _plan: typing.Optional[ListPlan] = None
+    _literal: int = 0
+
+    @_traversal.traversed
+    def compile(self) -> "Tuple":
+        """Resolve the expected values into compiled comparators ahead of time."""
+        return _traversal.compile_comparator(self)
+
+    def _expectations(self) -> typing.Iterable[typing.Any]:
+        """List the expected values to compile into the comparators of the plan."""
+        return self.value or ()
+
+    def _compiled(self, comparators: typing.List["_definitions.Comparator"]) -> "Tuple":
+        """Create a compiled copy with the plan of the compiled comparators."""
+        compiled = copy.copy(self)
+        compiled._plan = tuple(comparators)
+        compiled._literal = _literal_list(compiled._plan)
+        return compiled
+
+    @_traversal.traversed
     def compare(
         self,
         observed: typing.Tuple[typing.Any, ...],
@@ -140,6 +426,14 @@ class Tuple(_definitions.Comparator):
 
         The comparison is carried out in a recursive, element-wise fashion.
         """
+        return _traversal.compare_children(
+            self.operation_name(), self._children(observed, subset), subset
+        )
+
+    def _children(
+        self, observed: typing.Any, subset: bool = False
+    ) -> "_types.Children":
+        """Pair the expected comparators with the observed values to compare."""
         value = typing.cast(typing.Tuple[typing.Any, ...], self.value or tuple())
         other = observed or tuple()
 
@@ -151,19 +445,567 @@ class Tuple(_definitions.Comparator):
                 observed=len(other),
             )
 
-        results: typing.List[_definitions.Comparison] = [
-            aok.to_comparator(exp).compare(obs, subset)
-            for exp, obs in zip(value, other)
-        ]
+        if self._literal and _operations.matches_literal(value, other, subset):
+            return self.value, observed, ()
+
+        comparators = self._plan or map(aok.to_comparator, value)
+        return (
+            self.value,
+            observed,
+            zip(_iter_index_keys(len(other)), comparators, other),
+        )
+
+    @_traversal.traversed
+    def check(
+        self,
+        observed: typing.Tuple[typing.Any, ...],
+        subset: bool = False,
+    ) -> bool:
+        """Check the observed tuple in a recursive, fail-fast fashion."""
+        return _traversal.check_children(self._children(observed, subset), subset)
+
+
+class Aligned(_definitions.Comparator):
+    """
+    Container class for list comparisons that align the elements before comparing.
+
+    The expected and observed elements are aligned with the fewest insertions and
+    deletions, matching them with the expected comparators, so an element that
+    is missing or inserted in a long list is reported on its own instead of the
+    lengths differing or every following element mismatching. When more than
+    max_edits edits would be needed, the lists are compared element-wise.
+    """
+
+    _plan: typing.Optional[ListPlan] = None
+
+    def __init__(self, value: "_types.ArbitraryList", max_edits: int = 1000):
+        """Create the comparison with the maximum number of edits to align with."""
+        super(Aligned, self).__init__(value)
+        self.max_edits = max_edits
+
+    def compile(self) -> "Aligned":
+        """Resolve the expected values into compiled comparators ahead of time."""
+        compiled = copy.copy(self)
+        compiled._plan = _compile_list(self.value)
+        return compiled
+
+    def compare(
+        self,
+        observed: typing.Union[typing.List[typing.Any], typing.Tuple[typing.Any, ...]],
+        subset: bool = False,
+    ) -> _definitions.Comparison:
+        """Compare the observed list after aligning it with the expected one."""
+        expected_value = self.value or []
+        observed_value = observed or []
+        if not isinstance(observed_value, (list, tuple)):
+            return _definitions.Comparison(
+                operation="list_type",
+                success=False,
+                expected=str(type(expected_value)),
+                observed=str(type(observed_value)),
+            )
+
+        comparators = self._plan or tuple(map(aok.to_comparator, expected_value))
+        edits = _align.align(
+            len(expected_value),
+            len(observed_value),
+            lambda i, j: comparators[i].check(observed_value[j], subset),
+            self.max_edits,
+        )
+        if edits is None:
+            return _compare_list(
+                expected=expected_value,
+                observed=observed,
+                subset=subset,
+                plan=comparators,
+            )
+
+        children: typing.Dict[str, _definitions.Comparison] = {}
+        deleted: typing.List[int] = []
+        inserted: typing.List[int] = []
+        for operation, i, j in edits + [(_align.EQUAL, -1, -1)]:
+            if operation == _align.DELETE:
+                deleted.append(i)
+                continue
+            if operation == _align.INSERT:
+                inserted.append(j)
+                continue
+
+            for di, ij in zip(deleted, inserted):
+                children[f"index_{di}"] = comparators[di].compare(
+                    observed_value[ij], subset
+                )
+            for di in deleted[len(inserted) :]:
+                children[f"missing_{di}"] = _definitions.Comparison(
+                    operation="aligned_missing",
+                    success=False,
+                    expected=expected_value[di],
+                    observed=None,
+                )
+            for ij in inserted[len(deleted) :]:
+                children[f"inserted_{ij}"] = _definitions.Comparison(
+                    operation="aligned_inserted",
+                    success=False,
+                    expected=None,
+                    observed=observed_value[ij],
+                )
+            deleted.clear()
+            inserted.clear()
 
         return _definitions.Comparison(
             operation=self.operation_name(),
-            success=all([r.success for r in results]),
+            success=not children,
             expected=self.value,
             observed=observed,
-            children={f"index_{i}": r for i, r in enumerate(results)},
+            children=children,
+        )
+
+    def check(
+        self,
+        observed: typing.Union[typing.List[typing.Any], typing.Tuple[typing.Any, ...]],
+        subset: bool = False,
+    ) -> bool:
+        """Check the observed list, which must match element-wise to pass."""
+        return _check_list(
+            expected=typing.cast(_types.ArbitraryList, self.value),
+            observed=observed,
+            subset=subset,
+            plan=self._plan,
         )
 
+    @classmethod
+    def _from_yaml(cls, loader: yaml.Loader, node: yaml.Node) -> "Aligned":
+        """Load the list from a yaml parser."""
+        return cls(loader.construct_sequence(node, deep=True))
+
+
+class Each(_definitions.Comparator):
+    """
+    Container class comparing every element of a list against one expectation.
+
+    The expectation is resolved into a single comparator that is reused for all
+    elements, so the expected list doesn't need to be as long as the observed
+    one. Only the elements that fail are kept as children of the comparison, and
+    checking stops at the first failing element.
+    """
+
+    def __init__(
+        self,
+        expectation: typing.Any,
+        min_len: typing.Optional[int] = None,
+        max_len: typing.Optional[int] = None,
+    ):
+        """Create the comparison with the expectation for every element."""
+        super(Each, self).__init__(
+            {"expectation": expectation, "min_len": min_len, "max_len": max_len}
+        )
+        self._comparator = aok.to_comparator(expectation)
+
+    def compile(self) -> "Each":
+        """Resolve the expectation into a compiled comparator ahead of time."""
+        compiled = copy.copy(self)
+        compiled._comparator = self._comparator.compile()
+        return compiled
+
+    def _compare_length(
+        self,
+        observed: typing.Any,
+    ) -> typing.Optional[_definitions.Comparison]:
+        """Compare the type and length of the observed list, if they differ."""
+        if not isinstance(observed, (list, tuple)):
+            return _definitions.Comparison(
+                operation="list_type",
+                success=False,
+                expected=str(list),
+                observed=str(type(observed)),
+            )
+
+        min_len = self.value["min_len"]
+        max_len = self.value["max_len"]
+        if (min_len is not None and len(observed) < min_len) or (
+            max_len is not None and len(observed) > max_len
+        ):
+            return _definitions.Comparison(
+                operation="each_length",
+                success=False,
+                expected={"min_len": min_len, "max_len": max_len},
+                observed=len(observed),
+            )
+
+        return None
+
+    def compare(
+        self,
+        observed: typing.Union[typing.List[typing.Any], typing.Tuple[typing.Any, ...]],
+        subset: bool = False,
+    ) -> _definitions.Comparison:
+        """Compare each of the observed elements against the expectation."""
+        observed_value = observed or []
+        failed = self._compare_length(observed_value)
+        if failed is not None:
+            return failed
+
+        comparator = self._comparator
+        children = {
+            f"index_{i}": comparator.compare(value, subset)
+            for i, value in enumerate(observed_value)
+            if not comparator.check(value, subset)
+        }
+        return _definitions.Comparison(
+            operation=self.operation_name(),
+            success=not children,
+            expected=self.value,
+            observed=observed,
+            children=children,
+        )
+
+    def check(
+        self,
+        observed: typing.Union[typing.List[typing.Any], typing.Tuple[typing.Any, ...]],
+        subset: bool = False,
+    ) -> bool:
+        """Check each of the observed elements, stopping at the first failure."""
+        observed_value = observed or []
+        if self._compare_length(observed_value) is not None:
+            return False
+
+        check = self._comparator.check
+        return all(check(value, subset) for value in observed_value)
+
+    @classmethod
+    def _from_yaml(cls, loader: yaml.Loader, node: yaml.Node) -> "Each":
+        """
+        Load the comparator from a yaml parser.
+
+        A mapping with an expectation key specifies the expectation along with the
+        optional min_len and max_len. Any other node is the expectation itself.
+        """
+        if isinstance(node, yaml.MappingNode):
+            loaded = loader.construct_mapping(node, deep=True)
+            if "expectation" in loaded:
+                return cls(**loaded)
+            return cls(loaded)
+
+        if isinstance(node, yaml.SequenceNode):
+            return cls(loader.construct_sequence(node, deep=True))
+
+        return cls(loader.construct_scalar(typing.cast(yaml.ScalarNode, node)))
+
+
+_UNFROZEN = object()
+
+
+def _freeze(value: typing.Any) -> typing.Any:
+    """
+    Convert plain nested data into a hashable key for matching it by hashing.
+
+    Values holding comparators or any objects other than dictionaries, lists,
+    tuples and plain scalars cannot be frozen and return the unfrozen sentinel.
+    """
+    if type(value) in _operations.LITERAL_TYPES:
+        return value
+
+    if isinstance(value, (list, tuple)):
+        items = tuple(_freeze(v) for v in value)
+        return _UNFROZEN if _UNFROZEN in items else ("list", items)
+
+    if isinstance(value, dict):
+        members = tuple((k, _freeze(v)) for k, v in value.items())
+        if any(frozen is _UNFROZEN for _, frozen in members):
+            return _UNFROZEN
+        try:
+            return "dict", frozenset(members)
+        except TypeError:
+            return _UNFROZEN
+
+    return _UNFROZEN
+
+
+class Unordered(_definitions.Comparator):
+    """
+    Container class for list comparisons that ignore the order of the elements.
+
+    Each expected element must match a distinct observed element. Plain scalar
+    elements are paired first by hashing their compatible casts and, when
+    comparing exactly, plain nested data is paired by hashing its contents.
+    Those pairs seed a bipartite matching with augmenting paths, which matches
+    the elements left over against the expected comparators and reassigns the
+    hashed pairs when that is needed to match more elements. The expected and
+    observed elements that remain unmatched are reported.
+    """
+
+    _derived = ("_literals", "_structures")
+    _plan: typing.Optional[ListPlan] = None
+
+    def _derive(self) -> None:
+        """Index the plain scalar and nested data elements by their hash keys."""
+        self._literals: typing.Dict[type, typing.Dict[typing.Any, typing.List[int]]]
+        self._literals = {t: {} for t in _operations.LITERAL_TYPES}
+        self._structures: typing.Dict[typing.Any, typing.List[int]] = {}
+        for index, value in enumerate(self.value or []):
+            if type(value) in _operations.LITERAL_TYPES:
+                for observed_type, casted in _operations.precast(value).items():
+                    self._literals[observed_type].setdefault(casted, []).append(index)
+                continue
+
+            frozen = _freeze(value)
+            if frozen is not _UNFROZEN:
+                self._structures.setdefault(frozen, []).append(index)
+
+    def compile(self) -> "Unordered":
+        """Resolve the expected values into compiled comparators ahead of time."""
+        compiled = copy.copy(self)
+        compiled._plan = _compile_list(self.value)
+        return compiled
+
+    def _comparators(self) -> typing.Callable[[int], "_definitions.Comparator"]:
+        """Create a lookup of the comparators for the expected elements."""
+        if self._plan is not None:
+            return self._plan.__getitem__
+
+        expected = self.value or []
+        created: typing.Dict[int, _definitions.Comparator] = {}
+
+        def _get(index: int) -> _definitions.Comparator:
+            if index not in created:
+                created[index] = aok.to_comparator(expected[index])
+            return created[index]
+
+        return _get
+
+    def _match(
+        self,
+        observed: typing.Sequence[typing.Any],
+        subset: bool,
+    ) -> typing.Tuple[typing.List[int], typing.List[int]]:
+        """
+        Match the observed elements with the expected ones.
+
+        :return:
+            The indexes of the expected and the observed elements that could not
+            be matched with one another.
+        """
+        expected = self.value or []
+        comparator = self._comparators()
+        seeded: typing.Dict[int, int] = {}
+        taken = [False] * len(expected)
+        buckets: typing.Dict[typing.Tuple[type, typing.Any], typing.List[int]] = {}
+
+        def _seed(candidates: typing.Optional[typing.List[int]], j: int) -> None:
+            for index in candidates or ():
+                if not taken[index] and (
+                    type(expected[index]) in _operations.LITERAL_TYPES
+                    or comparator(index).check(observed[j], subset)
+                ):
+                    taken[index] = True
+                    seeded[j] = index
+                    return
+
+        for j, value in enumerate(observed):
+            literals = self._literals.get(type(value))
+            if literals is not None:
+                buckets.setdefault((type(value), value), []).append(j)
+                _seed(literals.get(value), j)
+            elif not subset and self._structures:
+                frozen = _freeze(value)
+                if frozen is not _UNFROZEN:
+                    _seed(self._structures.get(frozen), j)
+
+        def _candidates(i: int) -> typing.Optional[typing.List[int]]:
+            # Plain scalars only match the observed elements in their buckets.
+            if type(expected[i]) not in _operations.LITERAL_TYPES:
+                return None
+            return [
+                j
+                for key in _operations.precast(expected[i]).items()
+                for j in buckets.get(key, ())
+            ]
+
+        # The hashed pairs only seed the matching, remaining edges that the
+        # augmenting paths can reassign when an element they paired is needed
+        # by another one that has no other match.
+        owners = _bipartite_match(
+            list(range(len(expected))),
+            list(range(len(observed))),
+            lambda i, j: (
+                type(expected[i]) in _operations.LITERAL_TYPES
+                or comparator(i).check(observed[j], subset)
+            ),
+            seeded,
+            _candidates,
+        )
+        matched = set(owners.values())
+        return (
+            [i for i in range(len(expected)) if i not in matched],
+            [j for j in range(len(observed)) if j not in owners],
+        )
+
+    def compare(
+        self,
+        observed: typing.Union[typing.List[typing.Any], typing.Tuple[typing.Any, ...]],
+        subset: bool = False,
+    ) -> _definitions.Comparison:
+        """Compare the observed list regardless of the order of its elements."""
+        expected_value = self.value or []
+        observed_value = observed or []
+        if not isinstance(observed_value, (list, tuple)):
+            return _definitions.Comparison(
+                operation="list_type",
+                success=False,
+                expected=str(type(expected_value)),
+                observed=str(type(observed_value)),
+            )
+
+        missing, unexpected = self._match(observed_value, subset)
+        children = {
+            f"expected_{i}": _definitions.Comparison(
+                operation="unordered_missing",
+                success=False,
+                expected=expected_value[i],
+                observed=None,
+            )
+            for i in missing
+        }
+        children.update(
+            {
+                f"observed_{j}": _definitions.Comparison(
+                    operation="unordered_unexpected",
+                    success=False,
+                    expected=None,
+                    observed=observed_value[j],
+                )
+                for j in unexpected
+            }
+        )
+        return _definitions.Comparison(
+            operation=self.operation_name(),
+            success=not children,
+            expected=self.value,
+            observed=observed,
+            children=children,
+        )
+
+    def check(
+        self,
+        observed: typing.Union[typing.List[typing.Any], typing.Tuple[typing.Any, ...]],
+        subset: bool = False,
+    ) -> bool:
+        """Check the observed list regardless of the order of its elements."""
+        expected_value = self.value or []
+        observed_value = observed or []
+        if not isinstance(observed_value, (list, tuple)):
+            return False
+        if len(expected_value) != len(observed_value):
+            return False
+
+        missing, unexpected = self._match(observed_value, subset)
+        return not missing and not unexpected
+
+    @classmethod
+    def _from_yaml(cls, loader: yaml.Loader, node: yaml.Node) -> "Unordered":
+        """Load the list from a yaml parser."""
+        return cls(value=loader.construct_sequence(node, deep=True))
+
+
+def _bipartite_match(
+    left: typing.List[int],
+    right: typing.List[int],
+    matches: typing.Callable[[int, int], bool],
+    seed: typing.Optional[typing.Dict[int, int]] = None,
+    candidates: typing.Optional[
+        typing.Callable[[int], typing.Optional[typing.List[int]]]
+    ] = None,
+) -> typing.Dict[int, int]:
+    """
+    Find a maximum matching between the left and right items.
+
+    Starting from the seeded pairs, each other left item is first paired
+    greedily with the first free right item it matches, and those that cannot
+    be are then paired by searching for augmenting paths (Kuhn's algorithm),
+    with an explicit stack instead of recursion. Seeded pairs are ordinary
+    edges of the matching, which these searches can reassign. The edges of a
+    left item are only evaluated in full when it is part of such a search.
+
+    :param seed:
+        The left item already paired with each of some right items, which must
+        be edges of the matching.
+    :param candidates:
+        The right items that a left item may match, which are the only ones
+        it is matched against, or None for all of them.
+    :return:
+        The left item matched with each of the matched right items.
+    """
+    owners: typing.Dict[int, int] = dict(seed or {})
+    if not left or not right:
+        return owners
+
+    pools: typing.Dict[int, typing.Optional[typing.List[int]]] = {}
+
+    def _pool(i: int) -> typing.Optional[typing.List[int]]:
+        if i not in pools:
+            pools[i] = candidates(i) if candidates else None
+        return pools[i]
+
+    paired = set(owners.values())
+    free = dict.fromkeys(j for j in right if j not in owners)
+    unpaired = []
+    for i in left:
+        if i in paired:
+            continue
+        pool = _pool(i)
+        j = next(
+            (
+                j
+                for j in (free if pool is None else pool)
+                if j in free and matches(i, j)
+            ),
+            None,
+        )
+        if j is None:
+            unpaired.append(i)
+        else:
+            owners[j] = i
+            del free[j]
+
+    edges: typing.Dict[int, typing.List[int]] = {}
+
+    def _edges(i: int) -> typing.List[int]:
+        if i not in edges:
+            pool = _pool(i)
+            edges[i] = [j for j in (right if pool is None else pool) if matches(i, j)]
+        return edges[i]
+
+    for root in unpaired:
+        if not free:
+            break
+
+        visited: typing.Set[int] = set()
+        stack: typing.List[typing.Tuple[int, typing.Iterator[int]]] = [
+            (root, iter(_edges(root)))
+        ]
+        path: typing.List[int] = []
+        while stack:
+            i, targets = stack[-1]
+            j = next((j for j in targets if j not in visited), None)
+            if j is None:
+                stack.pop()
+                if path:
+                    path.pop()
+                continue
+
+            visited.add(j)
+            path.append(j)
+            if j in owners:
+                stack.append((owners[j], iter(_edges(owners[j]))))
+                continue
+
+            for (owner, _), target in zip(stack, path):
+                owners[target] = owner
+            del free[j]
+            break
+
+    return owners
+
 
 class OkayList(List):
     """Root list object for comparison."""
@@ -185,11 +1027,14 @@ class OkayList(List):
             Optional assertion message to include when differences are found between
             the observed and expected data structures.
         """
+        if self.check(observed, subset=True):
+            return
+
         result = self.compare(observed, subset=True)
         heading = message or "One or more subset differences were found"
         assert result.success, "{}\n{}".format(
             heading,
-            textwrap.indent(result.to_diff_info() or "", "  "),
+            _rendering.render(result, indent="  "),
         )
 
     def assert_all(self, observed: "_types.ArbitraryList", message: str = None):
@@ -206,13 +1051,101 @@ class OkayList(List):
             Optional assertion message to include when differences are found between
             the observed and expected data structures.
         """
+        if self.check(observed, subset=False):
+            return
+
         result = self.compare(observed, subset=False)
         heading = message or "One or more exact differences were found"
         assert result.success, "{}\n{}".format(
             heading,
-            textwrap.indent(result.to_diff_info() or "", "  "),
+            _rendering.render(result, indent="  "),
         )
 
+    def compare_many(
+        self,
+        observed: typing.Iterable["_types.ArbitraryList"],
+        subset: bool = False,
+        keep: str = "failures",
+        retain: str = "all",
+    ) -> "_records.RecordComparisons":
+        """
+        Compare each of the observed objects against the expected values.
+
+        The observed iterable is consumed lazily while iterating over the returned
+        object, which yields the record index and comparison of each result kept.
+        The number of records that passed and failed is counted as they go.
+
+        :param observed:
+            Iterable of data structures to compare against the expected one.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :param keep:
+            Which comparison results to yield while iterating. One of "failures"
+            for only the records that failed, "all" for every record or "none" to
+            only count the records that passed and failed.
+        :param retain:
+            Which expected and observed values to retain in the results kept. One
+            of "all", "leaves" or "none", as in `compare`.
+        :return:
+            A lazy iterator of record comparisons with running counts of results.
+        """
+        return _records.RecordComparisons(
+            self, observed, subset=subset, keep=keep, retain=retain
+        )
+
+    def compare_compact(
+        self,
+        observed: "_types.ArbitraryList",
+        subset: bool = False,
+    ) -> "_definitions.Comparison":
+        """
+        Compare the observed object against the expected values into compact results.
+
+        Instead of creating a comparison for every nested value, the results are
+        stored as flat arrays of the keys, operation codes and successes of the
+        nested values, and comparisons of the failing values are only created
+        when they are accessed. The returned comparison supports the same methods,
+        like `to_diff_data`, `failed_keys` and `iter_failures`, except that
+        passing values and containers have no expected or observed values.
+
+        :param observed:
+            Data structure to compare against the expected one.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :return:
+            A comparison viewing the compact results of the comparison.
+        """
+        from aok import _compact
+
+        return _compact.compare_compact(self, observed, subset=subset)
+
+    def compare_json_stream(
+        self,
+        source: "_types.Source",
+        subset: bool = False,
+    ) -> "_definitions.Comparison":
+        """
+        Compare a JSON document against the expected values while streaming it.
+
+        The document is read incrementally instead of being loaded into memory,
+        which makes it possible to validate documents larger than memory. In
+        subset mode, the values of keys that aren't expected are never built.
+
+        :param source:
+            Path to the JSON file, or a text or binary stream to read it from.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :return:
+            The comparison of the document, where streamed dictionaries and lists
+            have an observed value of None since they were never built.
+        """
+        from aok import _json_stream
+
+        return _json_stream.compare_json_stream(self, source, subset=subset)
+
     @classmethod
     def _from_yaml(cls, loader: yaml.Loader, node: yaml.Node) -> "OkayList":
         """Load the list from a yaml parser."""
@@ -226,7 +1159,7 @@ class OkayList(List):
     @classmethod
     def register(cls):
         """Override the registration in this case for base registration."""
-        yaml.add_constructor("!aok_list", cls.parse_yaml)
+        _loading.add_constructor("!aok_list", cls.parse_yaml)
 
 
 OkayList.register()
@@ -234,5 +1167,14 @@ List.register()
 StrictList.register()
 Tuple.register()
 
+Aligned.register()
+aligned = getattr(Aligned, "constructor", Aligned)
+
+Each.register()
+each = getattr(Each, "constructor", Each)
+
+Unordered.register()
+unordered = getattr(Unordered, "constructor", Unordered)
+
 JsonList.register()
 json_list = getattr(JsonList, "constructor", JsonList)
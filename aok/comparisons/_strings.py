@@ -1,4 +1,4 @@
-import fnmatch
+import os
 import re
 import typing
 
@@ -10,51 +10,87 @@ from aok import _definitions
 class Like(_definitions.Comparator):
     """Compares strings using unix-shell wildcard like regexes."""
 
+    _derived = ("pattern",)
+
+    def _derive(self) -> None:
+        """Compile the wildcard pattern."""
+        import fnmatch
+
+        self.pattern: typing.Pattern[str] = re.compile(
+            fnmatch.translate(os.path.normcase(self.value))
+        )
+
     def _compare(
         self,
         observed: typing.Any,
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
-        return fnmatch.fnmatch(observed, self.value)
+        return self.pattern.match(os.path.normcase(observed)) is not None
 
     @classmethod
     def _from_yaml(cls, loader: yaml.Loader, node: yaml.Node) -> "Like":
-        value: str = loader.construct_python_str(node)
+        value: str = loader.construct_scalar(node)
         return cls(value)
 
 
 class LikeCase(_definitions.Comparator):
     """Compares strings using unix-shell wildcard like regexes."""
 
+    _derived = ("pattern",)
+
+    def _derive(self) -> None:
+        """Compile the wildcard pattern."""
+        import fnmatch
+
+        self.pattern: typing.Pattern[str] = re.compile(fnmatch.translate(self.value))
+
     def _compare(
         self,
         observed: typing.Any,
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
-        return fnmatch.fnmatchcase(observed, self.value)
+        return self.pattern.match(observed) is not None
 
     @classmethod
     def _from_yaml(cls, loader: yaml.Loader, node: yaml.Node) -> "LikeCase":
-        value: str = loader.construct_python_str(node)
+        value: str = loader.construct_scalar(node)
         return cls(value)
 
 
 class Match(_definitions.Comparator):
     """Compare strings using the compiled regex."""
 
+    _derived = ("pattern",)
+
+    def __init__(self, value: typing.Union[str, typing.Dict[str, typing.Any]]):
+        """
+        Create a match comparison object with its regular expression compiled.
+
+        The value is either the regular expression string or a dictionary with
+        the "regex" string and optional "flags" to compile it with.
+        """
+        if isinstance(value, str):
+            value = {"regex": value}
+        super(Match, self).__init__(value)
+
+    def _derive(self) -> None:
+        """Compile the regular expression."""
+        self.pattern: typing.Pattern[str] = re.compile(
+            self.value["regex"], flags=self.value.get("flags", 0)
+        )
+
     def _compare(
         self,
         observed: typing.Any,
         subset: bool = False,
     ) -> typing.Union[_definitions.Comparison, bool]:
         """Determine if the value matches the regular expression."""
-        pattern = re.compile(self.value["regex"], flags=self.value.get("flags", 0))
-        return pattern.match(observed) is not None
+        return self.pattern.match(observed) is not None
 
     @classmethod
     def _from_yaml(cls, loader: yaml.Loader, node: yaml.Node) -> "Match":
         if isinstance(node, yaml.ScalarNode):
-            regex = loader.construct_python_str(node)
+            regex = loader.construct_scalar(node)
             value = {"regex": regex}
         else:
             value = loader.construct_mapping(node, deep=True)
@@ -0,0 +1,205 @@
+"""Parallel comparisons of records across a pool of worker processes."""
+
+import collections
+import itertools
+import os
+import typing
+
+from aok import _definitions
+from aok import _records
+
+#: Expected values of the worker process, set once when the worker starts.
+_expected: typing.Optional["_definitions.Comparator"] = None
+
+ChunkResult = typing.Tuple[
+    int, int, typing.List[typing.Tuple[int, "_definitions.Comparison"]]
+]
+
+
+def _initialize(expected: "_definitions.Comparator"):
+    """Store the expected values sent to the worker process when it starts."""
+    global _expected
+    _expected = expected
+
+
+def _compare_chunk(
+    start: int,
+    records: typing.List[typing.Any],
+    subset: bool,
+    keep: str,
+    retain: str,
+) -> ChunkResult:
+    """Compare a chunk of records within a worker process."""
+    comparator = typing.cast(_definitions.Comparator, _expected)
+    results = _records.RecordComparisons(comparator, records, subset, keep, retain)
+    kept = [(start + index, result) for index, result in results]
+    return results.passed, results.failed, kept
+
+
+def _chunk(
+    records: typing.Iterable[typing.Any],
+    size: int,
+) -> typing.Iterator[typing.List[typing.Any]]:
+    """Split the records lazily into lists of the specified size."""
+    iterator = iter(records)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ParallelRecordComparisons(_records.RecordComparisons):
+    """
+    Lazily compares records against the same expected values in worker processes.
+
+    The expected values are sent to each worker process once when it starts, and
+    the records are streamed to them in chunks. A bounded number of chunks are in
+    flight at any time and their results are yielded in record order.
+    """
+
+    def __init__(
+        self,
+        comparator: "_definitions.Comparator",
+        records: typing.Iterable[typing.Any],
+        subset: bool = False,
+        keep: str = "failures",
+        retain: str = "all",
+        workers: typing.Optional[int] = None,
+        chunksize: int = 1000,
+    ):
+        """
+        Create a lazy parallel comparison of the records against the comparator.
+
+        :param comparator:
+            Comparator containing the expected values for every record.
+        :param records:
+            Iterable of records to compare, which is consumed lazily.
+        :param subset:
+            When true, any extra keys/values found in dictionaries will be ignored
+            and assumed to be insignificant. Set to false for exact matching.
+        :param keep:
+            Which comparison results to yield while iterating. One of "failures"
+            for only the records that failed, "all" for every record or "none" to
+            only count the records that passed and failed.
+        :param retain:
+            Which expected and observed values to retain in the results kept. One
+            of "all", "leaves" or "none", as in `RecordComparisons`, which are
+            pruned within the worker processes before they are sent back.
+        :param workers:
+            Number of worker processes to compare with, which defaults to the
+            number of CPUs available.
+        :param chunksize:
+            Number of records to send to a worker process at a time.
+        """
+        if chunksize < 1:
+            raise ValueError(f"Chunk size must be at least 1, not {chunksize}.")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        super(ParallelRecordComparisons, self).__init__(
+            comparator=comparator,
+            records=records,
+            subset=subset,
+            keep=keep,
+            retain=retain,
+        )
+
+    def _compare_records(
+        self,
+        records: typing.Iterable[typing.Any],
+    ) -> typing.Iterator[typing.Tuple[int, "_definitions.Comparison"]]:
+        """Compare the records in worker processes, yielding the results kept."""
+        from concurrent import futures
+
+        executor = futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_initialize,
+            initargs=(self.comparator,),
+        )
+        pending: typing.Deque[futures.Future] = collections.deque()
+        try:
+            start = 0
+            for chunk in _chunk(records, self.chunksize):
+                pending.append(
+                    executor.submit(
+                        _compare_chunk,
+                        start,
+                        chunk,
+                        self.subset,
+                        self.keep,
+                        self.retain,
+                    )
+                )
+                start += len(chunk)
+                if len(pending) >= 2 * self.workers:
+                    yield from self._collect(pending.popleft())
+
+            while pending:
+                yield from self._collect(pending.popleft())
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _collect(
+        self,
+        future: "typing.Any",
+    ) -> typing.List[typing.Tuple[int, "_definitions.Comparison"]]:
+        """Wait for the chunk results and add them to the running counts."""
+        passed, failed, kept = future.result()
+        self.passed += passed
+        self.failed += failed
+        return kept
+
+
+def validate(
+    expected: "_definitions.Comparator",
+    records: typing.Iterable[typing.Any],
+    workers: typing.Optional[int] = None,
+    chunksize: int = 1000,
+    subset: bool = False,
+    keep: str = "failures",
+    retain: str = "all",
+) -> ParallelRecordComparisons:
+    """
+    Compare each of the records against the expected values in worker processes.
+
+    The expected values are compiled and sent to each worker process once, after
+    which the records are consumed lazily and streamed to the workers in chunks
+    while iterating over the returned object. It yields the record index and the
+    comparison of each result kept in record order, and counts the number of
+    records that passed and failed as it goes.
+
+    :param expected:
+        Root object, e.g. `aok.Okay`, containing the expected values.
+    :param records:
+        Iterable of records to compare against the expected values.
+    :param workers:
+        Number of worker processes to compare with, which defaults to the number
+        of CPUs available.
+    :param chunksize:
+        Number of records to send to a worker process at a time.
+    :param subset:
+        When true, any extra keys/values found in dictionaries will be ignored
+        and assumed to be insignificant. Set to false for exact matching.
+    :param keep:
+        Which comparison results to yield while iterating. One of "failures" for
+        only the records that failed, "all" for every record or "none" to only
+        count the records that passed and failed.
+    :param retain:
+        Which expected and observed values to retain in the results kept. One of
+        "all", "leaves" or "none", as in `compare`, which are pruned within the
+        worker processes before they are sent back.
+    :return:
+        A lazy iterator of record comparisons with running counts of results.
+    """
+    return ParallelRecordComparisons(
+        comparator=expected.compile(),
+        records=records,
+        subset=subset,
+        keep=keep,
+        retain=retain,
+        workers=workers,
+        chunksize=chunksize,
+    )
@@ -0,0 +1,19 @@
+import json
+import pathlib
+
+from benchmarks import __main__ as benchmarks
+
+
+def test_benchmarks(tmp_path: pathlib.Path):
+    """Should run every benchmark case and save the results for comparison."""
+    output = tmp_path.joinpath("results.json")
+    arguments = ["--repeat", "1", "--scale", "0.01", "--output", str(output)]
+    assert benchmarks.main(arguments) == 0
+
+    results = json.loads(output.read_text())
+    assert "compare_deep_dict" in results["cases"]
+    assert all(case["best"] >= 0 for case in results["cases"].values())
+
+    arguments = ["--repeat", "1", "--scale", "0.01", "--compare", str(output)]
+    assert benchmarks.main(arguments + ["check_*"]) == 0
+    assert benchmarks.main(arguments + ["unknown"]) == 2
@@ -0,0 +1,72 @@
+import typing
+
+import aok
+from aok import _definitions
+from aok.comparisons import _dicts
+
+
+class _Counting(aok.Equals):
+    """Equality comparator that counts the values it has been called with."""
+
+    calls: typing.List[typing.Any] = []
+
+    def _compare(
+        self,
+        observed: typing.Any,
+        subset: bool = False,
+    ) -> typing.Union[_definitions.Comparison, bool]:
+        self.calls.append(observed)
+        return super(_Counting, self)._compare(observed, subset)
+
+
+def test_check_fail_fast():
+    """Should stop checking at the first difference found."""
+    _Counting.calls = []
+    ok = aok.Okay({"a": _Counting(1), "b": _Counting(2), "c": [_Counting(3)]})
+
+    assert not ok.check({"a": 0, "b": 2, "c": [3]})
+    assert _Counting.calls == [0]
+
+    assert ok.check({"a": 1, "b": 2, "c": [3]})
+    assert ok.compile().check({"a": 1, "b": 2, "c": (3,)})
+    assert _Counting.calls == [0, 1, 2, 3, 1, 2, 3]
+
+
+def test_check_exact():
+    """Should fail checks for unexpected keys unless in subset mode."""
+    ok = aok.Okay({"a": aok.one_of.construct([1, 2]), "b": aok.none_of.construct([3])})
+    assert ok.check({"a": 2, "b": 4})
+    assert not ok.check({"a": 2, "b": 4, "c": 5})
+    assert ok.check({"a": 2, "b": 4, "c": 5}, subset=True)
+    assert not ok.check({"a": 2, "b": 3})
+
+
+def test_check_errors():
+    """Should fail checks that raise errors instead of raising them."""
+    assert not aok.greater(12).check("a")
+    assert not _dicts.JsonDict({"a": 1}).check("not json")
+    assert not aok.JsonList([1]).check('{"a": 1}')
+    assert aok.JsonList([1]).check("[1]")
+
+
+class _Even(_definitions.Comparator):
+    """Comparator overriding compare alone, passing even numbers."""
+
+    def compare(
+        self, observed: typing.Any, subset: bool = False
+    ) -> _definitions.Comparison:
+        return _definitions.Comparison(
+            operation="even",
+            success=isinstance(observed, int) and observed % 2 == 0,
+            expected=None,
+            observed=observed,
+        )
+
+
+def test_check_overridden_compare():
+    """Should check comparators that only override compare with it."""
+    assert _Even(None).check(2)
+    assert not _Even(None).check(3)
+
+    results = aok.Okay({"a": _Even(None)}).compare_many([{"a": 3}, {"a": 2}]).consume()
+    assert (results.passed, results.failed) == (1, 1)
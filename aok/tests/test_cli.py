@@ -0,0 +1,139 @@
+import io
+import json
+import pathlib
+import typing
+
+import pytest
+
+from aok import _cli
+
+EXPECTATION = """
+!aok
+id: !aok.greater_or_equal 0
+name: !aok.like a*
+"""
+
+
+@pytest.fixture(name="expectation")
+def expectation_fixture(tmp_path: pathlib.Path) -> str:
+    """Write the expectation file to compare records against."""
+    path = tmp_path.joinpath("expectation.yaml")
+    path.write_text(EXPECTATION)
+    return str(path)
+
+
+@pytest.mark.parametrize("extension", [".jsonl", ".json", ".yaml"])
+def test_validate(
+    expectation: str,
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture,
+    extension: str,
+):
+    """Should write a line for each failing record and a summary."""
+    records = [{"id": i, "name": "alpha" if i % 4 else "beta"} for i in range(10)]
+    path = tmp_path.joinpath(f"records{extension}")
+    if extension == ".yaml":
+        path.write_text("\n---\n".join(json.dumps(r) for r in records))
+    else:
+        path.write_text("\n".join(json.dumps(r) for r in records))
+
+    assert _cli.main(["validate", expectation, str(path)]) == 1
+
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        f"{path}:0: name",
+        f"{path}:4: name",
+        f"{path}:8: name",
+    ]
+    assert captured.err.strip() == "7 passed, 3 failed of 10 records"
+
+
+def test_validate_stdin(
+    expectation: str,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+):
+    """Should read records from stdin and pass in subset mode."""
+    stdin = io.StringIO('{"id": 1, "name": "a", "x": 1}\n\n{"id": 2, "name": "ab"}\n')
+    monkeypatch.setattr("sys.stdin", stdin)
+
+    assert _cli.main(["validate", expectation, "--subset"]) == 0
+    assert capsys.readouterr().err.strip() == "2 passed, 0 failed of 2 records"
+
+
+def test_validate_json_stream(monkeypatch: pytest.MonkeyPatch):
+    """Should parse concatenated JSON documents split across reads."""
+    monkeypatch.setattr(_cli, "_CHUNK_SIZE", 3)
+    stream = io.StringIO('{"a": 12345} [1, 2]\n"text" 678')
+    assert list(_cli._iter_json(stream)) == [{"a": 12345}, [1, 2], "text", 678]
+
+    with pytest.raises(_cli.InputError):
+        list(_cli._iter_json(io.StringIO('{"a": 1} {"b"')))
+
+
+def test_validate_json_large_record(monkeypatch: pytest.MonkeyPatch):
+    """Should parse records spanning many reads with a growing number of reads."""
+    monkeypatch.setattr(_cli, "_CHUNK_SIZE", 16)
+    record = {"values": list(range(2000)), "name": "x" * 1000}
+    stream = io.StringIO(json.dumps(record) + " 1")
+    reads: typing.List[int] = []
+    read = stream.read
+
+    def _read(size: int) -> str:
+        reads.append(size)
+        return read(size)
+
+    monkeypatch.setattr(stream, "read", _read)
+
+    assert list(_cli._iter_json(stream)) == [record, 1]
+    assert len(reads) < 20
+
+
+def test_validate_json_malformed(monkeypatch: pytest.MonkeyPatch):
+    """Should fail on malformed records without reading the rest of the stream."""
+    monkeypatch.setattr(_cli, "_CHUNK_SIZE", 16)
+    stream = io.StringIO('{"a": 1} {"b" 2}' + " " * 1000 + "3")
+    records = _cli._iter_json(stream)
+    assert next(records) == {"a": 1}
+
+    with pytest.raises(_cli.InputError, match="char 14"):
+        next(records)
+    assert stream.tell() < 100
+
+
+def test_validate_json_array(
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Should only read the elements of arrays as records when specified."""
+    monkeypatch.setattr(_cli, "_CHUNK_SIZE", 4)
+    expectation = tmp_path.joinpath("expectation.yaml")
+    expectation.write_text("!aok_list [1, !aok.greater 1]")
+    path = tmp_path.joinpath("records.json")
+
+    path.write_text("[1, 2]\n[1, 3]")
+    assert _cli.main(["validate", str(expectation), str(path)]) == 0
+    assert capsys.readouterr().err.strip() == "2 passed, 0 failed of 2 records"
+
+    path.write_text(" [[1, 2], [1, 0]]\n")
+    arguments = ["validate", str(expectation), str(path), "--format", "json-array"]
+    assert _cli.main(arguments) == 1
+    captured = capsys.readouterr()
+    assert captured.out.strip() == f"{path}:1: index_1"
+    assert captured.err.strip() == "1 passed, 1 failed of 2 records"
+
+    path.write_text("[[1, 2]] [3]")
+    assert _cli.main(arguments) == 2
+
+
+def test_validate_errors(expectation: str, tmp_path: pathlib.Path):
+    """Should exit with an error code when the files cannot be read."""
+    path = tmp_path.joinpath("records.jsonl")
+    path.write_text("{not json}")
+    assert _cli.main(["validate", expectation, str(path)]) == 2
+
+    not_root = tmp_path.joinpath("not_root.yaml")
+    not_root.write_text("a: 1")
+    assert _cli.main(["validate", str(not_root), str(path)]) == 2
+    assert _cli.main(["validate", expectation, str(tmp_path.joinpath("x"))]) == 2
@@ -0,0 +1,129 @@
+import inspect
+import pickle
+import typing
+
+import pytest
+
+import aok
+
+
+class _Custom(aok.Equals):
+    """Equality comparator subclass that must not be inlined."""
+
+    def _compare(self, observed: typing.Any, subset: bool = False) -> bool:
+        return observed == self.value * 2
+
+
+EXPECTED = aok.Okay(
+    {
+        "id": aok.greater_or_equal(1),
+        "name": aok.like("al*"),
+        "code": aok.match(r"[A-Z]{3}$"),
+        "score": aok.Between({"min": 0, "max": "100"}),
+        "count": "12",
+        "flag": "true",
+        "status": aok.one_of.construct(["new", "done"]),
+        "note": aok.optional(),
+        "owner": aok.not_null(),
+        "extra": aok.anything(),
+        "custom": _Custom(2),
+        "tags": ["a", aok.unequals("b")],
+        "pair": (1, 2),
+        "strict": aok.StrictList([1]),
+        "nested": {"deep": {"value": aok.less_or_equal(3.5)}},
+        "payload": aok.json_dict({"x": aok.less(10)}),
+        "items": aok.json_list([1, 2]),
+    }
+)
+
+OBSERVED = {
+    "id": 3,
+    "name": "alice",
+    "code": "ABC",
+    "score": 55,
+    "count": 12,
+    "flag": True,
+    "status": "done",
+    "note": None,
+    "owner": "bob",
+    "extra": object(),
+    "custom": 4,
+    "tags": ("a", "c"),
+    "pair": [1, 2],
+    "strict": [1],
+    "nested": {"deep": {"value": 3.5}},
+    "payload": '{"x": 9}',
+    "items": b"[1, 2]",
+}
+
+CHANGES: typing.List[typing.Dict[str, typing.Any]] = [
+    {},
+    {"id": 0},
+    {"id": "a"},
+    {"name": "bob"},
+    {"code": "ABCD"},
+    {"score": 101},
+    {"count": "12"},
+    {"count": 13},
+    {"flag": False},
+    {"status": "old"},
+    {"note": 1},
+    {"owner": None},
+    {"extra": None},
+    {"custom": 2},
+    {"tags": ["a", "b"]},
+    {"tags": ["a"]},
+    {"tags": "ab"},
+    {"pair": (1,)},
+    {"strict": (1,)},
+    {"nested": {"deep": {"value": 4}}},
+    {"nested": {"deep": {"value": 3, "other": None}}},
+    {"nested": {"deep": {"value": 3, "other": 1}}},
+    {"nested": None},
+    {"payload": '{"x": 10}'},
+    {"payload": "[]"},
+    {"payload": "not json"},
+    {"items": "[1]"},
+    {"unexpected": None},
+    {"unexpected": 1},
+]
+
+
+@pytest.mark.parametrize("subset", [False, True])
+@pytest.mark.parametrize("changes", CHANGES)
+def test_codegen_equivalent(changes: typing.Dict[str, typing.Any], subset: bool):
+    """Should validate observed values the same way as the check method."""
+    observed = {**OBSERVED, **changes}
+    validate = aok.codegen(EXPECTED, subset=subset)
+    assert validate(observed) == EXPECTED.check(observed, subset=subset)
+
+
+def test_codegen_roots():
+    """Should generate validators for lists, plain values and empty roots."""
+    assert aok.codegen(aok.OkayList([1, {"a": 2}]))([1, {"a": 2}])
+    assert not aok.codegen(aok.OkayList([1, {"a": 2}]))([1, {"a": 3}])
+    assert aok.codegen({"a": [1]})({"a": [1]})
+    assert aok.codegen(aok.Okay({}))(None)
+    assert not aok.codegen(aok.Okay({}))({"a": 1})
+    assert not aok.codegen(aok.Okay({"a": 1}))([1])
+
+
+def test_codegen_cached():
+    """Should cache the validators on the expectation without pickling them."""
+    expected = aok.Okay({"a": aok.like("x*")})
+    validate = aok.codegen(expected)
+    assert aok.codegen(expected) is validate
+    assert aok.codegen(expected, subset=True) is not validate
+    assert "_validators" not in expected.compile().__dict__
+
+    restored = pickle.loads(pickle.dumps(expected))
+    assert "_validators" not in restored.__dict__
+    assert aok.codegen(restored)({"a": "xyz"})
+
+
+def test_codegen_source():
+    """Should inline the built-in comparisons and call the others."""
+    expected = aok.Okay({"a": aok.greater(3), "b": aok.one_of.construct([1, 2])})
+    source = inspect.getsource(aok.codegen(expected))
+    assert "3 < v" in source
+    assert ".check(" in source
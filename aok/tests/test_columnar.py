@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+import aok
+
+numpy = pytest.importorskip("numpy")
+columnar = pytest.importorskip("aok.columnar")
+
+VALUES = [0, 1, 5, 10, 2.5, -3, True, False, None, "5", "a", 2**60, [1], {"a": 1}]
+
+
+def _record(generator: random.Random) -> dict:
+    """Create a random record with a mixture of valid and invalid values."""
+    record = {
+        "id": generator.choice(VALUES),
+        "score": generator.choice(VALUES),
+        "nested": generator.choice([{"rank": generator.choice(VALUES)}, None, 12]),
+        "name": generator.choice(["alpha", "beta", 1]),
+    }
+    if generator.random() < 0.1:
+        record.pop("score")
+    if generator.random() < 0.1:
+        record["extra"] = generator.choice(VALUES)
+    return record
+
+
+@pytest.mark.parametrize("subset", [False, True])
+def test_compare_batch(subset: bool):
+    """Should give the same results as comparing each record individually."""
+    ok = aok.Okay(
+        {
+            "id": aok.greater_or_equal(1),
+            "score": aok.Between.construct(0, 6),
+            "nested": {"rank": aok.less(10)},
+            "name": aok.like("a*"),
+        }
+    )
+    generator = random.Random(7)
+    records = [_record(generator) for _ in range(500)]
+
+    result = columnar.compare_batch(ok, records, subset=subset)
+
+    expected = [ok.check(record, subset) for record in records]
+    assert result.mask.tolist() == expected
+    assert result.passed == sum(expected)
+    assert sorted(result.failures) == [i for i, e in enumerate(expected) if not e]
+    for index, comparison in result.failures.items():
+        assert (
+            comparison.failed_keys() == ok.compare(records[index], subset).failed_keys()
+        )
+
+
+def test_compare_batch_columns():
+    """Should evaluate each of the vectorized comparators."""
+    ok = aok.Okay(
+        {
+            "a": aok.equals(2),
+            "b": aok.greater(1.5),
+            "c": aok.less_or_equal(3),
+            "d": aok.not_null(),
+        }
+    )
+    records = [{"a": i, "b": i, "c": i, "d": i or None} for i in range(5)]
+
+    result = columnar.compare_batch(ok, records)
+    assert result.mask.tolist() == [False, False, True, False, False]
+    assert result.failures[0].failed_keys() == {"a", "b", "d"}
+    assert not result.success
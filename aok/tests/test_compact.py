@@ -0,0 +1,98 @@
+import typing
+
+import pytest
+
+import aok
+from aok import _compact
+
+
+class _Loose(aok.Dict):
+    """Dictionary comparator that always compares in subset mode."""
+
+    def compare(
+        self, observed: typing.Any, subset: bool = False, retain: str = "all"
+    ) -> typing.Any:
+        return super(_Loose, self).compare(observed, True, retain)
+
+    def check(self, observed: typing.Any, subset: bool = False) -> bool:
+        return super(_Loose, self).check(observed, True)
+
+
+EXPECTED = {
+    "a": 1,
+    "b": [1, {"c": aok.greater(3), "d": "x"}],
+    "e": aok.unordered([1, 2]),
+    "f": aok.json_dict({"g": 1}),
+    "h": (1, aok.not_null()),
+    "i": {"j": {"k": [1, 2]}},
+    "l": _Loose({"x": 1}),
+}
+
+SCENARIOS: typing.List[typing.Tuple[typing.Any, bool]] = [
+    ({"a": 1, "b": [1, {"c": 4, "d": "x"}], "e": [2, 1], "f": '{"g": 1}'}, False),
+    ({"a": 1, "b": [1, {"c": 4, "d": "x"}], "e": [2, 1], "f": '{"g": 1}'}, True),
+    ({"a": 2, "b": [1, {"c": 2}], "e": [3], "f": "[]", "h": (1, None)}, False),
+    ({"a": 2, "b": [1], "e": [1, 2], "f": "{", "i": {"j": {"k": [1, 3]}}}, True),
+    ({"a": 1, "b": {}, "e": None, "f": '{"g": 2}', "z": 1}, False),
+    ({"a": 1, "b": None, "i": {"j": []}}, True),
+    ({"a": 1, "l": {"x": 1, "y": 2}}, False),
+    ({"a": 1, "l": {"x": 2, "y": 2}}, False),
+    ([], False),
+]
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+@pytest.mark.parametrize("observed, subset", SCENARIOS)
+def test_compare_compact(observed: typing.Any, subset: bool, compiled: bool):
+    """Should produce the same results as the full comparison."""
+    ok: typing.Any = aok.Okay(EXPECTED)
+    if compiled:
+        ok = ok.compile()
+
+    full = ok.compare(observed, subset=subset)
+    compact = ok.compare_compact(observed, subset=subset)
+
+    assert compact.success == full.success
+    assert compact.operation == full.operation
+    assert compact.to_diff_data() == full.to_diff_data()
+    assert compact.to_diff_info() == full.to_diff_info()
+    assert compact.failed_keys() == full.failed_keys()
+    assert compact.to_report() == full.to_report()
+    assert [p for p, _ in compact.iter_failures(max_depth=2)] == [
+        p for p, _ in full.iter_failures(max_depth=2)
+    ]
+
+
+def test_compare_compact_views():
+    """Should view the nodes of the compact results as comparisons."""
+    ok = aok.OkayList([{"a": 1, "b": aok.less(3)}, [1, 2]])
+    result = ok.compare_compact([{"a": 1, "b": 4}, [1, 2]])
+
+    assert isinstance(result, _compact.CompactComparison)
+    assert list(result.children) == ["index_0", "index_1"]
+    assert result.children["index_1"].success
+    assert result.children["index_1"].observed is None
+    assert result.get("index_0.a").success
+
+    failure = result.get(("index_0", "b"))
+    assert failure.operation == "less"
+    assert failure.observed == 4
+    assert result.get("index_0.b") is failure
+    assert result.prune("none") is result
+
+
+def test_compact_results_storage():
+    """Should only keep the comparators and values of the failing leaves."""
+    comparator = aok.compile_comparator({"a": [1, 2, 3], "b": {"c": 1, "d": 2}})
+    results = _compact.CompactResults.collect(
+        comparator, {"a": [1, 0, 3], "b": {"c": 1, "d": 2}}
+    )
+
+    # The literal dictionary matches natively and so has no children stored.
+    assert len(results) == 6
+    assert results.keys == [None, "a", "b", "index_0", "index_1", "index_2"]
+    assert list(results.successes) == [0, 0, 1, 1, 0, 1]
+    assert list(results.failures) == [4]
+    assert list(results.iter_failing_children(1)) == [4]
+    assert results.is_leaf(4)
+    assert not results.is_leaf(2)
@@ -0,0 +1,70 @@
+import pickle
+import random
+
+import yaml
+
+import aok
+from aok import _align
+
+
+def test_align():
+    """Should align the elements with the fewest edits in order."""
+    expected = list("abcabba")
+    observed = list("cbabac")
+    edits = _align.align(
+        len(expected), len(observed), lambda i, j: expected[i] == observed[j]
+    )
+    assert edits is not None
+    assert len([e for e in edits if e[0] != _align.EQUAL]) == 5
+    assert [i for o, i, _ in edits if o != _align.INSERT] == list(range(7))
+    assert [j for o, _, j in edits if o != _align.DELETE] == list(range(6))
+    assert _align.align(7, 6, lambda i, j: expected[i] == observed[j], 4) is None
+
+
+def test_aligned():
+    """Should report the inserted, missing and mismatched elements."""
+    expected = list(range(10000))
+    observed = list(expected)
+    observed.insert(5000, "x")
+    del observed[100]
+    observed[9000] = -1
+
+    comparator = aok.aligned(expected)
+    for candidate in (comparator, comparator.compile()):
+        result = candidate.compare(observed)
+        assert result.failed_keys() == {"missing_100", "inserted_4999", "index_9000"}
+        assert result.children["inserted_4999"].observed == "x"
+        assert result.children["index_9000"].observed == -1
+        assert not candidate.check(observed)
+
+    assert comparator.compare(expected).success
+    assert comparator.check(expected)
+    assert pickle.loads(pickle.dumps(comparator)).compare(observed).children
+
+
+def test_aligned_comparators():
+    """Should align the elements using the expected comparators."""
+    comparator = aok.aligned([{"id": 1}, {"id": aok.greater(1)}, aok.anything()])
+    result = comparator.compare([{"id": 1, "x": 0}, {"id": 0}, {"id": 5}, None])
+    assert not result.success
+    assert comparator.compare([{"id": 1, "x": 0}, {"id": 5}, 0], subset=True).success
+    assert comparator.compare(None).operation == "aligned"
+    assert comparator.compare({}).success is False
+
+
+def test_aligned_cutoff():
+    """Should compare element-wise when the lists need too many edits to align."""
+    shuffled = list(range(200))
+    random.Random(3).shuffle(shuffled)
+
+    result = aok.Aligned(list(range(200)), max_edits=10).compare(shuffled)
+    assert result.operation == "list_comparison"
+    result = aok.Aligned(list(range(200)), max_edits=10).compare(shuffled + [1])
+    assert result.operation == "list_length"
+
+
+def test_aligned_yaml():
+    """Should load the aligned comparator from yaml."""
+    loaded = yaml.full_load("!aok\nitems: !aok.aligned [1, 2, 3]")
+    assert loaded.compare({"items": [1, 2, 3]}).success
+    assert loaded.compare({"items": [1, 3]}).failed_keys() == {"items.missing_1"}
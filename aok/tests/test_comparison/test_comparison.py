@@ -4,6 +4,7 @@ import pytest
 import yaml
 
 import aok
+from aok._definitions import Comparison
 
 path = pathlib.Path(__file__).parent.joinpath("scenario.yaml")
 
@@ -24,3 +25,79 @@ def test_comparison_exact():
     okay: aok.Okay = scenario["expected"]
     with pytest.raises(AssertionError):
         okay.assert_all(scenario["observed"])
+
+
+def test_iter_failures():
+    """Should lazily yield the failing leaf comparisons in path order."""
+    scenario = yaml.full_load(path.read_text())
+    result = scenario["expected"].compare(scenario["observed"])
+
+    failures = list(result.iter_failures())
+    assert failures
+    assert {".".join(str(k) for k in p) for p, _ in failures} == result.failed_keys()
+    for keys, leaf in failures:
+        assert not leaf.success
+        assert result.get(keys) is leaf
+        assert result.get(".".join(str(k) for k in keys)) is leaf
+
+
+def test_iter_failures_deep():
+    """Should walk deeply nested failures without recursing."""
+    result = Comparison("equals", False, 1, 2)
+    for index in range(10000):
+        result = Comparison("list_comparison", False, [], [], {index: result})
+
+    keys, leaf = next(result.iter_failures())
+    assert len(keys) == 10000
+    assert leaf.operation == "equals"
+    assert result.get(keys) is leaf
+    assert len(next(result.iter_failures(max_depth=3))[0]) == 3
+    assert len(result.failed_keys()) == 1
+
+
+def test_get():
+    """Should fetch nested comparisons by their path."""
+    result = aok.Okay({"a": [{"b": 1}], 2: "x"}).compare({"a": [{"b": 2}], 2: "y"})
+    assert result.get(("a", "index_0", "b")).observed == 2
+    assert result.get("a.index_0.b").observed == 2
+    assert result.get("2").observed == "y"
+    assert result.get("") is result
+    with pytest.raises(KeyError):
+        result.get("a.index_1")
+
+
+@pytest.mark.parametrize("retain", ["all", "leaves", "none"])
+def test_compare_retain(retain: str):
+    """Should display the same failures whatever the values retained."""
+    scenario = yaml.full_load(path.read_text())
+    okay: aok.Okay = scenario["expected"]
+    expected = okay.compare(scenario["observed"])
+    result = okay.compare(scenario["observed"], retain=retain)
+
+    assert result.to_diff_info() == expected.to_diff_info()
+    assert result.to_report() == expected.to_report()
+    assert result.failed_keys() == expected.failed_keys()
+    assert (result.expected is None) == (retain != "all")
+
+
+def test_prune():
+    """Should only retain the values of the leaves or failures."""
+    ok = aok.Okay({"a": {"b": 1, "c": 2}, "d": aok.none_of.construct([{"e": 3}])})
+    observed = {"a": {"b": 1, "c": 3}, "d": {"e": 3}}
+
+    result = ok.compare(observed, retain="leaves")
+    assert result.observed is None
+    assert result.get("a").observed is None
+    assert result.get("a.b").observed == 1
+    assert result.get("a.c").observed == 3
+    assert result.get("d").observed == {"e": 3}
+
+    result = ok.compare(observed).prune("none")
+    assert list(result.children) == ["a", "d"]
+    assert list(result.get("a").children) == ["c"]
+    assert result.get("d").observed == {"e": 3}
+    assert result.to_diff_data() == ok.compare(observed).to_diff_data()
+
+    assert ok.compare(observed, subset=True, retain="all").get("a").observed
+    with pytest.raises(ValueError):
+        ok.compare(observed, retain="some")
@@ -0,0 +1,60 @@
+import pickle
+import typing
+
+import yaml
+from pytest import mark
+
+import aok
+
+EACH_SCENARIOS: typing.Tuple[typing.Tuple[typing.Any, ...], ...] = (
+    (aok.each(aok.greater(0)), [1, 2, 3], True),
+    (aok.each(aok.greater(0)), (1, 0), False),
+    (aok.each({"a": 1}), [{"a": 1}, {"a": 1}], True),
+    (aok.each(1), None, True),
+    (aok.each(1, min_len=1), [], False),
+    (aok.each(1, max_len=2), [1, 1, 1], False),
+    (aok.each(1, min_len=1, max_len=2), [1, 1], True),
+    (aok.each(1), {"a": 1}, False),
+)
+
+
+@mark.parametrize("comparator, observed, success", EACH_SCENARIOS)
+def test_each(comparator: aok.Each, observed: typing.Any, success: bool):
+    """Should compare every element against the same expectation."""
+    assert comparator.compare(observed).success == success
+    assert comparator.check(observed) == success
+    assert comparator.compile().check(observed) == success
+    assert pickle.loads(pickle.dumps(comparator)).check(observed) == success
+
+
+def test_each_failures():
+    """Should only keep the comparisons of the failing elements."""
+    observed = [{"id": i} for i in range(100000)]
+    observed[5] = {"id": -1}
+    observed[70000] = {"id": "x"}
+
+    result = aok.each({"id": aok.greater_or_equal(0)}).compile().compare(observed)
+    assert not result.success
+    assert list(result.children) == ["index_5", "index_70000"]
+    assert result.failed_keys() == {"index_5.id", "index_70000.id"}
+
+
+def test_each_subset():
+    """Should compare the elements as subsets in subset mode."""
+    comparator = aok.each({"a": 1})
+    assert not comparator.check([{"a": 1, "b": 2}])
+    assert comparator.check([{"a": 1, "b": 2}], subset=True)
+
+
+def test_each_yaml():
+    """Should load the expectation from a mapping or from the node itself."""
+    loaded = yaml.full_load("""
+        !aok
+        ids: !aok.each
+          expectation: !aok.greater 0
+          min_len: 1
+        items: !aok.each {a: 1}
+        """)
+    assert loaded.check({"ids": [1, 2], "items": [{"a": 1}]})
+    assert not loaded.check({"ids": [], "items": []})
+    assert not loaded.check({"ids": [1], "items": [{"a": 2}]})
@@ -0,0 +1,69 @@
+import itertools
+import typing
+
+from pytest import mark
+
+import aok
+from aok import _definitions
+
+OPTIONS = ["1", 2, 3.5, True, None, "abc", "false", [1, 2], {"a": 1}, aok.like("x*")]
+OBSERVED = [1, "1", 2, 2.0, "2", 3.5, "3.5", True, False, None, "abc", "xyz", [1, 2]]
+
+
+def _reference_one_of(options: typing.List[typing.Any], observed: typing.Any) -> bool:
+    """Brute-force one-of comparison made against each option in turn."""
+    for option in options:
+        if not isinstance(option, _definitions.Comparator):
+            option = aok.Equals(option)
+        if option.compare(observed).success:
+            return True
+    return False
+
+
+@mark.parametrize("observed", OBSERVED)
+@mark.parametrize("count", [1, 3, len(OPTIONS)])
+def test_indexed_options(observed: typing.Any, count: int):
+    """Should match the observed values in the same way as a brute-force search."""
+    for options in itertools.permutations(OPTIONS, count):
+        expected = _reference_one_of(list(options), observed)
+        one_of = aok.OneOf.construct(list(options))
+        none_of = aok.NoneOf.construct(list(options))
+        for comparator in (one_of, one_of.compile()):
+            assert comparator.check(observed) == expected
+            assert comparator.compare(observed).success == expected
+        for comparator in (none_of, none_of.compile()):
+            assert comparator.check(observed) != expected
+            assert comparator.compare(observed).success != expected
+        if count > 1:
+            break
+
+
+def test_one_of_many():
+    """Should find the observed value among many options and report failures."""
+    comparator = aok.OneOf.construct([f"SKU-{i}" for i in range(5000)])
+    assert comparator.check("SKU-4999")
+    assert comparator.compare("SKU-4999").expected == "SKU-4999"
+
+    result = aok.OneOf.construct(["a", 2, aok.like("b*")]).compare("c")
+    assert not result.success
+    assert result.expected == "(0) a, (1) 2, (2) b*"
+
+
+def test_one_of_first_match():
+    """Should result in the first matching option in their listed order."""
+    comparator = aok.OneOf.construct(["a", aok.like("b*"), "bar"])
+    for result in (comparator.compare("bar"), comparator.compile().compare("bar")):
+        assert result.success
+        assert result.operation == "like"
+        assert result.expected == "b*"
+
+    result = aok.OneOf.construct(["bar", aok.like("b*")]).compare("bar")
+    assert result.operation == "equals"
+
+
+def test_none_of_failure():
+    """Should report the first matching option as the failure."""
+    result = aok.NoneOf.construct(["a", aok.like("b*"), "bar"]).compare("bar")
+    assert not result.success
+    assert result.operation == "not like"
+    assert result.expected == "b*"
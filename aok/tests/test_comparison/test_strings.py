@@ -0,0 +1,34 @@
+import pickle
+import re
+import typing
+
+from pytest import mark
+
+import aok
+
+STRING_SCENARIOS = (
+    (aok.like("* Doe"), "Jane Doe", True),
+    (aok.like("* Doe"), "Jane Dough", False),
+    (aok.like("[a-c]?"), "bz", True),
+    (aok.like_case("Foo*"), "Foo-Bar", True),
+    (aok.like_case("Foo*"), "foo-bar", False),
+    (aok.match("spam.+\\."), "spam is good.", True),
+    (aok.match({"regex": "SPAM", "flags": re.IGNORECASE}), "spam", True),
+    (aok.match({"regex": "spam"}), "ham", False),
+    (aok.like("*"), 12, False),
+    (aok.match("1"), 1, False),
+)
+
+
+@mark.parametrize("comparator, observed, success", STRING_SCENARIOS)
+def test_strings(comparator: aok.Like, observed: typing.Any, success: bool):
+    """Should compare the observed value against the compiled pattern."""
+    assert comparator.compare(observed).success == success
+    assert comparator.check(observed) == success
+    assert pickle.loads(pickle.dumps(comparator)).check(observed) == success
+
+
+def test_compiled_pattern():
+    """Should expose the compiled pattern for reuse."""
+    assert aok.like_case("a*").pattern.match("abc")
+    assert aok.match("a+b").pattern.pattern == "a+b"
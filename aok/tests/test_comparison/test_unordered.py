@@ -0,0 +1,106 @@
+import itertools
+import pickle
+import random
+import time
+import typing
+
+import yaml
+from pytest import mark
+
+import aok
+
+UNORDERED_SCENARIOS: typing.Tuple[typing.Tuple[typing.Any, ...], ...] = (
+    ([1, 2, 3], [3, 1, 2], True),
+    ([1, 1, 2], [1, 2, 2], False),
+    (["1", "x"], [1, "x"], True),
+    ([{"a": 1}, {"a": [2]}], ({"a": [2]}, {"a": 1}), True),
+    ([aok.greater(0), aok.greater(5)], [6, 1], True),
+    ([aok.greater(5), 1], [1, 2], False),
+    ([aok.anything(), {"a": aok.not_null()}], [{"a": 1}, None], True),
+    ([], None, True),
+    ([1], [1, 1], False),
+    ([1], {"a": 1}, False),
+)
+
+
+@mark.parametrize("expected, observed, success", UNORDERED_SCENARIOS)
+def test_unordered(
+    expected: typing.List[typing.Any], observed: typing.Any, success: bool
+):
+    """Should match the elements regardless of their order."""
+    comparator = aok.unordered(expected)
+    assert comparator.compare(observed).success == success
+    assert comparator.check(observed) == success
+    assert comparator.compile().check(observed) == success
+    assert pickle.loads(pickle.dumps(comparator)).check(observed) == success
+
+
+def test_unordered_unmatched():
+    """Should report the expected and observed elements that were not matched."""
+    result = aok.unordered([1, aok.greater(5), {"a": 1}]).compare([{"a": 2}, 1, 3])
+    assert not result.success
+    assert result.failed_keys() == {
+        "expected_1",
+        "expected_2",
+        "observed_0",
+        "observed_2",
+    }
+    assert result.children["observed_2"].observed == 3
+    assert result.children["expected_2"].expected == {"a": 1}
+
+
+PERMUTED_SCENARIOS: typing.Tuple[typing.Tuple[typing.Any, ...], ...] = (
+    (["1", aok.like("1")], [1, "1"], True),
+    ([{"a": "1"}, {"a": aok.like("1")}], [{"a": 1}, {"a": "1"}], True),
+    ([1, "1", aok.greater(0)], [1, 2, "1"], True),
+    (["1", aok.like("1"), 2], [1, "1", "x"], False),
+)
+
+
+@mark.parametrize("expected, observed, success", PERMUTED_SCENARIOS)
+def test_unordered_permutations(
+    expected: typing.List[typing.Any], observed: typing.List[typing.Any], success: bool
+):
+    """Should match mixed literals and comparators whatever the element order."""
+    for ordering in itertools.permutations(expected):
+        comparator = aok.unordered(list(ordering))
+        for permuted in itertools.permutations(observed):
+            assert comparator.check(list(permuted)) == success
+            assert comparator.compare(list(permuted)).success == success
+            assert comparator.compile().check(list(permuted)) == success
+
+
+def test_unordered_subset():
+    """Should compare nested dictionaries as subsets in subset mode."""
+    comparator = aok.unordered([{"a": 1}, {"a": 2}])
+    observed = [{"a": 2, "b": 0}, {"a": 1, "b": 0}]
+    assert not comparator.check(observed)
+    assert comparator.check(observed, subset=True)
+
+
+def test_unordered_large():
+    """Should match large lists of plain data by hashing them."""
+    expected = list(range(20000)) + [{"id": i, "tags": [i]} for i in range(20000)]
+    observed = list(expected)
+    random.Random(1).shuffle(observed)
+
+    comparator = aok.unordered(expected).compile()
+    assert comparator.check(observed)
+    observed[0] = "extra"
+    assert len(comparator.compare(observed).failed_keys()) == 2
+
+
+def test_unordered_large_disjoint():
+    """Should only match unmatched scalars against the elements they hash with."""
+    comparator = aok.unordered(list(range(10000)))
+    start = time.perf_counter()
+    result = comparator.compare(list(range(10000, 20000)))
+    assert time.perf_counter() - start < 2
+    assert len(result.failed_keys()) == 20000
+
+
+def test_unordered_yaml():
+    """Should load the unordered comparator from yaml."""
+    loaded = yaml.full_load("!aok\nitems: !aok.unordered [2, 1, !aok.less 0]")
+    assert loaded.compare({"items": [-1, 1, 2]}).success
+    assert not loaded.compare({"items": [-1, 1, 3]}).success
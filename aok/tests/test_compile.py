@@ -0,0 +1,133 @@
+import typing
+
+from pytest import mark
+
+import aok
+
+CAST_SCENARIOS = (
+    (aok.equals("12"), 12, True),
+    (aok.equals("12"), 12.0, True),
+    (aok.equals("12"), "12", True),
+    (aok.equals("12.5"), 12, False),
+    (aok.equals(12), 12, True),
+    (aok.greater("3"), 4, True),
+    (aok.less_or_equal("3.5"), 3.5, True),
+    (aok.Between.construct("1", "3"), 2, True),
+    (aok.Between.construct("1", "3"), 4, False),
+)
+
+
+@mark.parametrize("comparator, observed, success", CAST_SCENARIOS)
+def test_compiled_casts(
+    comparator: aok.Equals,
+    observed: typing.Any,
+    success: bool,
+):
+    """Should cast the compiled expected values in the same way as uncompiled."""
+    assert comparator.compare(observed).success == success
+    assert comparator.compile().compare(observed).success == success
+
+
+def test_compile_okay():
+    """Should compile the nested expectations into comparators once."""
+    ok = aok.Okay(
+        {
+            "a": {"b": [1, aok.greater(2)], "c": aok.one_of.construct(["x", {"y": 1}])},
+            "d": "hello",
+        }
+    )
+    compiled = ok.compile()
+
+    assert isinstance(compiled, aok.Okay)
+    assert compiled is not ok
+    assert compiled.value is ok.value
+
+    observed = {"a": {"b": [1, 3], "c": {"y": 1}}, "d": "hello"}
+    compiled.assert_all(observed)
+    compiled.assert_all(observed)
+    compiled.assert_subset({**observed, "e": 12})
+
+    result = compiled.compare({"a": {"b": [1, 2], "c": "z"}, "d": "hello", "e": 1})
+    assert not result.success
+    assert result.failed_keys() == {"a.b.index_1", "a.c", "e"}
+
+
+def test_compile_okay_list():
+    """Should compile the nested expectations of a root list."""
+    ok = aok.OkayList([1, {"a": aok.like("b*")}, (1, 2)]).compile()
+
+    assert isinstance(ok, aok.OkayList)
+    ok.assert_all([1, {"a": "bar"}, (1, 2)])
+    assert ok.compare([1, {"a": "car"}, (1, 3)]).failed_keys() == {
+        "index_1.a",
+        "index_2.index_1",
+    }
+
+
+LITERAL_SCENARIOS: typing.Tuple[typing.Tuple[typing.Any, ...], ...] = (
+    ({"a": 1, "b": [1, "x"]}, {"a": 1, "b": [1, "x"]}, False, True),
+    ({"a": 1, "b": [1, "x"]}, {"a": 1, "b": (1, "x")}, False, True),
+    ({"a": "12", "b": ["2.5"]}, {"a": 12, "b": [2.5]}, False, True),
+    ({"a": 1, "b": [1, "x"]}, {"a": 1, "b": [1, "y"]}, False, False),
+    ({"a": None}, {}, False, True),
+    ({"a": 1}, {"a": 1, "b": None}, False, True),
+    ({"a": 1}, {"a": 1, "b": 2}, False, False),
+    ({"a": 1}, {"a": 1, "b": 2}, True, True),
+    ({"a": {"b": 1}}, {"a": {"b": 1, "c": 2}}, True, True),
+    ({"a": {"b": 1}}, {"a": {"b": 1, "c": 2}}, False, False),
+    ({"a": [1]}, {"a": {"b": 1}}, False, False),
+)
+
+
+@mark.parametrize("expected, observed, subset, success", LITERAL_SCENARIOS)
+def test_compiled_literals(
+    expected: typing.Dict[str, typing.Any],
+    observed: typing.Dict[str, typing.Any],
+    subset: bool,
+    success: bool,
+):
+    """Should compare literal expectations natively with the same results."""
+    compiled = aok.Okay(expected).compile()
+    assert compiled._literal
+
+    result = compiled.compare(observed, subset=subset)
+    assert result.success == success
+    assert compiled.check(observed, subset=subset) == success
+    assert (
+        result.failed_keys()
+        == aok.Okay(expected).compare(observed, subset).failed_keys()
+    )
+    if success and observed == expected:
+        assert not result.children
+
+
+def test_compiled_literals_mixed():
+    """Should only compare the literal subtrees of expectations natively."""
+    compiled = aok.Okay({"a": aok.greater(1), "b": {"c": [1, 2]}}).compile()
+    assert not compiled._literal
+    assert compiled._plan is not None
+    assert dict(compiled._plan)["b"]._literal
+    assert not aok.Okay({"a": aok.json_dict({"b": 1})}).compile()._literal
+
+    result = compiled.compare({"a": 2, "b": {"c": [1, 2]}})
+    assert result.success
+    assert not result.children["b"].children
+    assert compiled.compare({"a": 2, "b": {"c": [1, 3]}}).failed_keys() == {
+        "b.c.index_1"
+    }
+
+
+class _Raising:
+    """Value that raises errors when compared for equality."""
+
+    def __eq__(self, other: typing.Any) -> bool:
+        raise ValueError("Cannot compare.")
+
+
+def test_compiled_literals_errors():
+    """Should fall back to the element-wise comparison when equality fails."""
+    compiled = aok.Okay({"a": 1, "b": [2]}).compile()
+    result = compiled.compare({"a": _Raising(), "b": [2]})
+    assert result.failed_keys() == {"a"}
+    assert isinstance(result.children["a"].error, ValueError)
+    assert not compiled.check({"a": 1, "b": [_Raising()]})
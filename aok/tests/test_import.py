@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+import pytest
+
+import aok
+
+#: Modules that are slow to import and must only be imported on first use.
+DEFERRED = (
+    "aok._caching",
+    "aok._json_stream",
+    "aok.parallel",
+    "concurrent.futures",
+    "fnmatch",
+    "hashlib",
+    "importlib.metadata",
+    "orjson",
+    "pickle",
+    "pprint",
+    "tempfile",
+    "toml",
+)
+
+
+def test_import_defers_modules():
+    """Should not import the deferred modules when aok is imported."""
+    script = (
+        "import sys, aok\n"
+        f"print(','.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_attributes():
+    """Should resolve the lazy module attributes on first access."""
+    assert isinstance(aok.__version__, str)
+    assert aok.__version__ == aok.__dict__["__version__"]
+    assert callable(aok.parallel.validate)
+
+
+def test_unknown_attribute():
+    """Should raise an attribute error for unknown module attributes."""
+    with pytest.raises(AttributeError, match="unknown"):
+        getattr(aok, "unknown")
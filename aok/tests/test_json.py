@@ -0,0 +1,89 @@
+import json
+import typing
+
+import pytest
+
+import aok
+from aok import _json
+
+
+@pytest.fixture(name="decoded")
+def decoded_fixture() -> typing.Iterator[typing.List[typing.Any]]:
+    """Set a decoder that records the values it decodes during a test."""
+    decoded: typing.List[typing.Any] = []
+
+    def _decoder(observed: _json.Serialized) -> typing.Any:
+        decoded.append(observed)
+        return _json._standard_loads(observed)
+
+    aok.set_json_decoder(_decoder)
+    yield decoded
+    aok.set_json_decoder()
+
+
+@pytest.mark.parametrize("wrap", [str, bytes, bytearray, memoryview])
+def test_json_dict_binary(wrap: typing.Callable):
+    """Should compare JSON-serialized values without first converting to str."""
+    serialized = '{"a": 1, "b": [1, 2]}'
+    observed = serialized if wrap is str else wrap(serialized.encode())
+
+    assert aok.json_dict({"a": 1, "b": [1, 2]}).compare(observed).success
+    assert aok.json_dict({"a": 1}).check(observed, subset=True)
+    assert not aok.json_dict({"a": 2}).check(observed, subset=True)
+    serialized_list = wrap(b"[1, 2]") if wrap is not str else "[1, 2]"
+    assert aok.json_list([1, 2]).compare(serialized_list).success
+    serialized_list = wrap(b"[3]") if wrap is not str else "[3]"
+    assert not aok.json_list([1, 2]).compare(serialized_list).success
+
+
+def test_json_dict_invalid():
+    """Should fail values that are not valid JSON dictionaries."""
+    assert aok.json_dict({}).compare(b"").success
+    assert not aok.json_dict({}).compare(b"\xff").success
+    assert not aok.json_dict({}).compare(memoryview(b"[]")).success
+    assert not aok.json_dict({"a": 1}).check("{nope}")
+
+
+def test_default_decoder_fallback():
+    """Should decode values the fast decoder rejects the same as the standard one."""
+    observed = '{"a": NaN, "b": 123456789012345678901234567890}'
+    parsed = _json._default_decoder()(observed)
+    assert parsed["b"] == 123456789012345678901234567890
+    assert parsed["a"] != parsed["a"]
+
+
+def test_decode_once(decoded: typing.List[typing.Any]):
+    """Should only decode the same immutable value once for several comparators."""
+    observed = json.dumps({"kind": "c", "value": 3})
+    ok = aok.Okay(
+        {
+            "payload": aok.one_of(
+                {
+                    "options": [
+                        aok.json_dict({"kind": "a"}),
+                        aok.json_dict({"kind": "b"}),
+                        aok.json_dict({"kind": "c", "value": 3}),
+                    ]
+                }
+            )
+        }
+    )
+
+    assert ok.compare({"payload": observed}).success
+    assert decoded == [observed]
+
+    mutable = bytearray(observed.encode())
+    assert ok.compare({"payload": mutable}).success
+    assert len(decoded) > 3
+
+
+def test_decode_once_released(decoded: typing.List[typing.Any]):
+    """Should only share decoded values within a single comparison."""
+    observed = json.dumps({"kind": "a"})
+    one_of = aok.one_of.construct([aok.json_dict({"kind": "b"}), aok.json_dict({})])
+
+    assert one_of.check(observed, subset=True)
+    assert getattr(_json._cache, "entry", None) is None
+    assert aok.json_dict({"kind": "a"}).check(observed)
+    assert aok.json_dict({"kind": "a"}).check(observed)
+    assert decoded == [observed] * 3
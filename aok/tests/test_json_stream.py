@@ -0,0 +1,138 @@
+import io
+import json
+import pathlib
+import typing
+
+import pytest
+
+import aok
+from aok import _json_stream
+
+DOCUMENT = {
+    "id": 42,
+    "name": 'René "quoted" \\ value',
+    "scores": [1.5, -2e3, 12345678901234567890],
+    "flags": {"active": True, "deleted": False, "parent": None},
+    "payload": {"items": [{"a": [1, 2, {"b": "c"}]}] * 20},
+}
+
+
+class _Tracking(io.StringIO):
+    """Text stream that records the largest read size requested."""
+
+    largest = 0
+
+    def read(self, size: typing.Optional[int] = -1) -> str:
+        """Read from the stream while tracking the size."""
+        self.largest = max(self.largest, size or 0)
+        return super().read(size)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 16])
+def test_tokens_build(chunk_size: int):
+    """Should build the same values as the standard library across chunks."""
+    for indent in (None, 2):
+        text = json.dumps(DOCUMENT, indent=indent, ensure_ascii=indent is None)
+        tokens = _json_stream._Tokens(io.StringIO(text), chunk_size)
+        assert tokens.build(tokens.next()) == DOCUMENT
+        tokens.end()
+
+
+@pytest.mark.parametrize("subset", [True, False])
+def test_compare_json_stream(subset: bool):
+    """Should produce the same differences as comparing the loaded document."""
+    ok = aok.Okay(
+        {
+            "id": aok.greater(40),
+            "name": aok.like("Ren*"),
+            "scores": [1.5, aok.less(0), aok.anything()],
+            "flags": {"active": True, "deleted": True},
+        }
+    )
+    text = json.dumps(DOCUMENT)
+
+    for expected in (ok, ok.compile()):
+        streamed = _json_stream.compare_json_stream(
+            expected, io.StringIO(text), subset=subset
+        )
+        loaded = expected.compare(DOCUMENT, subset=subset)
+        assert not streamed.success
+        assert streamed.to_diff_data() == loaded.to_diff_data()
+        assert streamed.failed_keys() == loaded.failed_keys()
+
+
+def test_compare_json_stream_binary(tmp_path: pathlib.Path):
+    """Should read documents from binary streams and file paths."""
+    path = tmp_path.joinpath("document.json")
+    path.write_text(json.dumps([DOCUMENT, {}]), encoding="utf-8")
+    ok = aok.OkayList([{"id": 42}, {}])
+
+    assert ok.compare_json_stream(path, subset=True).success
+    with open(path, "rb") as stream:
+        assert ok.compare_json_stream(stream, subset=True).success
+        assert not stream.closed
+    assert not ok.compare_json_stream(str(path)).success
+
+
+def test_compare_json_stream_lengths():
+    """Should fail lists with different lengths without building the extras."""
+    ok = aok.Okay({"values": [1, 2]})
+    result = ok.compare_json_stream(io.StringIO('{"values": [1, 2, {"a": []}]}'))
+    assert result.children["values"].operation == "list_length"
+    assert result.children["values"].observed == 3
+    assert not ok.compare_json_stream(io.StringIO('{"values": [1]}')).success
+
+
+def test_compare_json_stream_type_mismatch():
+    """Should compare values that don't match the container against the comparator."""
+    ok = aok.Okay({"values": [1], "missing": None, "nested": {"a": 1}})
+    result = ok.compare_json_stream(io.StringIO('{"values": {"a": 1}, "nested": 1}'))
+    assert result.failed_keys() == {"values", "nested"}
+    assert result.children["values"].operation == "list_type"
+    assert result.children["nested"].operation == "dict_type"
+
+
+def test_compare_json_stream_skips(monkeypatch: pytest.MonkeyPatch):
+    """Should skip the values of unexpected keys in subset mode without building."""
+    built = []
+    original = _json_stream._Tokens.build
+
+    def _build(tokens: _json_stream._Tokens, token: _json_stream.Token):
+        value = original(tokens, token)
+        built.append(value)
+        return value
+
+    monkeypatch.setattr(_json_stream._Tokens, "build", _build)
+    ok = aok.Okay({"flags": {"active": True}})
+    stream = _Tracking(json.dumps(DOCUMENT))
+    result = _json_stream.compare_json_stream(ok, stream, True, chunk_size=16)
+
+    assert result.success
+    assert built == [True]
+    assert stream.largest < len(stream.getvalue())
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"a": 1,', '{"a": 1} {}', '{"a": [1,]}', '{"a" 1}', '{"a": "b', '{"a": tru}'],
+)
+def test_compare_json_stream_malformed(text: str):
+    """Should fail with the decoding error for malformed documents."""
+    result = aok.Okay({"a": aok.anything()}).compare_json_stream(io.StringIO(text))
+    assert not result.success
+    assert result.operation == "json_stream"
+    assert isinstance(result.error, ValueError)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_iter_json_array(chunk_size: int):
+    """Should iterate over the elements of the array one at a time."""
+    stream = io.StringIO(json.dumps([DOCUMENT, [1, 2], "text", None]))
+    elements = _json_stream.iter_json_array(stream, chunk_size)
+    assert next(elements) == DOCUMENT
+    assert list(elements) == [[1, 2], "text", None]
+
+    with pytest.raises(ValueError, match="Expecting '\\[': char 1"):
+        list(_json_stream.iter_json_array(io.StringIO('{"a": 1}')))
+    with pytest.raises(ValueError, match="Extra data: char 5"):
+        list(_json_stream.iter_json_array(io.StringIO("[1] [2]"), chunk_size))
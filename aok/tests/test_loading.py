@@ -0,0 +1,99 @@
+import io
+import os
+import pathlib
+import pickle
+import time
+
+import pytest
+import yaml
+from pytest import mark
+
+import aok
+from aok import _caching
+from aok import _loading
+
+directory = pathlib.Path(__file__).parent.joinpath("test_scenarios", "scenarios")
+scenario_paths = [p.name for p in directory.iterdir() if p.name.endswith(".yaml")]
+
+
+@mark.parametrize("loader", _loading.LOADERS)
+@mark.parametrize("filename", scenario_paths)
+def test_loaders(filename: str, loader: type):
+    """Should construct the aok comparators with each of the loaders."""
+    scenario = yaml.load(directory.joinpath(filename).read_text(), Loader=loader)
+    result = scenario["comparator"].compare(
+        scenario["observed"],
+        subset=scenario.get("subset", False),
+    )
+    assert result.success == scenario["expected"]["success"]
+
+
+@mark.parametrize("safe", [False, True])
+def test_load(safe: bool):
+    """Should load the file from a path or a stream."""
+    path = directory.joinpath("valid_exact.yaml")
+    from_path = aok.load(path, safe=safe)
+    from_stream = aok.load(io.StringIO(path.read_text()), safe=safe)
+
+    for scenario in (from_path, from_stream):
+        assert isinstance(scenario["comparator"], aok.Okay)
+        assert scenario["comparator"].check(scenario["observed"])
+
+
+def test_load_safe():
+    """Should not construct arbitrary Python objects with the safe loader."""
+    source = "value: !!python/tuple [1, 2]"
+    assert aok.load(io.StringIO(source)) == {"value": (1, 2)}
+    with pytest.raises(yaml.constructor.ConstructorError):
+        aok.load(io.StringIO(source), safe=True)
+
+
+def test_load_cached(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """Should load the file from the cache once it has been loaded."""
+    cache = tmp_path.joinpath("cache")
+    path = directory.joinpath("valid_exact.yaml")
+
+    scenario = aok.load_cached(path, directory=cache)
+    assert len(list(cache.glob("*.pickle"))) == 1
+    assert scenario["comparator"].check(scenario["observed"])
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("Should not parse the YAML file again.")
+
+    monkeypatch.setattr(_loading, "load", _fail)
+    cached = aok.load_cached(path, directory=cache)
+    assert cached["comparator"].check(cached["observed"])
+    assert cached["comparator"]._plan is not None
+
+
+def test_load_cached_eviction(tmp_path: pathlib.Path):
+    """Should evict the old and least recently used entries."""
+    for index in range(4):
+        entry = tmp_path.joinpath(f"{index}.pickle")
+        entry.write_bytes(b"x" * 100)
+        os.utime(entry, (time.time() - index * 100, time.time() - index * 100))
+
+    _caching._evict(tmp_path, max_age=250, max_size=150)
+    assert [p.name for p in tmp_path.iterdir()] == ["0.pickle"]
+
+
+def test_load_cached_corrupt(tmp_path: pathlib.Path):
+    """Should reload the file when the cache entry cannot be read."""
+    cache = tmp_path.joinpath("cache")
+    path = directory.joinpath("valid_empty.yaml")
+    aok.load_cached(path, directory=cache)
+
+    (entry,) = cache.glob("*.pickle")
+    entry.write_bytes(b"corrupt")
+
+    scenario = aok.load_cached(path, directory=cache)
+    assert scenario["comparator"].check({})
+    assert list(cache.glob("*.pickle")) == [entry]
+    assert pickle.loads(entry.read_bytes())["comparator"].check({})
+
+
+@mark.parametrize("safe", [True, False])
+def test_load_unknown_tag(safe: bool):
+    """Should fail to load aok tags that no comparator is registered for."""
+    with pytest.raises(yaml.constructor.ConstructorError, match="!aok.unknown"):
+        aok.load(io.StringIO("value: !aok.unknown 1"), safe=safe)
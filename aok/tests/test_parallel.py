@@ -0,0 +1,51 @@
+import pathlib
+import pickle
+
+import yaml
+
+import aok
+
+directory = pathlib.Path(__file__).parent.joinpath("test_scenarios", "scenarios")
+
+
+def test_validate():
+    """Should compare records in worker processes and yield failures in order."""
+    ok = aok.Okay({"id": aok.greater_or_equal(0), "name": aok.like("good*")})
+    records = ({"id": i, "name": "bad" if i % 7 == 0 else "good"} for i in range(100))
+
+    results = aok.parallel.validate(ok, records, workers=2, chunksize=8)
+    failures = list(results)
+
+    assert [index for index, _ in failures] == list(range(0, 100, 7))
+    assert all(r.failed_keys() == {"name"} for _, r in failures)
+    assert (results.passed, results.failed) == (85, 15)
+
+
+def test_validate_keep_none():
+    """Should only count the results when none are kept."""
+    ok = aok.OkayList([aok.not_null()])
+    results = aok.parallel.validate(ok, [[1]] * 10, workers=2, keep="none")
+    assert list(results) == []
+    assert results.passed == 10
+
+
+def test_validate_retain():
+    """Should prune the results within the worker processes."""
+    ok = aok.Okay({"id": aok.greater_or_equal(0), "name": "good"})
+    records = [{"id": 1, "name": "bad"}] * 4
+    results = aok.parallel.validate(ok, records, workers=2, retain="leaves")
+    assert all(r.observed is None for _, r in results)
+    assert results.failed == 4
+
+
+def test_pickle_comparators():
+    """Should pickle the YAML-loaded comparators with the same results."""
+    for path in directory.iterdir():
+        scenario = yaml.full_load(path.read_text())
+        for comparator in (scenario["comparator"], scenario["comparator"].compile()):
+            restored = pickle.loads(pickle.dumps(comparator))
+            observed = scenario["observed"]
+            subset = scenario.get("subset", False)
+            assert restored.check(observed, subset) == comparator.check(
+                observed, subset
+            )
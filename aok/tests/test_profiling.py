@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+import aok
+from aok import _definitions
+
+
+def test_profile():
+    """Should accumulate the comparisons by operation and by path."""
+    ok = aok.Okay(
+        {
+            "a": [1, {"b": aok.greater(1)}],
+            "c": aok.one_of({"options": [1, {"x": 1}]}),
+        }
+    )
+    observed = {"a": [1, {"b": 0}], "c": {"x": 1}}
+
+    with aok.profile() as stats:
+        ok.compare(observed)
+        ok.compare(observed)
+
+    assert stats.operations["okay"].calls == 2
+    assert stats.operations["greater"].failures == 2
+    assert stats.operations["one_of"].failures == 0
+    assert set(stats.paths) == {
+        "(root)",
+        "a",
+        "a.index_0",
+        "a.index_1",
+        "a.index_1.b",
+        "c",
+    }
+    # The one_of checks the literal and dictionary options to find the matching
+    # one, which it then compares, for 4 calls at its path for each comparison.
+    assert stats.paths["c"].calls == 8
+
+    root = stats.paths["(root)"]
+    assert root.cumulative >= root.self > 0
+    assert root.cumulative >= sum(t.self for t in stats.paths.values()) - 1e-9
+
+
+def test_profile_output():
+    """Should create sortable tables and JSON dumps of the statistics."""
+    with aok.profile() as stats:
+        aok.Okay({"a": 1, "b": [1, 2]}).compare({"a": 2, "b": [1, 2]})
+
+    lines = stats.table(by="path", sort="failures").splitlines()
+    assert lines[0].split()[:3] == ["path", "calls", "failures"]
+    assert lines[1].split()[:3] == ["(root)", "1", "1"]
+    assert len(stats.table(limit=2).splitlines()) == 3
+
+    dumped = json.loads(stats.to_json())
+    assert dumped["operations"]["list"]["calls"] == 1
+    assert dumped["paths"]["b.index_1"]["failures"] == 0
+
+    with pytest.raises(ValueError):
+        stats.table(sort="unknown")
+
+
+def test_profile_checks():
+    """Should accumulate the checks made when validating records."""
+    ok = aok.Okay({"a": aok.greater(0), "b": [1, aok.not_null()]})
+    records = [{"a": 1, "b": [1, 2]}, {"a": 2, "b": [1, 3]}, {"a": 0, "b": [1, 2]}]
+
+    with aok.profile() as stats:
+        results = ok.compare_many(records).consume()
+        ok.assert_all({"a": 3, "b": [1, 4]})
+
+    assert (results.passed, results.failed) == (2, 1)
+    assert stats.operations["greater"].calls == 5
+    assert stats.operations["greater"].failures == 2
+    assert stats.operations["not_null"].calls >= 3
+    assert stats.operations["okay"].failures == 2
+
+
+def test_profile_restores():
+    """Should only replace the methods while profiling is active."""
+    original = _definitions.Comparator.compare
+    original_check = _definitions.Comparator.check
+    with aok.profile():
+        assert _definitions.Comparator.compare is not original
+        assert _definitions.Comparator.check is not original_check
+        with pytest.raises(RuntimeError):
+            with aok.profile():
+                pass
+        result = aok.Okay({"a": [1]}).compare({"a": [2]}, retain="none")
+        assert result.get("a").observed is None
+    assert _definitions.Comparator.compare is original
+    assert _definitions.Comparator.check is original_check
+    assert aok.Okay.compare is aok.Dict.compare
@@ -0,0 +1,53 @@
+import typing
+
+import pytest
+
+import aok
+
+
+def _records(count: int) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    """Generate records where every third one fails the expectations."""
+    for index in range(count):
+        yield {"id": index, "name": "bad" if index % 3 == 0 else "good"}
+
+
+def test_compare_many():
+    """Should lazily yield failing records with their indexes and count results."""
+    ok = aok.Okay({"id": aok.greater_or_equal(0), "name": "good"}).compile()
+    results = ok.compare_many(_records(10))
+
+    index, first = next(results)
+    assert index == 0
+    assert first.failed_keys() == {"name"}
+    assert results.total == 1
+
+    indexes = [index for index, _ in results]
+    assert indexes == [3, 6, 9]
+    assert (results.passed, results.failed, results.total) == (6, 4, 10)
+    assert not results.success
+
+
+def test_compare_many_keep():
+    """Should yield the results according to the keep option."""
+    ok = aok.OkayList([aok.not_null()])
+    records = [[1], [None], [2]]
+
+    assert [i for i, _ in ok.compare_many(records, keep="all")] == [0, 1, 2]
+    results = ok.compare_many(records, keep="none").consume()
+    assert (results.passed, results.failed) == (2, 1)
+    assert list(ok.compare_many(iter([[1]]), subset=True)) == []
+
+    with pytest.raises(ValueError):
+        ok.compare_many(records, keep="some")
+
+
+def test_compare_many_retain():
+    """Should prune the results kept according to the retain option."""
+    ok = aok.Okay({"id": aok.greater_or_equal(0), "name": "good"}).compile()
+    results = ok.compare_many(_records(4), keep="all", retain="none")
+
+    assert [list(r.children) for _, r in results] == [["name"], [], [], ["name"]]
+    assert all(r.observed is None for _, r in results)
+
+    with pytest.raises(ValueError):
+        ok.compare_many(_records(4), retain="some")
@@ -0,0 +1,61 @@
+import pytest
+
+import aok
+
+OK = aok.Okay(
+    {
+        "a": {"b": [1, 2, {"c": "x" * 1000}]},
+        "n": aok.greater(5),
+        "j": aok.json_dict({"a": 1}),
+    }
+)
+OBSERVED = {"a": {"b": [1, 3, {"c": "y" * 1000}]}, "n": 1, "j": "{bad"}
+
+
+def test_report():
+    """Should report the failures in path order with truncated values."""
+    lines = list(OK.compare(OBSERVED).iter_report(max_value_chars=20))
+    paths = [line for line in lines if not line.startswith(" ")]
+    assert paths == ["a.b.index_1:", "a.b.index_2.c:", "n:", "j:"]
+    assert "  OBSERVED: 'yyyyyyy...yyyyyyyy'" in lines
+    assert lines[-1].startswith("  ERROR: Expecting property")
+    assert all(len(line) < 60 for line in lines)
+
+
+def test_report_limits():
+    """Should stop reporting at the maximum number of failures and depth."""
+    result = aok.each({"id": 1}).compare([{"id": i} for i in range(1000)])
+    lines = result.to_report(max_failures=3).splitlines()
+    assert lines[0] == "index_0.id:"
+    assert lines[-1] == "... further failures not shown after the first 3"
+    assert len(lines) == 13
+
+    lines = OK.compare(OBSERVED).to_report(max_depth=1).splitlines()
+    assert lines[:3] == [
+        "a:",
+        "  OPERATION: dict_comparison",
+        "  NESTED: failures below a depth of 1 not shown",
+    ]
+
+
+def test_report_root():
+    """Should report failures without children at the root."""
+    assert aok.equals(1).compare(2).to_report() == (
+        "(root):\n  OPERATION: equals\n  EXPECTED: 1\n  OBSERVED: 2"
+    )
+    assert aok.equals(1).compare(1).to_report() is None
+
+    report = aok.equals(list(range(100))).compare(0).to_report(max_value_chars=20)
+    assert "  EXPECTED: [0, 1, 2, 3, 4, 5, 6...[truncated]" in report
+
+
+def test_assert_report():
+    """Should use the bounded report for assertion messages."""
+    observed = [{"id": i, "value": "z" * 10000} for i in range(500)]
+    ok = aok.OkayList([{"id": -1, "value": ""}] * 500)
+
+    with pytest.raises(AssertionError) as error:
+        ok.assert_all(observed)
+    message = str(error.value)
+    assert message.startswith("One or more exact differences were found\n  index_0.id:")
+    assert len(message) < 20000
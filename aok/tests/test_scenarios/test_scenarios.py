@@ -25,3 +25,48 @@ def test_scenario(filename: str):
     expectations = scenario["expected"]
     assert result.success == expectations["success"], result.to_diff_info()
     assert result.failed_keys() == set(expectations.get("failed_keys", []))
+
+
+@mark.parametrize("filename", scenario_paths)
+def test_scenario_compiled(filename: str):
+    """Test the expected scenario against the compiled aok validation."""
+    path = directory.joinpath(filename)
+    scenario = yaml.full_load(path.read_text())
+
+    list_comparator: aok.OkayRoot = scenario["comparator"].compile()
+    result = list_comparator.compare(
+        scenario["observed"],
+        subset=scenario.get("subset", False),
+    )
+
+    expectations = scenario["expected"]
+    assert result.success == expectations["success"], result.to_diff_info()
+    assert result.failed_keys() == set(expectations.get("failed_keys", []))
+
+
+@mark.parametrize("compiled", [False, True])
+@mark.parametrize("filename", scenario_paths)
+def test_scenario_check(filename: str, compiled: bool):
+    """Test the expected scenario success against the fail-fast aok validation."""
+    path = directory.joinpath(filename)
+    scenario = yaml.full_load(path.read_text())
+
+    list_comparator: aok.OkayRoot = scenario["comparator"]
+    if compiled:
+        list_comparator = list_comparator.compile()
+
+    success = list_comparator.check(
+        scenario["observed"],
+        subset=scenario.get("subset", False),
+    )
+    assert success == scenario["expected"]["success"]
+
+
+@mark.parametrize("filename", scenario_paths)
+def test_scenario_codegen(filename: str):
+    """Test the expected scenario success against the generated validator."""
+    path = directory.joinpath(filename)
+    scenario = yaml.full_load(path.read_text())
+
+    validate = aok.codegen(scenario["comparator"], subset=scenario.get("subset", False))
+    assert validate(scenario["observed"]) == scenario["expected"]["success"]
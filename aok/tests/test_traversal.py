@@ -0,0 +1,73 @@
+import sys
+import typing
+
+import pytest
+
+import aok
+from aok import _operations
+
+DEPTH = sys.getrecursionlimit() * 5
+
+
+def _nested(depth: int, leaf: typing.Any) -> typing.Dict[str, typing.Any]:
+    """Create dictionaries, lists and tuples nested to the depth around the leaf."""
+    value = leaf
+    for index in range(depth):
+        value = {"child": [value, (index,)], "index": index}
+    return value
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_deeply_nested(compiled: bool):
+    """Should compare values nested far deeper than the recursion limit."""
+    ok: typing.Any = aok.Okay(_nested(DEPTH, aok.greater(0)))
+    if compiled:
+        ok = ok.compile()
+
+    assert ok.check(_nested(DEPTH, 1))
+    assert not ok.check(_nested(DEPTH, 0))
+    assert ok.compare(_nested(DEPTH, 1)).success
+
+    result = ok.compare(_nested(DEPTH, 0))
+    assert not result.success
+    keys, leaf = next(result.iter_failures())
+    assert len(keys) == 2 * DEPTH
+    assert leaf.operation == "greater"
+    assert result.failed_keys() == {".".join(str(k) for k in keys)}
+
+    data: typing.Any = result.to_diff_data()
+    for key in keys:
+        data = data[key]
+    assert data["OBSERVED"] == 0
+    assert result.prune("none").to_report()
+
+
+def test_deeply_nested_literals():
+    """Should only compare literal subtrees natively up to the maximum depth."""
+    ok = aok.Okay(_nested(DEPTH, 1)).compile()
+    assert not ok._literal
+    assert ok.compare(_nested(DEPTH, 1)).success
+    assert ok.compare(_nested(DEPTH, 2)).failed_keys()
+
+    # Each level nests a list in a dictionary around the scalar equality.
+    levels = _operations.MAX_LITERAL_DEPTH // 2
+    assert aok.Okay(_nested(levels - 1, 1)).compile()._literal == 2 * levels
+    assert not aok.Okay(_nested(levels, 1)).compile()._literal
+
+
+def test_overridden_methods():
+    """Should call the methods of containers overriding those of the traversal."""
+
+    class Counted(aok.Dict):
+        calls = 0
+
+        def compare(
+            self, observed: typing.Any, subset: bool = False, retain: str = "all"
+        ):
+            Counted.calls += 1
+            return super(Counted, self).compare(observed, subset, retain)
+
+    ok = aok.Okay({"a": Counted({"b": [Counted({"c": 1})]})}).compile()
+    result = ok.compare({"a": {"b": [{"c": 2}]}})
+    assert Counted.calls == 2
+    assert result.failed_keys() == {"a.b.index_0.c"}
@@ -0,0 +1,7 @@
+"""
+Benchmark suite for the hot paths of the aok library.
+
+Run the suite with `python -m benchmarks` from the root of the repository. The
+results can be saved as JSON with `--output` and compared against a previous run
+with `--compare` to judge the effect of a change.
+"""
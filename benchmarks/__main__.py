@@ -0,0 +1,127 @@
+"""Command line entrypoint that runs the benchmark suite."""
+
+import argparse
+import fnmatch
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import timeit
+import typing
+
+import aok
+from benchmarks import _cases
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    """Create the command line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the hot paths of the aok library.",
+    )
+    parser.add_argument(
+        "cases",
+        nargs="*",
+        default=["*"],
+        help="Names or glob patterns of the cases to run, all of them by default.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of times to time each case, of which the best is reported.",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Factor to scale the size of the generated data by.",
+    )
+    parser.add_argument(
+        "--output",
+        help="Path of a JSON file to save the results to.",
+    )
+    parser.add_argument(
+        "--compare",
+        help="Path of a JSON file of previous results to compare against.",
+    )
+    return parser
+
+
+def run(
+    names: typing.Iterable[str],
+    repeat: int = 5,
+    scale: float = 1.0,
+) -> typing.Dict[str, typing.Any]:
+    """
+    Time each of the benchmark cases.
+
+    :param names:
+        Names of the cases to run.
+    :param repeat:
+        Number of times to time each case.
+    :param scale:
+        Factor to scale the size of the generated data by.
+    :return:
+        The results in a JSON-serializable form, with the environment the cases
+        were run in and the timings of each case in seconds.
+    """
+    results: typing.Dict[str, typing.Any] = {
+        "aok": aok.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "scale": scale,
+        "repeat": repeat,
+        "cases": {},
+    }
+    for name in names:
+        function = _cases.CASES[name](scale)
+        timings = timeit.repeat(function, repeat=repeat, number=1)
+        results["cases"][name] = {
+            "best": min(timings),
+            "median": statistics.median(timings),
+            "timings": timings,
+        }
+    return results
+
+
+def _print_results(
+    results: typing.Dict[str, typing.Any],
+    baseline: typing.Optional[typing.Dict[str, typing.Any]],
+):
+    """Write a table of the results, along with their change from the baseline."""
+    for name, timing in results["cases"].items():
+        line = f"{name:<30} {timing['best'] * 1000:>12.3f} ms"
+        previous = (baseline or {}).get("cases", {}).get(name)
+        if previous:
+            line += f" {timing['best'] / previous['best']:>8.2f}x"
+        print(line)
+
+
+def main(arguments: typing.Optional[typing.List[str]] = None) -> int:
+    """Run the benchmark suite from the command line."""
+    args = _create_parser().parse_args(arguments)
+
+    names = [
+        name
+        for name in _cases.CASES
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in args.cases)
+    ]
+    if not names:
+        print(f"No benchmark cases match: {' '.join(args.cases)}", file=sys.stderr)
+        return 2
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(pathlib.Path(args.compare).read_text())
+
+    results = run(names, repeat=args.repeat, scale=args.scale)
+    _print_results(results, baseline)
+    if args.output:
+        pathlib.Path(args.output).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
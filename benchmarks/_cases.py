@@ -0,0 +1,189 @@
+import functools
+import io
+import pathlib
+import subprocess
+import sys
+import typing
+
+import yaml
+
+import aok
+from benchmarks import _data
+
+#: Setup functions of the benchmark cases by name, which create the data for the
+#: specified scale and return the function to time.
+CASES: typing.Dict[str, typing.Callable[[float], typing.Callable[[], typing.Any]]] = {}
+
+
+def _case(name: str):
+    """Register the decorated setup function as a benchmark case."""
+
+    def _register(setup: typing.Callable[[float], typing.Callable[[], typing.Any]]):
+        CASES[name] = setup
+        return setup
+
+    return _register
+
+
+def _size(count: int, scale: float) -> int:
+    """Scale the size of the generated data, keeping at least one element."""
+    return max(1, int(count * scale))
+
+
+@_case("compare_wide_dict")
+def _compare_wide_dict(scale: float) -> typing.Callable[[], typing.Any]:
+    """Compare a dictionary with 10k keys."""
+    record = _data.wide_record(_size(10000, scale))
+    ok = aok.Okay(dict(record))
+    return lambda: ok.compare(record)
+
+
+@_case("compare_wide_dict_compiled")
+def _compare_wide_dict_compiled(scale: float) -> typing.Callable[[], typing.Any]:
+    """Compare a dictionary with 10k keys using compiled expectations."""
+    record = _data.wide_record(_size(10000, scale))
+    ok = aok.Okay(dict(record)).compile()
+    return lambda: ok.compare(record)
+
+
+@_case("check_wide_dict")
+def _check_wide_dict(scale: float) -> typing.Callable[[], typing.Any]:
+    """Check a dictionary with 10k keys using compiled expectations."""
+    record = _data.wide_record(_size(10000, scale))
+    ok = aok.Okay(dict(record)).compile()
+    return lambda: ok.check(record)
+
+
+@_case("check_wide_dict_codegen")
+def _check_wide_dict_codegen(scale: float) -> typing.Callable[[], typing.Any]:
+    """Check a dictionary with 10k keys using a generated validator."""
+    record = _data.wide_record(_size(10000, scale))
+    return functools.partial(aok.codegen(aok.Okay(dict(record))), record)
+
+
+@_case("compare_deep_dict")
+def _compare_deep_dict(scale: float) -> typing.Callable[[], typing.Any]:
+    """Compare dictionaries nested 1k levels deep."""
+    levels = _size(1000, scale)
+    record = _data.deep_record(levels)
+    ok = aok.Okay(_data.deep_record(levels))
+    return lambda: ok.compare(record)
+
+
+@_case("compare_very_deep_dict")
+def _compare_very_deep_dict(scale: float) -> typing.Callable[[], typing.Any]:
+    """Compare dictionaries nested 100k levels deep, far beyond recursion limits."""
+    levels = _size(100000, scale)
+    record = _data.deep_record(levels)
+    ok = aok.Okay(_data.deep_record(levels))
+    return lambda: ok.compare(record)
+
+
+@_case("compare_long_list")
+def _compare_long_list(scale: float) -> typing.Callable[[], typing.Any]:
+    """Compare a list of 10k records against comparators."""
+    observed = _data.records(_size(10000, scale))
+    ok = aok.OkayList(
+        [
+            {
+                "id": record["id"],
+                "name": aok.not_null(),
+                "score": aok.between({"min": 0, "max": 100}),
+                "active": aok.one_of({"options": [True, False]}),
+                "tags": record["tags"],
+            }
+            for record in observed
+        ]
+    )
+    return lambda: ok.compare(observed)
+
+
+@_case("compare_compact_long_list")
+def _compare_compact_long_list(scale: float) -> typing.Callable[[], typing.Any]:
+    """Compare a list of 10k records against comparators into compact results."""
+    observed = _data.records(_size(10000, scale))
+    ok = aok.OkayList(
+        [
+            {
+                "id": record["id"],
+                "name": aok.not_null(),
+                "score": aok.between({"min": 0, "max": 100}),
+                "active": aok.one_of({"options": [True, False]}),
+                "tags": record["tags"],
+            }
+            for record in observed
+        ]
+    )
+    return lambda: ok.compare_compact(observed)
+
+
+@_case("compare_strings")
+def _compare_strings(scale: float) -> typing.Callable[[], typing.Any]:
+    """Compare 1k values against each of the string pattern comparators."""
+    values = _data.words(_size(1000, scale))
+    record = {f"key_{i}": value for i, value in enumerate(values)}
+    expected: typing.Dict[str, typing.Any] = {}
+    for i, value in enumerate(values):
+        pattern = [aok.like, aok.like_case, aok.match][i % 3]
+        text = f"{value[:3]}*" if pattern is not aok.match else f"{value[:3]}.+"
+        expected[f"key_{i}"] = pattern(text)
+    ok = aok.Okay(expected)
+    return lambda: ok.compare(record)
+
+
+@_case("compare_one_of")
+def _compare_one_of(scale: float) -> typing.Callable[[], typing.Any]:
+    """Compare 1k values against a one_of with 1k options."""
+    options = _data.words(_size(1000, scale), seed=1)
+    comparator = aok.one_of({"options": options})
+    values = options[::-1]
+    record = {f"key_{i}": value for i, value in enumerate(values)}
+    ok = aok.Okay({key: comparator for key in record})
+    return lambda: ok.compare(record)
+
+
+@_case("load_yaml")
+def _load_yaml(scale: float) -> typing.Callable[[], typing.Any]:
+    """Load a YAML expectation file with 1k records of tagged comparators."""
+    lines = ["!aok_list"]
+    for record in _data.records(_size(1000, scale)):
+        lines.append(f"- id: !aok.greater_or_equal {record['id']}")
+        lines.append(f"  name: !aok.like '{record['name'][:4]}*'")
+        lines.append("  score: !aok.between [0, 100]")
+        lines.append("  active: !aok.not_null")
+        lines.append(
+            f"  tags: {yaml.safe_dump(record['tags'], default_flow_style=True)}"
+        )
+    text = "\n".join(lines)
+    return lambda: aok.load(io.StringIO(text))
+
+
+def _failing_result(scale: float) -> typing.Any:
+    """Create a comparison of 1k records that all have failures."""
+    observed = _data.records(_size(1000, scale))
+    ok = aok.OkayList(
+        [{**record, "id": -1, "name": record["name"].upper()} for record in observed]
+    )
+    return ok.compare(observed)
+
+
+@_case("render_diff_info")
+def _render_diff_info(scale: float) -> typing.Callable[[], typing.Any]:
+    """Render the differences of a failure-heavy comparison with to_diff_info."""
+    result = _failing_result(scale)
+    return result.to_diff_info
+
+
+@_case("render_report")
+def _render_report(scale: float) -> typing.Callable[[], typing.Any]:
+    """Render the bounded report of a failure-heavy comparison."""
+    result = _failing_result(scale)
+    return result.to_report
+
+
+@_case("import_aok")
+def _import_aok(scale: float) -> typing.Callable[[], typing.Any]:
+    """Import aok in a fresh interpreter, which includes the interpreter startup."""
+    command = [sys.executable, "-c", "import aok"]
+    root = pathlib.Path(aok.__file__).parent.parent
+    return lambda: subprocess.run(command, cwd=root, check=True)
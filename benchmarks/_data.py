@@ -0,0 +1,59 @@
+import random
+import string
+import typing
+
+#: Seed of the random generators so that every run generates the same data.
+SEED = 20211014
+
+
+def _random(seed: int) -> random.Random:
+    """Create a random generator from the suite seed and the offset specified."""
+    return random.Random(SEED + seed)
+
+
+def word(generator: random.Random, length: int = 8) -> str:
+    """Generate a random lowercase word."""
+    return "".join(generator.choices(string.ascii_lowercase, k=length))
+
+
+def wide_record(keys: int, seed: int = 0) -> typing.Dict[str, typing.Any]:
+    """Generate a flat record with the specified number of scalar values."""
+    generator = _random(seed)
+    values: typing.List[typing.Callable[[], typing.Any]] = [
+        lambda: generator.randint(-1000, 1000),
+        lambda: generator.random(),
+        lambda: word(generator),
+        lambda: generator.random() < 0.5,
+        lambda: None,
+    ]
+    return {f"key_{i}": generator.choice(values)() for i in range(keys)}
+
+
+def deep_record(levels: int, seed: int = 0) -> typing.Dict[str, typing.Any]:
+    """Generate a record that nests dictionaries to the specified depth."""
+    generator = _random(seed)
+    record: typing.Dict[str, typing.Any] = {"value": generator.randint(0, 100)}
+    for _ in range(levels - 1):
+        record = {"child": record, "name": word(generator)}
+    return record
+
+
+def records(count: int, seed: int = 0) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Generate a list of small records like those of a typical API response."""
+    generator = _random(seed)
+    return [
+        {
+            "id": i,
+            "name": word(generator, 12),
+            "score": round(generator.uniform(0, 100), 2),
+            "active": generator.random() < 0.9,
+            "tags": [word(generator, 4) for _ in range(3)],
+        }
+        for i in range(count)
+    ]
+
+
+def words(count: int, length: int = 8, seed: int = 0) -> typing.List[str]:
+    """Generate a list of random words."""
+    generator = _random(seed)
+    return [word(generator, length) for _ in range(count)]